@@ -3,7 +3,12 @@ from http import HTTPStatus
 from fastapi import Request
 from starlette.responses import JSONResponse, Response
 
-from src.application.error import ApplicationError
+from src.application.error import (
+    ApplicationError,
+    ServiceOverloadedError,
+    TooManyQueuedVideosError,
+    UploadOffsetMismatchError,
+)
 from src.domain.__shared.error import DomainError
 from src.domain.__shared.validator import DomainValidationError
 from src.infra.error import InfrastructureError
@@ -78,6 +83,11 @@ def application_exception_handler(_request: Request, exc: Exception) -> Response
     This handler is designed to manage `ApplicationError` exceptions, which
     represent errors specific to the application's domain logic.
     It generates a JSON response with a 400 Bad Request status code and the error message.
+    An `UploadOffsetMismatchError` is answered with 409 Conflict and the committed offset
+    in the `Upload-Offset` header, so the client can resume from it. Requests refused
+    by admission control are answered with 429 Too Many Requests when the user has too
+    much work queued, or 503 Service Unavailable when the service is overloaded, with
+    the time to wait in the `Retry-After` header.
 
     Args:
         _request: The incoming FastAPI request object (unused in this handler).
@@ -89,6 +99,24 @@ def application_exception_handler(_request: Request, exc: Exception) -> Response
     Raises:
         exc: Re-raises any other exception type for further handling.
     """
+    if isinstance(exc, UploadOffsetMismatchError):
+        return JSONResponse(
+            status_code=HTTPStatus.CONFLICT,
+            content={"detail": exc.message},
+            headers={"Upload-Offset": str(exc.offset)},
+        )
+
+    if isinstance(exc, TooManyQueuedVideosError | ServiceOverloadedError):
+        return JSONResponse(
+            status_code=(
+                HTTPStatus.TOO_MANY_REQUESTS
+                if isinstance(exc, TooManyQueuedVideosError)
+                else HTTPStatus.SERVICE_UNAVAILABLE
+            ),
+            content={"detail": exc.message},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     if isinstance(exc, ApplicationError):
         return JSONResponse(
             status_code=HTTPStatus.BAD_REQUEST,
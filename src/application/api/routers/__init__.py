@@ -1,7 +1,9 @@
 from fastapi import FastAPI
 
 from .health_check_route import router as health_check_router
+from .metrics import metrics_router
 from .user import user_router
+from .video import video_router
 
 
 def register_routes(app: FastAPI) -> None:
@@ -11,7 +13,9 @@ def register_routes(app: FastAPI) -> None:
         app: The FastAPI application instance.
     """
     app.include_router(health_check_router)
+    app.include_router(metrics_router)
     app.include_router(user_router)
+    app.include_router(video_router)
 
 
 __all__ = ["register_routes"]
@@ -0,0 +1,3 @@
+from .metrics_router import router as metrics_router
+
+__all__ = ["metrics_router"]
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+
+from src.application.api.routers.metrics.metrics_schemas import QueueMetricsOUT
+from src.application.di import dependency_injector
+from src.application.use_cases.video.get_queue_metrics.get_queue_metrics_uc import (
+    GetQueueMetricsUC,
+)
+
+router = APIRouter(tags=["Metrics"], prefix="/metrics")
+
+
+@router.get("/queue")
+async def get_queue_metrics(
+    queue_metrics_use_case: GetQueueMetricsUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(GetQueueMetricsUC)
+    ),
+) -> QueueMetricsOUT:
+    """Return the videos by status, the oldest job age and the busy ratio of the workers.
+
+    The counts are kept as videos change status and the workers report their slots
+    periodically, so this is cheap enough to be polled by an autoscaler.
+    """
+    metrics = await queue_metrics_use_case.get_metrics()
+    return QueueMetricsOUT.model_validate(metrics, from_attributes=True)
+
+
+__all__ = ["router"]
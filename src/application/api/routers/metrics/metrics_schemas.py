@@ -0,0 +1,21 @@
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+
+class QueueMetricsOUT(BaseModel):
+    """Output data with the backlog of the video queue and the utilization of its workers."""
+
+    counts: Dict[str, int] = Field(description="The number of videos in each status.")
+    oldest_queued_seconds: float | None = Field(
+        description="For how long the video waiting the longest has been queued, if any is."
+    )
+    workers: int = Field(description="The number of worker processes running.")
+    slots: int = Field(description="The number of videos the workers can process at once.")
+    busy_slots: int = Field(description="The number of videos being processed.")
+    busy_ratio: float | None = Field(
+        description="The share of the slots that are busy, from 0 to 1, if any worker runs."
+    )
+
+
+__all__ = ["QueueMetricsOUT"]
@@ -0,0 +1,3 @@
+from .video_router import router as video_router
+
+__all__ = ["video_router"]
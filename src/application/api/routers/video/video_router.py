@@ -0,0 +1,227 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from src.application.api.routers.video.video_schemas import (
+    ResumableUploadOUT,
+    ResumableUploadStartIN,
+    VideoBatchStatusOUT,
+    VideoBatchUploadCompletionIN,
+    VideoBatchUploadRequestIN,
+    VideoBatchUploadTicketOUT,
+    VideoProgressOUT,
+    VideoStatusOUT,
+    VideoUploadCompletionIN,
+    VideoUploadFormIN,
+    VideoUploadRequestIN,
+    VideoUploadTicketOUT,
+)
+from src.application.api.server_sent_events import server_sent_events
+from src.application.api.streaming_form import StreamingMultipartForm
+from src.application.api.types import PydanticExternalEntityId
+from src.application.di import dependency_injector
+from src.application.use_cases.video.complete_upload.complete_video_upload_uc import (
+    CompleteVideoUploadUC,
+)
+from src.application.use_cases.video.request_upload.request_video_upload_uc import (
+    RequestVideoUploadUC,
+)
+from src.application.use_cases.video.resumable_upload.resumable_video_upload_uc import (
+    ResumableVideoUploadUC,
+)
+from src.application.use_cases.video.upload.upload_video_uc import UploadVideoUC
+from src.application.use_cases.video.watch_progress.watch_video_progress_uc import (
+    WatchVideoProgressUC,
+)
+
+router = APIRouter(tags=["Video"], prefix="/videos")
+
+
+@router.post(
+    "",
+    status_code=HTTPStatus.CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["user_id", "file"],
+                        "properties": {
+                            "user_id": {"type": "string"},
+                            "frame_interval": {"type": "number", "default": 1.0},
+                            "sampling_mode": {
+                                "type": "string",
+                                "enum": ["interval", "scene_change"],
+                                "default": "interval",
+                            },
+                            "scene_threshold": {"type": "number", "default": 0.1},
+                            "max_frames": {"type": "integer"},
+                            "image_format": {
+                                "type": "string",
+                                "enum": ["jpeg", "webp", "png"],
+                                "default": "jpeg",
+                            },
+                            "image_quality": {"type": "integer", "default": 90},
+                            "frame_width": {"type": "integer"},
+                            "priority": {
+                                "type": "string",
+                                "enum": ["low", "normal", "high"],
+                                "default": "normal",
+                            },
+                            "file": {"type": "string", "format": "binary"},
+                        },
+                    }
+                }
+            },
+        }
+    },
+)
+async def upload_video(
+    request: Request,
+    upload_use_case: UploadVideoUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(UploadVideoUC)
+    ),
+) -> VideoStatusOUT:
+    """Upload a video as a multipart/form-data body and queue it for processing.
+
+    The file is streamed to the storage while it is received. The `user_id` and
+    processing option fields must be sent before the `file` field.
+    """
+    form = StreamingMultipartForm(request, file_field="file")
+    fields, filename = await form.read_until_file()
+
+    try:
+        data = VideoUploadFormIN.model_validate(fields)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors()) from e
+
+    result = await upload_use_case.upload(data.to_dto(filename, form.iter_file()))
+    return VideoStatusOUT.model_validate(result, from_attributes=True)
+
+
+@router.post("/uploads", status_code=HTTPStatus.CREATED)
+async def request_upload(
+    data: VideoUploadRequestIN,
+    request_upload_use_case: RequestVideoUploadUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(RequestVideoUploadUC)
+    ),
+) -> VideoUploadTicketOUT:
+    """Register a pending video and return presigned URLs to upload it part by part."""
+    ticket = await request_upload_use_case.request_upload(data.to_dto())
+    return VideoUploadTicketOUT.model_validate(ticket, from_attributes=True)
+
+
+@router.post("/uploads/batch", status_code=HTTPStatus.CREATED)
+async def request_batch_upload(
+    data: VideoBatchUploadRequestIN,
+    request_upload_use_case: RequestVideoUploadUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(RequestVideoUploadUC)
+    ),
+) -> VideoBatchUploadTicketOUT:
+    """Register several pending videos of a user and return the presigned URLs of each."""
+    tickets = await request_upload_use_case.request_batch_upload(data.to_dto())
+    return VideoBatchUploadTicketOUT.model_validate(tickets, from_attributes=True)
+
+
+@router.post("/uploads/batch/complete", status_code=HTTPStatus.ACCEPTED)
+async def complete_batch_upload(
+    data: VideoBatchUploadCompletionIN,
+    complete_upload_use_case: CompleteVideoUploadUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(CompleteVideoUploadUC)
+    ),
+) -> VideoBatchStatusOUT:
+    """Verify the uploaded parts of several videos, assemble them and queue them together.
+
+    Either every upload of the batch is verified or none is completed.
+    """
+    result = await complete_upload_use_case.complete_batch_upload(data.to_dto())
+    return VideoBatchStatusOUT.model_validate(result, from_attributes=True)
+
+
+@router.post("/{video_id}/uploads/complete", status_code=HTTPStatus.ACCEPTED)
+async def complete_upload(
+    video_id: PydanticExternalEntityId,
+    data: VideoUploadCompletionIN,
+    complete_upload_use_case: CompleteVideoUploadUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(CompleteVideoUploadUC)
+    ),
+) -> VideoStatusOUT:
+    """Verify the uploaded parts, assemble the video and queue it for processing."""
+    result = await complete_upload_use_case.complete_upload(data.to_dto(str(video_id)))
+    return VideoStatusOUT.model_validate(result, from_attributes=True)
+
+
+@router.post("/resumable-uploads", status_code=HTTPStatus.CREATED)
+async def start_resumable_upload(
+    data: ResumableUploadStartIN,
+    resumable_upload_use_case: ResumableVideoUploadUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(ResumableVideoUploadUC)
+    ),
+) -> ResumableUploadOUT:
+    """Register a pending video that receives its file through resumable requests."""
+    progress = await resumable_upload_use_case.start(data.to_dto())
+    return ResumableUploadOUT.model_validate(progress, from_attributes=True)
+
+
+@router.get("/{video_id}/upload")
+async def get_upload_progress(
+    video_id: PydanticExternalEntityId,
+    resumable_upload_use_case: ResumableVideoUploadUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(ResumableVideoUploadUC)
+    ),
+) -> ResumableUploadOUT:
+    """Return the offset from which an interrupted upload must continue."""
+    progress = await resumable_upload_use_case.get_progress(str(video_id))
+    return ResumableUploadOUT.model_validate(progress, from_attributes=True)
+
+
+@router.patch("/{video_id}/upload")
+async def append_upload(
+    video_id: PydanticExternalEntityId,
+    request: Request,
+    upload_offset: int = Header(ge=0),
+    resumable_upload_use_case: ResumableVideoUploadUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(ResumableVideoUploadUC)
+    ),
+) -> ResumableUploadOUT:
+    """Append the request body to an upload, starting at the `Upload-Offset` header.
+
+    Only whole parts are stored, so the returned offset may be behind the bytes sent.
+    """
+    progress = await resumable_upload_use_case.append(
+        str(video_id), upload_offset, request.stream()
+    )
+    return ResumableUploadOUT.model_validate(progress, from_attributes=True)
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={HTTPStatus.OK: {"content": {"text/event-stream": {}}}},
+)
+async def watch_progress(
+    user_id: PydanticExternalEntityId,
+    watch_progress_use_case: WatchVideoProgressUC = Depends(  # noqa: B008
+        lambda: dependency_injector.get(WatchVideoProgressUC)
+    ),
+) -> StreamingResponse:
+    """Stream the processing updates of the videos of a user as server-sent events.
+
+    Each `progress` event carries a JSON `VideoProgressOUT`. The stream stays open
+    until the client disconnects.
+    """
+    updates = await watch_progress_use_case.watch(str(user_id))
+    events = (VideoProgressOUT.model_validate(u, from_attributes=True) async for u in updates)
+    return StreamingResponse(
+        server_sent_events(events, event="progress"),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+__all__ = ["router"]
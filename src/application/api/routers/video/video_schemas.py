@@ -0,0 +1,268 @@
+from typing import AsyncIterable, List
+
+from pydantic import BaseModel, Field
+
+from src.application.api.types import PydanticExternalEntityId
+from src.application.interfaces import UploadedPart
+from src.application.use_cases.video.complete_upload.dto import (
+    VideoBatchUploadCompletionDTO,
+    VideoUploadCompletionDTO,
+)
+from src.application.use_cases.video.pending_upload import PendingFileDTO
+from src.application.use_cases.video.request_upload.dto import (
+    VideoBatchUploadRequestDTO,
+    VideoUploadRequestDTO,
+)
+from src.application.use_cases.video.resumable_upload.dto import ResumableUploadStartDTO
+from src.application.use_cases.video.upload.dto import VideoUploadDTO
+from src.domain.video import ImageFormat, ProcessingOptions, SamplingMode, VideoPriority
+
+MAX_BATCH_VIDEOS = 100
+"""The most videos accepted by a single batch request."""
+
+
+class ProcessingOptionsIN(BaseModel):
+    """The processing options and queue priority accepted by every way of uploading a video."""
+
+    frame_interval: float = Field(
+        default=1.0, gt=0, description="The number of seconds between two sampled frames."
+    )
+    sampling_mode: SamplingMode = Field(
+        default=SamplingMode.INTERVAL,
+        description="Keep every sampled frame, or only the ones where the scene changes.",
+    )
+    scene_threshold: float = Field(
+        default=0.1,
+        gt=0,
+        le=1,
+        description="How different, from 0 to 1, a frame must be to count as a scene change.",
+    )
+    max_frames: int | None = Field(
+        default=None, gt=0, description="The maximum number of frames kept."
+    )
+    image_format: ImageFormat = Field(
+        default=ImageFormat.JPEG, description="The format the frames are saved in."
+    )
+    image_quality: int = Field(
+        default=90, ge=1, le=100, description="The quality of JPEG and WebP frames."
+    )
+    frame_width: int | None = Field(
+        default=None,
+        gt=0,
+        description="Scale frames down to this width, keeping their aspect ratio.",
+    )
+    priority: VideoPriority = Field(
+        default=VideoPriority.NORMAL,
+        description="The priority class of the video in the processing queue.",
+    )
+
+    def to_processing_options(self) -> ProcessingOptions:
+        """Convert the options to the domain value object."""
+        return ProcessingOptions(
+            frame_interval=self.frame_interval,
+            sampling_mode=self.sampling_mode,
+            scene_threshold=self.scene_threshold,
+            max_frames=self.max_frames,
+            image_format=self.image_format,
+            image_quality=self.image_quality,
+            frame_width=self.frame_width,
+        )
+
+
+class VideoUploadFormIN(ProcessingOptionsIN):
+    """The text fields of a video upload form, sent before the file."""
+
+    user_id: PydanticExternalEntityId
+
+    def to_dto(self, filename: str, content: AsyncIterable[bytes]) -> VideoUploadDTO:
+        """Convert Pydantic model to DTO."""
+        return VideoUploadDTO(
+            user_id=str(self.user_id),
+            filename=filename,
+            options=self.to_processing_options(),
+            priority=self.priority,
+            content=content,
+        )
+
+
+class VideoUploadRequestIN(ProcessingOptionsIN):
+    """Input data to start a direct upload of a video."""
+
+    user_id: PydanticExternalEntityId
+    filename: str = Field(min_length=1)
+    size: int = Field(gt=0, description="The size of the file, in bytes.")
+
+    def to_dto(self) -> VideoUploadRequestDTO:
+        """Convert Pydantic model to DTO."""
+        return VideoUploadRequestDTO(
+            user_id=str(self.user_id),
+            filename=self.filename,
+            size=self.size,
+            options=self.to_processing_options(),
+            priority=self.priority,
+        )
+
+
+class VideoBatchUploadItemIN(ProcessingOptionsIN):
+    """A video of a batch of direct uploads, with its own processing options."""
+
+    filename: str = Field(min_length=1)
+    size: int = Field(gt=0, description="The size of the file, in bytes.")
+
+    def to_dto(self) -> PendingFileDTO:
+        """Convert Pydantic model to DTO."""
+        return PendingFileDTO(
+            filename=self.filename,
+            size=self.size,
+            options=self.to_processing_options(),
+            priority=self.priority,
+        )
+
+
+class VideoBatchUploadRequestIN(BaseModel):
+    """Input data to start direct uploads of several videos of a user at once."""
+
+    user_id: PydanticExternalEntityId
+    videos: List[VideoBatchUploadItemIN] = Field(min_length=1, max_length=MAX_BATCH_VIDEOS)
+
+    def to_dto(self) -> VideoBatchUploadRequestDTO:
+        """Convert Pydantic model to DTO."""
+        return VideoBatchUploadRequestDTO(
+            user_id=str(self.user_id), videos=[video.to_dto() for video in self.videos]
+        )
+
+
+class PresignedPartOUT(BaseModel):
+    """A presigned URL that accepts one part of the video in a PUT request."""
+
+    part_number: int
+    url: str
+
+
+class VideoUploadTicketOUT(BaseModel):
+    """Output data with the presigned URLs of a direct upload."""
+
+    video_id: PydanticExternalEntityId
+    part_size: int
+    expires_in: int
+    parts: List[PresignedPartOUT]
+
+
+class VideoBatchUploadTicketOUT(BaseModel):
+    """Output data with the upload tickets of a batch, in the order it was sent."""
+
+    videos: List[VideoUploadTicketOUT]
+
+
+class UploadedPartIN(BaseModel):
+    """A part uploaded by the client, with the ETag returned by the storage."""
+
+    part_number: int = Field(ge=1)
+    etag: str = Field(min_length=1)
+
+
+class VideoUploadCompletionIN(BaseModel):
+    """Input data to finish a direct upload of a video."""
+
+    parts: List[UploadedPartIN] = Field(min_length=1)
+
+    def to_dto(self, video_id: str) -> VideoUploadCompletionDTO:
+        """Convert Pydantic model to DTO."""
+        return VideoUploadCompletionDTO(
+            video_id=video_id,
+            parts=[
+                UploadedPart(part_number=part.part_number, etag=part.etag) for part in self.parts
+            ],
+        )
+
+
+class VideoBatchCompletionItemIN(VideoUploadCompletionIN):
+    """A video of a batch of direct uploads to finish."""
+
+    video_id: PydanticExternalEntityId
+
+
+class VideoBatchUploadCompletionIN(BaseModel):
+    """Input data to finish direct uploads of several videos at once."""
+
+    videos: List[VideoBatchCompletionItemIN] = Field(min_length=1, max_length=MAX_BATCH_VIDEOS)
+
+    def to_dto(self) -> VideoBatchUploadCompletionDTO:
+        """Convert Pydantic model to DTO."""
+        return VideoBatchUploadCompletionDTO(
+            videos=[video.to_dto(str(video.video_id)) for video in self.videos]
+        )
+
+
+class VideoStatusOUT(BaseModel):
+    """Output data with the current status of a video."""
+
+    video_id: PydanticExternalEntityId
+    status: str
+
+
+class VideoBatchStatusOUT(BaseModel):
+    """Output data with the status of the videos of a batch, in the order it was sent."""
+
+    videos: List[VideoStatusOUT]
+
+
+class ResumableUploadStartIN(ProcessingOptionsIN):
+    """Input data to start a resumable upload of a video."""
+
+    user_id: PydanticExternalEntityId
+    filename: str = Field(min_length=1)
+    size: int = Field(gt=0, description="The size of the file, in bytes.")
+
+    def to_dto(self) -> ResumableUploadStartDTO:
+        """Convert Pydantic model to DTO."""
+        return ResumableUploadStartDTO(
+            user_id=str(self.user_id),
+            filename=self.filename,
+            size=self.size,
+            options=self.to_processing_options(),
+            priority=self.priority,
+        )
+
+
+class ResumableUploadOUT(BaseModel):
+    """Output data with the progress of a resumable upload."""
+
+    video_id: PydanticExternalEntityId
+    size: int
+    offset: int = Field(description="The number of bytes stored so far.")
+    part_size: int = Field(description="The offset only advances in steps of this size.")
+    status: str
+
+
+class VideoProgressOUT(BaseModel):
+    """An update on the processing of a video, sent as a server-sent event."""
+
+    video_id: PydanticExternalEntityId
+    stage: str
+    frames: int = Field(description="The number of frames extracted so far.")
+    total_frames: int | None = Field(
+        description="An estimate of the number of frames, an upper bound in scene change mode."
+    )
+
+
+__all__ = [
+    "MAX_BATCH_VIDEOS",
+    "PresignedPartOUT",
+    "ProcessingOptionsIN",
+    "ResumableUploadOUT",
+    "ResumableUploadStartIN",
+    "UploadedPartIN",
+    "VideoBatchCompletionItemIN",
+    "VideoBatchStatusOUT",
+    "VideoBatchUploadCompletionIN",
+    "VideoBatchUploadItemIN",
+    "VideoBatchUploadRequestIN",
+    "VideoBatchUploadTicketOUT",
+    "VideoProgressOUT",
+    "VideoStatusOUT",
+    "VideoUploadCompletionIN",
+    "VideoUploadFormIN",
+    "VideoUploadRequestIN",
+    "VideoUploadTicketOUT",
+]
@@ -0,0 +1,52 @@
+import asyncio
+from contextlib import suppress
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+
+KEEPALIVE_INTERVAL = 15.0
+"""For how many idle seconds an event stream waits before sending a comment line."""
+
+
+async def server_sent_events(
+    events: AsyncIterator[BaseModel], event: str, keepalive: float = KEEPALIVE_INTERVAL
+) -> AsyncIterator[bytes]:
+    """Encodes models as a text/event-stream body.
+
+    Every model becomes one event of type `event`, with the model as JSON in its data.
+    A comment is sent after `keepalive` seconds without events, so proxies do not
+    close the idle connection. When the stream is closed, which happens when the
+    client disconnects, the pending read of the source is cancelled, which ends it.
+
+    Args:
+        events: The models to send.
+        event: The type of the events.
+        keepalive: For how many idle seconds to wait before sending a comment.
+
+    Yields:
+        bytes: The next part of the body.
+    """
+    # The next event is awaited in its own task, so the keepalive timeout does not
+    # cancel the source iterator itself.
+    pending = asyncio.ensure_future(events.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({pending}, timeout=keepalive)
+            if not done:
+                yield b": keepalive\n\n"
+                continue
+
+            try:
+                model = pending.result()
+            except StopAsyncIteration:
+                return
+
+            pending = asyncio.ensure_future(events.__anext__())
+            yield f"event: {event}\ndata: {model.model_dump_json()}\n\n".encode()
+    finally:
+        pending.cancel()
+        with suppress(asyncio.CancelledError, StopAsyncIteration):
+            await pending
+
+
+__all__ = ["KEEPALIVE_INTERVAL", "server_sent_events"]
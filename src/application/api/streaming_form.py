@@ -0,0 +1,158 @@
+from collections import deque
+from http import HTTPStatus
+from typing import AsyncIterator, Deque, Dict, Tuple
+
+from fastapi import HTTPException, Request
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+MAX_FIELD_SIZE = 64 * 1024
+"""The maximum size of a text field of a streamed form, in bytes."""
+
+
+class StreamingMultipartForm:
+    """Parses a multipart/form-data request body while it is being received.
+
+    Unlike `Request.form()`, which spools every file to a temporary file before the
+    handler runs, the content of the file field is handed over chunk by chunk as it
+    arrives, so it can be forwarded without keeping it in memory or on disk. The text
+    fields the handler needs must therefore come before the file field; fields sent
+    after it are ignored.
+    """
+
+    def __init__(self, request: Request, file_field: str = "file") -> None:
+        content_type, params = parse_options_header(request.headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise HTTPException(
+                status_code=HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                detail="O corpo deve ser multipart/form-data",
+            )
+
+        self.file_field = file_field
+        self.fields: Dict[str, str] = {}
+        self.filename: str | None = None
+        self._body = request.stream()
+        self._parser = MultipartParser(
+            params[b"boundary"],
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._headers: Dict[bytes, bytes] = {}
+        self._part_name: str | None = None
+        self._value = bytearray()
+        self._in_file = False
+        self._file_ended = False
+        self._file_chunks: Deque[bytes] = deque()
+
+    async def read_until_file(self) -> Tuple[Dict[str, str], str]:
+        """Reads the body up to the start of the content of the file field.
+
+        Returns:
+            Tuple[Dict[str, str], str]: The text fields sent before the file, and the
+                name of the file.
+
+        Raises:
+            HTTPException: If the body is malformed or has no file field.
+        """
+        while self.filename is None:
+            if not await self._feed():
+                raise HTTPException(
+                    status_code=HTTPStatus.BAD_REQUEST,
+                    detail=f"O campo '{self.file_field}' nao foi enviado",
+                )
+
+        return self.fields, self.filename
+
+    async def iter_file(self) -> AsyncIterator[bytes]:
+        """Yields the content of the file field as it is received.
+
+        `read_until_file` must be awaited first. Once the file ends, the rest of the
+        body is read and discarded.
+
+        Raises:
+            HTTPException: If the body is malformed or ends in the middle of the file.
+        """
+        while True:
+            while self._file_chunks:
+                yield self._file_chunks.popleft()
+
+            if self._file_ended:
+                break
+
+            if not await self._feed():
+                raise HTTPException(
+                    status_code=HTTPStatus.BAD_REQUEST, detail="O arquivo esta incompleto"
+                )
+
+        while await self._feed():
+            pass
+
+    async def _feed(self) -> bool:
+        """Parses the next chunk of the body, returning False once it is exhausted."""
+        try:
+            self._parser.write(await self._body.__anext__())
+        except StopAsyncIteration:
+            self._parser.finalize()
+            return False
+        except MultipartParseError as e:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST, detail="Corpo multipart invalido"
+            ) from e
+
+        return True
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._part_name = None
+        self._value.clear()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[bytes(self._header_field).lower()] = bytes(self._header_value)
+        self._header_field.clear()
+        self._header_value.clear()
+
+    def _on_headers_finished(self) -> None:
+        _, params = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = params.get(b"name", b"").decode(errors="replace")
+
+        if self.filename is None and name == self.file_field and b"filename" in params:
+            self.filename = params[b"filename"].decode(errors="replace")
+            self._in_file = True
+        elif self.filename is None:
+            self._part_name = name
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self._file_chunks.append(bytes(data[start:end]))
+        elif self._part_name:
+            self._value += data[start:end]
+            if len(self._value) > MAX_FIELD_SIZE:
+                raise HTTPException(
+                    status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"O campo '{self._part_name}' e muito grande",
+                )
+
+    def _on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+            self._file_ended = True
+        elif self._part_name:
+            self.fields[self._part_name] = self._value.decode(errors="replace")
+
+
+__all__ = ["MAX_FIELD_SIZE", "StreamingMultipartForm"]
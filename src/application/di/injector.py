@@ -2,12 +2,14 @@ from injector import Binder, Injector
 
 from src.application.di.modules import ExternalServiceModule
 from src.application.di.modules.user_module import UserModule
+from src.application.di.modules.video_module import VideoModule
 
 
 def configure_injector(binder: Binder) -> None:  # noqa: ARG001
     """Configures the injector by installing the Modules."""
     binder.install(ExternalServiceModule())
     binder.install(UserModule())
+    binder.install(VideoModule())
 
 
 dependency_injector = Injector([configure_injector])
@@ -1,10 +1,28 @@
-from injector import Module, provider, singleton
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-from src.application.interfaces import IFileStorage
+import boto3
+import botocore.session
+from botocore.config import Config
+from injector import Module, inject, provider, singleton
+
+from src.application.interfaces import (
+    IAsyncFileStorage,
+    IFileStorage,
+    IFrameExtractor,
+    IMediaProber,
+)
+from src.application.interfaces.async_email_sender import IAsyncEmailSender
 from src.application.interfaces.email_sender import IEmailSender
 from src.application.interfaces.password_hasher import IPasswordHasher
 from src.config.settings import settings
 from src.infra.bcrypt_password_hasher import BcryptPasswordHasher
+from src.infra.cached_file_storage import CachedFileStorage
+from src.infra.executor_email_sender import ExecutorEmailSender
+from src.infra.executor_file_storage import ExecutorFileStorage
+from src.infra.filesystem_file_storage import FileSystemFileStorage
+from src.infra.pyav_frame_extractor import PyAVFrameExtractor
+from src.infra.pyav_media_prober import PyAVMediaProber
 from src.infra.s3_file_storage import S3FileStorage
 from src.infra.ses_email_sender import SESEmailSender
 
@@ -14,25 +32,118 @@ class ExternalServiceModule(Module):
 
     @singleton
     @provider
-    def provide_file_storage_service(self) -> IFileStorage:
-        """Provide the file storage service."""
-        return S3FileStorage(
-            bucket_name=settings.S3_BUCKET_NAME,
+    def provide_aws_session(self) -> boto3.Session:
+        """Provide the AWS session shared by every AWS client.
+
+        Sharing one botocore session resolves credentials and loads the service models
+        only once for all the clients.
+        """
+        return boto3.Session(
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             region_name=settings.AWS_REGION,
+            botocore_session=botocore.session.get_session(),
         )
 
     @singleton
     @provider
-    def provide_email_sender_service(self) -> IEmailSender:
+    def provide_aws_client_config(self) -> Config:
+        """Provide the connection pool, retry and timeout settings of the AWS clients."""
+        return Config(
+            max_pool_connections=settings.AWS_MAX_POOL_CONNECTIONS,
+            retries={
+                "mode": settings.AWS_RETRY_MODE,
+                "total_max_attempts": settings.AWS_MAX_ATTEMPTS,
+            },
+            connect_timeout=settings.AWS_CONNECT_TIMEOUT,
+            read_timeout=settings.AWS_READ_TIMEOUT,
+        )
+
+    @singleton
+    @provider
+    @inject
+    def provide_file_storage_service(
+        self, aws_session: boto3.Session, aws_client_config: Config
+    ) -> IFileStorage:
+        """Provide the file storage service, behind a local disk cache when configured."""
+        if settings.STORAGE_BACKEND == "filesystem":
+            return FileSystemFileStorage(root=settings.FILESYSTEM_STORAGE_ROOT)
+
+        storage = S3FileStorage(
+            bucket_name=settings.S3_BUCKET_NAME,
+            region_name=settings.AWS_REGION,
+            part_size=settings.S3_MULTIPART_CHUNKSIZE,
+            download_part_size=settings.S3_DOWNLOAD_PART_SIZE,
+            download_concurrency=settings.S3_DOWNLOAD_CONCURRENCY,
+            multipart_threshold=settings.S3_MULTIPART_THRESHOLD,
+            session=aws_session,
+            client_config=aws_client_config,
+        )
+
+        if settings.FILE_CACHE_DIR:
+            return CachedFileStorage(
+                storage=storage,
+                cache_dir=settings.FILE_CACHE_DIR,
+                max_bytes=settings.FILE_CACHE_MAX_BYTES,
+            )
+
+        return storage
+
+    @singleton
+    @provider
+    @inject
+    def provide_async_file_storage_service(self, storage: IFileStorage) -> IAsyncFileStorage:
+        """Provide the file storage service for async callers, on a bounded thread pool."""
+        return ExecutorFileStorage(
+            storage=storage,
+            executor=ThreadPoolExecutor(
+                max_workers=settings.STORAGE_MAX_WORKERS,
+                thread_name_prefix="file-storage",
+            ),
+        )
+
+    @singleton
+    @provider
+    @inject
+    def provide_email_sender_service(
+        self, aws_session: boto3.Session, aws_client_config: Config
+    ) -> IEmailSender:
         """Provide the email sender service."""
         return SESEmailSender(
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             region_name=settings.AWS_REGION,
+            session=aws_session,
+            client_config=aws_client_config,
+        )
+
+    @singleton
+    @provider
+    @inject
+    def provide_async_email_sender_service(self, sender: IEmailSender) -> IAsyncEmailSender:
+        """Provide the email sender service for async callers, on a bounded thread pool."""
+        return ExecutorEmailSender(
+            sender=sender,
+            executor=ThreadPoolExecutor(
+                max_workers=settings.EMAIL_SENDER_MAX_WORKERS,
+                thread_name_prefix="email-sender",
+            ),
+        )
+
+    @singleton
+    @provider
+    def provide_frame_extractor(self) -> IFrameExtractor:
+        """Provide the frame extractor."""
+        return PyAVFrameExtractor(
+            processes=settings.FRAME_EXTRACTION_PROCESSES or os.cpu_count() or 1,
+            segment_seconds=settings.FRAME_EXTRACTION_SEGMENT_SECONDS,
+            encode_threads=settings.FRAME_ENCODING_THREADS,
         )
 
+    @singleton
+    @provider
+    def provide_media_prober(self) -> IMediaProber:
+        """Provide the reader of the properties of videos."""
+        return PyAVMediaProber()
+
     @singleton
     @provider
     def provide_password_hasher(self) -> IPasswordHasher:
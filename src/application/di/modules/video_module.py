@@ -0,0 +1,229 @@
+from injector import Module, inject, provider, singleton
+
+from src.application.interfaces import (
+    IAsyncFileStorage,
+    IFileStorage,
+    IFrameExtractor,
+    IMediaProber,
+    IProcessingResultIndex,
+    IQueueMetrics,
+    IVideoJobQueue,
+    IVideoProgressChannel,
+)
+from src.application.use_cases.video.admission_control import AdmissionControl
+from src.application.use_cases.video.complete_upload.complete_video_upload_uc import (
+    CompleteVideoUploadUC,
+)
+from src.application.use_cases.video.deduplicate.deduplicate_video_uc import DeduplicateVideoUC
+from src.application.use_cases.video.get_queue_metrics.get_queue_metrics_uc import (
+    GetQueueMetricsUC,
+)
+from src.application.use_cases.video.process.process_video_uc import ProcessVideoUC
+from src.application.use_cases.video.request_upload.request_video_upload_uc import (
+    RequestVideoUploadUC,
+)
+from src.application.use_cases.video.resumable_upload.resumable_video_upload_uc import (
+    ResumableVideoUploadUC,
+)
+from src.application.use_cases.video.upload.upload_video_uc import UploadVideoUC
+from src.application.use_cases.video.watch_progress.watch_video_progress_uc import (
+    WatchVideoProgressUC,
+)
+from src.config.settings import settings
+from src.domain.user.repository import IUserRepository
+from src.domain.video.repository import IVideoRepository
+from src.infra.database.beanie.repositories.beanie_processing_result_index import (
+    BeanieProcessingResultIndex,
+)
+from src.infra.database.beanie.repositories.beanie_queue_metrics import BeanieQueueMetrics
+from src.infra.database.beanie.repositories.beanie_video_job_queue import BeanieVideoJobQueue
+from src.infra.database.beanie.repositories.beanie_video_progress_channel import (
+    BeanieVideoProgressChannel,
+)
+from src.infra.database.beanie.repositories.beanie_video_repository import BeanieVideoRepository
+
+
+class VideoModule(Module):
+    """Dependency injection module for the Video domain."""
+
+    @singleton
+    @provider
+    def provide_video_repository(self) -> IVideoRepository:
+        """Provide the Video repository."""
+        return BeanieVideoRepository()
+
+    @singleton
+    @provider
+    def provide_video_job_queue(self) -> IVideoJobQueue:
+        """Provide the queue of videos waiting to be processed."""
+        return BeanieVideoJobQueue(
+            user_weights=settings.QUEUE_USER_WEIGHTS,
+            max_processing_per_user=settings.QUEUE_MAX_PROCESSING_PER_USER,
+            lease_seconds=settings.WORKER_LEASE_SECONDS,
+            max_attempts=settings.WORKER_MAX_ATTEMPTS,
+        )
+
+    @singleton
+    @provider
+    def provide_processing_result_index(self) -> IProcessingResultIndex:
+        """Provide the index of frames archives by source content and options."""
+        return BeanieProcessingResultIndex()
+
+    @singleton
+    @provider
+    def provide_queue_metrics(self) -> IQueueMetrics:
+        """Provide the metrics of the queue and its workers."""
+        return BeanieQueueMetrics(report_timeout=settings.WORKER_LEASE_SECONDS)
+
+    @singleton
+    @provider
+    def provide_video_progress_channel(self) -> IVideoProgressChannel:
+        """Provide the channel that carries processing updates to the API."""
+        return BeanieVideoProgressChannel()
+
+    @singleton
+    @provider
+    @inject
+    def provide_admission_control(
+        self, job_queue: IVideoJobQueue, queue_metrics: IQueueMetrics
+    ) -> AdmissionControl:
+        """Provide the admission control of new uploads, shared by the whole process."""
+        return AdmissionControl(
+            job_queue=job_queue,
+            queue_metrics=queue_metrics,
+            max_queued=settings.ADMISSION_MAX_QUEUED_VIDEOS,
+            max_queue_wait=settings.ADMISSION_MAX_QUEUE_WAIT_SECONDS,
+            max_queued_per_user=settings.ADMISSION_MAX_QUEUED_PER_USER,
+            max_inflight_bytes=settings.ADMISSION_MAX_INFLIGHT_BYTES,
+            rate_window=settings.ADMISSION_RATE_WINDOW_SECONDS,
+        )
+
+    @provider
+    @inject
+    def provide_upload_video_uc(
+        self,
+        user_repository: IUserRepository,
+        video_repository: IVideoRepository,
+        file_storage: IAsyncFileStorage,
+        job_queue: IVideoJobQueue,
+        deduplicate_video: DeduplicateVideoUC,
+        admission: AdmissionControl,
+    ) -> UploadVideoUC:
+        """Provide the streaming video upload use case."""
+        return UploadVideoUC(
+            user_repo=user_repository,
+            video_repo=video_repository,
+            file_storage=file_storage,
+            job_queue=job_queue,
+            deduplicate_video=deduplicate_video,
+            admission=admission,
+        )
+
+    @provider
+    @inject
+    def provide_request_video_upload_uc(
+        self,
+        user_repository: IUserRepository,
+        video_repository: IVideoRepository,
+        file_storage: IAsyncFileStorage,
+        admission: AdmissionControl,
+    ) -> RequestVideoUploadUC:
+        """Provide the direct video upload use case."""
+        return RequestVideoUploadUC(
+            user_repo=user_repository,
+            video_repo=video_repository,
+            file_storage=file_storage,
+            admission=admission,
+            part_size=settings.VIDEO_UPLOAD_PART_SIZE,
+            url_expiration=settings.PRESIGNED_URL_EXPIRATION,
+        )
+
+    @provider
+    @inject
+    def provide_complete_video_upload_uc(
+        self,
+        video_repository: IVideoRepository,
+        file_storage: IAsyncFileStorage,
+        job_queue: IVideoJobQueue,
+    ) -> CompleteVideoUploadUC:
+        """Provide the video upload completion use case."""
+        return CompleteVideoUploadUC(
+            video_repo=video_repository, file_storage=file_storage, job_queue=job_queue
+        )
+
+    @provider
+    @inject
+    def provide_resumable_video_upload_uc(
+        self,
+        user_repository: IUserRepository,
+        video_repository: IVideoRepository,
+        file_storage: IAsyncFileStorage,
+        job_queue: IVideoJobQueue,
+        admission: AdmissionControl,
+    ) -> ResumableVideoUploadUC:
+        """Provide the resumable video upload use case."""
+        return ResumableVideoUploadUC(
+            user_repo=user_repository,
+            video_repo=video_repository,
+            file_storage=file_storage,
+            admission=admission,
+            job_queue=job_queue,
+            part_size=settings.VIDEO_UPLOAD_PART_SIZE,
+        )
+
+    @provider
+    @inject
+    def provide_deduplicate_video_uc(
+        self,
+        video_repository: IVideoRepository,
+        job_queue: IVideoJobQueue,
+        result_index: IProcessingResultIndex,
+    ) -> DeduplicateVideoUC:
+        """Provide the video deduplication use case."""
+        return DeduplicateVideoUC(
+            video_repo=video_repository, job_queue=job_queue, result_index=result_index
+        )
+
+    @provider
+    @inject
+    def provide_process_video_uc(
+        self,
+        job_queue: IVideoJobQueue,
+        video_repository: IVideoRepository,
+        file_storage: IFileStorage,
+        frame_extractor: IFrameExtractor,
+        media_prober: IMediaProber,
+        deduplicate_video: DeduplicateVideoUC,
+        result_index: IProcessingResultIndex,
+        progress_channel: IVideoProgressChannel,
+    ) -> ProcessVideoUC:
+        """Provide the video processing use case."""
+        return ProcessVideoUC(
+            job_queue=job_queue,
+            video_repo=video_repository,
+            file_storage=file_storage,
+            frame_extractor=frame_extractor,
+            media_prober=media_prober,
+            deduplicate_video=deduplicate_video,
+            result_index=result_index,
+            progress_channel=progress_channel,
+            work_dir=settings.WORKER_TEMP_DIR,
+            progress_interval=settings.PROGRESS_INTERVAL,
+        )
+
+    @provider
+    @inject
+    def provide_watch_video_progress_uc(
+        self, user_repository: IUserRepository, progress_channel: IVideoProgressChannel
+    ) -> WatchVideoProgressUC:
+        """Provide the video progress watching use case."""
+        return WatchVideoProgressUC(user_repo=user_repository, progress_channel=progress_channel)
+
+    @provider
+    @inject
+    def provide_get_queue_metrics_uc(self, queue_metrics: IQueueMetrics) -> GetQueueMetricsUC:
+        """Provide the queue metrics use case."""
+        return GetQueueMetricsUC(queue_metrics=queue_metrics)
+
+
+__all__ = ["VideoModule"]
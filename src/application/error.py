@@ -23,4 +23,62 @@ class InvalidPasswordError(ApplicationError):
     message: str = "Senha invalida"
 
 
-__all__ = ["ApplicationError", "EmailAlreadyRegisteredError"]
+@dataclass(kw_only=True, frozen=True, slots=True)
+class UserNotFoundError(ApplicationError):
+    """Exception raised when a user does not exist."""
+
+    message: str = "Usuario nao encontrado"
+    user_id: str
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class VideoNotFoundError(ApplicationError):
+    """Exception raised when a video does not exist."""
+
+    message: str = "Video nao encontrado"
+    video_id: str
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class InvalidVideoUploadError(ApplicationError):
+    """Exception raised when a video upload cannot be accepted."""
+
+    message: str = "Envio de video invalido"
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class UploadOffsetMismatchError(ApplicationError):
+    """Exception raised when an upload does not continue from the committed offset."""
+
+    message: str = "O envio deve continuar a partir do deslocamento confirmado"
+    offset: int
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class ServiceOverloadedError(ApplicationError):
+    """Exception raised when the service cannot take more work for now."""
+
+    message: str = "O servico esta sobrecarregado, tente novamente mais tarde"
+    retry_after: int
+    """In how many seconds the request is likely to be accepted."""
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class TooManyQueuedVideosError(ApplicationError):
+    """Exception raised when a user already has too many videos waiting to be processed."""
+
+    message: str = "Ha videos demais aguardando processamento, tente novamente mais tarde"
+    retry_after: int
+    """In how many seconds the request is likely to be accepted."""
+
+
+__all__ = [
+    "ApplicationError",
+    "EmailAlreadyRegisteredError",
+    "InvalidVideoUploadError",
+    "ServiceOverloadedError",
+    "TooManyQueuedVideosError",
+    "UploadOffsetMismatchError",
+    "UserNotFoundError",
+    "VideoNotFoundError",
+]
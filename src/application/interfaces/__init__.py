@@ -1,3 +1,26 @@
-from .file_storage import IFileStorage
+from .async_file_storage import IAsyncFileStorage
+from .file_storage import IFileStorage, StoredFileInfo, UploadedPart
+from .frame_extractor import ExtractionStats, IFrameExtractor
+from .media_prober import IMediaProber
+from .processing_result_index import IProcessingResultIndex
+from .queue_metrics import IQueueMetrics, QueueMetrics
+from .video_job_queue import IVideoJobQueue, QueueLoad
+from .video_progress_channel import IVideoProgressChannel, ProcessingStage, VideoProgress
 
-__all__ = ['IFileStorage']
+__all__ = [
+    'ExtractionStats',
+    'IAsyncFileStorage',
+    'IFileStorage',
+    'IFrameExtractor',
+    'IMediaProber',
+    'IProcessingResultIndex',
+    'IQueueMetrics',
+    'IVideoJobQueue',
+    'IVideoProgressChannel',
+    'ProcessingStage',
+    'QueueLoad',
+    'QueueMetrics',
+    'StoredFileInfo',
+    'UploadedPart',
+    'VideoProgress',
+]
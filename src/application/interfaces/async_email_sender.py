@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domain.__shared.value_objects.email.email import Email
+
+
+class IAsyncEmailSender(ABC):
+    """Interface for email senders that do not block the event loop."""
+
+    @abstractmethod
+    async def send_email(self, email: Email) -> None:
+        """Sends an email."""
+        pass
+
+    @abstractmethod
+    async def send_bulk_emails(self, emails: List[Email]) -> None:
+        """Sends multiple emails."""
+        pass
+
+
+__all__ = ["IAsyncEmailSender"]
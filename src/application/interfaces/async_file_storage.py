@@ -0,0 +1,87 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterable, AsyncIterator, List, Sequence
+
+from .file_storage import UploadedPart
+
+
+class IAsyncFileStorage(ABC):
+    """Interface for file storage services that do not block the event loop.
+
+    It mirrors `IFileStorage` with coroutine methods, so it can be awaited from the
+    API handlers without stalling unrelated requests while a transfer is running.
+    """
+
+    @abstractmethod
+    async def upload_file(self, file_name: str, file_data: bytes) -> None:
+        """Uploads a file to storage."""
+        pass
+
+    @abstractmethod
+    async def upload_stream(self, file_name: str, source: AsyncIterable[bytes]) -> None:
+        """Uploads a file to storage from an async stream of chunks.
+
+        Args:
+            file_name: The key under which the file is stored.
+            source: An async iterable of byte chunks, e.g. a request body stream.
+
+        Raises:
+            StorageError: If the upload fails. Partial uploads are aborted.
+        """
+        pass
+
+    @abstractmethod
+    async def download_file(self, file_name: str) -> bytes:
+        """Downloads a file from storage."""
+        pass
+
+    @abstractmethod
+    def stream_file(self, file_name: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Downloads a file from storage as an async stream of chunks.
+
+        Args:
+            file_name: The key of the file to download.
+            chunk_size: The maximum size of each yielded chunk.
+
+        Returns:
+            AsyncIterator[bytes]: The chunks of the file, in order.
+        """
+        pass
+
+    @abstractmethod
+    async def create_multipart_upload(self, file_name: str) -> str:
+        """Starts a multipart upload and returns its identifier."""
+        pass
+
+    @abstractmethod
+    async def upload_part(
+        self, file_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> UploadedPart:
+        """Uploads a single part of a multipart upload."""
+        pass
+
+    @abstractmethod
+    async def presign_upload_part(
+        self, file_name: str, upload_id: str, part_number: int, expires_in: int
+    ) -> str:
+        """Creates a URL that lets a client upload a part directly to the storage."""
+        pass
+
+    @abstractmethod
+    async def list_parts(self, file_name: str, upload_id: str) -> List[UploadedPart]:
+        """Lists the parts stored so far for a multipart upload."""
+        pass
+
+    @abstractmethod
+    async def complete_multipart_upload(
+        self, file_name: str, upload_id: str, parts: Sequence[UploadedPart]
+    ) -> None:
+        """Assembles the uploaded parts into the final file."""
+        pass
+
+    @abstractmethod
+    async def abort_multipart_upload(self, file_name: str, upload_id: str) -> None:
+        """Discards a multipart upload and every part uploaded so far."""
+        pass
+
+
+__all__ = ["IAsyncFileStorage"]
@@ -1,4 +1,35 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, ContextManager, Iterable, Iterator, List, Sequence
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class UploadedPart:
+    """A part of a multipart upload acknowledged by the storage.
+
+    Attributes:
+        part_number: The 1-based position of the part inside the upload.
+        etag: The entity tag returned by the storage for the part.
+        size: The size of the part, in bytes, when reported by the storage.
+    """
+
+    part_number: int
+    etag: str
+    size: int | None = None
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class StoredFileInfo:
+    """Metadata of a file kept in the storage.
+
+    Attributes:
+        size: The size of the file, in bytes.
+        etag: The entity tag of the current version of the file.
+    """
+
+    size: int
+    etag: str
 
 
 class IFileStorage(ABC):
@@ -7,10 +38,201 @@ class IFileStorage(ABC):
         """Uploads a file to storage."""
         pass
 
+    @abstractmethod
+    def upload_stream(self, file_name: str, source: BinaryIO | Iterable[bytes]) -> None:
+        """Uploads a file to storage without holding it entirely in memory.
+
+        The source is consumed incrementally and sent part by part, so the memory
+        used by the upload is bounded by the part size instead of the file size.
+
+        Args:
+            file_name: The key under which the file is stored.
+            source: A readable binary file object or an iterable of byte chunks.
+
+        Raises:
+            StorageError: If the upload fails. Partial uploads are aborted.
+        """
+        pass
+
     @abstractmethod
     def download_file(self, file_name: str) -> bytes:
         """Downloads a file from storage."""
         pass
 
+    @abstractmethod
+    def stream_file(self, file_name: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Downloads a file from storage as a stream of chunks.
+
+        The first chunk is available as soon as it is received, and only one chunk is
+        held in memory at a time, regardless of the file size.
+
+        Args:
+            file_name: The key of the file to download.
+            chunk_size: The maximum size of each yielded chunk.
+
+        Yields:
+            bytes: The next chunk of the file.
+
+        Raises:
+            StorageError: If the download fails.
+        """
+        pass
+
+    @abstractmethod
+    def download_to(self, file_name: str, target: BinaryIO) -> int:
+        """Downloads a file from storage straight into a writable file object.
+
+        Args:
+            file_name: The key of the file to download.
+            target: The file object that receives the content, e.g. an open file or a pipe.
+
+        Returns:
+            int: The number of bytes written to the target.
+
+        Raises:
+            StorageError: If the download fails.
+        """
+        pass
+
+    @abstractmethod
+    def download_to_path(self, file_name: str, destination: str | Path) -> None:
+        """Downloads a file from storage into a local file.
+
+        Implementations may fetch several byte ranges concurrently and write each one
+        at its position in a preallocated file, which is much faster than a single
+        stream for large files.
+
+        Args:
+            file_name: The key of the file to download.
+            destination: The local path of the file to write. It is overwritten if it exists.
+
+        Raises:
+            StorageError: If the download fails. No partial file is left behind.
+        """
+        pass
+
+    @abstractmethod
+    def open_local(
+        self, file_name: str, temp_dir: str | Path | None = None
+    ) -> ContextManager[Path]:
+        """Makes a file available at a local path, for readers that need one.
+
+        Storages that keep the file on the local disk yield its own path, without
+        copying it. The others download it into `temp_dir` and remove the copy when the
+        context exits.
+
+        Args:
+            file_name: The key of the file.
+            temp_dir: Where a downloaded copy is kept. Defaults to the system temp dir.
+
+        Returns:
+            ContextManager[Path]: The local path of the file, which must not be modified
+                and is only valid inside the context.
+
+        Raises:
+            StorageError: If the file cannot be read.
+        """
+        pass
+
+    @abstractmethod
+    def stat_file(self, file_name: str) -> StoredFileInfo:
+        """Retrieves the metadata of a file without downloading it.
+
+        Args:
+            file_name: The key of the file.
+
+        Returns:
+            StoredFileInfo: The size and entity tag of the file.
+
+        Raises:
+            StorageError: If the file does not exist or cannot be inspected.
+        """
+        pass
+
+    @abstractmethod
+    def create_multipart_upload(self, file_name: str) -> str:
+        """Starts a multipart upload.
+
+        Args:
+            file_name: The key under which the file will be stored.
+
+        Returns:
+            str: The identifier of the multipart upload.
+        """
+        pass
+
+    @abstractmethod
+    def upload_part(
+        self, file_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> UploadedPart:
+        """Uploads a single part of a multipart upload.
+
+        Args:
+            file_name: The key of the file being uploaded.
+            upload_id: The identifier returned by `create_multipart_upload`.
+            part_number: The 1-based position of the part.
+            data: The content of the part.
+
+        Returns:
+            UploadedPart: The acknowledgement of the stored part.
+        """
+        pass
+
+    @abstractmethod
+    def presign_upload_part(
+        self, file_name: str, upload_id: str, part_number: int, expires_in: int
+    ) -> str:
+        """Creates a URL that lets a client upload a part directly to the storage.
+
+        Args:
+            file_name: The key of the file being uploaded.
+            upload_id: The identifier returned by `create_multipart_upload`.
+            part_number: The 1-based position of the part.
+            expires_in: For how many seconds the URL is valid.
+
+        Returns:
+            str: The URL that accepts the part content in a PUT request.
+
+        Raises:
+            StorageError: If the storage does not support presigned URLs.
+        """
+        pass
+
+    @abstractmethod
+    def list_parts(self, file_name: str, upload_id: str) -> List[UploadedPart]:
+        """Lists the parts stored so far for a multipart upload.
+
+        Args:
+            file_name: The key of the file being uploaded.
+            upload_id: The identifier returned by `create_multipart_upload`.
+
+        Returns:
+            List[UploadedPart]: The stored parts, ordered by part number.
+        """
+        pass
+
+    @abstractmethod
+    def complete_multipart_upload(
+        self, file_name: str, upload_id: str, parts: Sequence[UploadedPart]
+    ) -> None:
+        """Assembles the uploaded parts into the final file.
+
+        Args:
+            file_name: The key of the file being uploaded.
+            upload_id: The identifier returned by `create_multipart_upload`.
+            parts: The acknowledged parts, in any order.
+        """
+        pass
+
+    @abstractmethod
+    def abort_multipart_upload(self, file_name: str, upload_id: str) -> None:
+        """Discards a multipart upload and every part uploaded so far.
+
+        Args:
+            file_name: The key of the file being uploaded.
+            upload_id: The identifier returned by `create_multipart_upload`.
+        """
+        pass
+
 
-__all__ = ['IFileStorage']
+__all__ = ['IFileStorage', 'StoredFileInfo', 'UploadedPart']
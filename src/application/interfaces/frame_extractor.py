@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from src.domain.video import ProcessingOptions
+
+
+@dataclass(kw_only=True, slots=True)
+class ExtractionStats:
+    """Counters updated by an extraction while its archive is being consumed.
+
+    Attributes:
+        frames: The number of frames added to the archive so far.
+        decode_seconds: The time spent decoding and selecting frames.
+        encode_seconds: The time spent encoding the selected frames, summed over
+            every encoder running in parallel.
+        expected_frames: An estimate of the number of frames of the archive, set once
+            the video is opened. In scene change mode it is an upper bound.
+    """
+
+    frames: int = 0
+    expected_frames: int | None = None
+    decode_seconds: float = 0.0
+    encode_seconds: float = 0.0
+
+
+class IFrameExtractor(ABC):
+    """Interface for services that extract frames from a video file."""
+
+    @abstractmethod
+    def extract(
+        self,
+        source: Path,
+        options: ProcessingOptions,
+        stats: ExtractionStats,
+        keyframes: Sequence[float] = (),
+    ) -> Iterator[bytes]:
+        """Streams a zip archive with frames sampled from a video.
+
+        The archive is produced while it is consumed: every frame is decoded, encoded
+        and yielded as part of the archive before the next one is read, so memory use
+        does not depend on the length of the video.
+
+        Args:
+            source: The path of the video file.
+            options: How the frames are sampled.
+            stats: Counters updated as the frames are added to the archive.
+            keyframes: The times of keyframes of the video, in seconds, if it was probed.
+                They only tell where decoding can start; frames are sampled the same
+                without them.
+
+        Yields:
+            bytes: The next chunk of the archive.
+
+        Raises:
+            FrameExtractionError: If the video cannot be decoded.
+        """
+        pass
+
+
+__all__ = ["ExtractionStats", "IFrameExtractor"]
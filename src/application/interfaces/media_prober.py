@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from src.domain.video import MediaInfo
+
+
+class IMediaProber(ABC):
+    """Interface for services that read the properties of a video file."""
+
+    @abstractmethod
+    def probe(self, source: Path) -> MediaInfo:
+        """Reads the duration, frame rate, resolution, codec and keyframes of a video.
+
+        Only the headers and the index of the container are read where they hold the
+        information, so probing does not decode the video.
+
+        Args:
+            source: The path of the video file.
+
+        Returns:
+            MediaInfo: The properties of the first video stream.
+        """
+        pass
+
+
+__all__ = ["IMediaProber"]
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+
+
+class IProcessingResultIndex(ABC):
+    """Interface for the index of frames archives by source content and options.
+
+    An entry maps the hash of a source file and the fingerprint of the options it was
+    processed with to the storage key of the frames archive, so a video with the same
+    content and options reuses the archive without being processed again.
+
+    Each entry counts the videos that reference its archive. Reusing an archive takes a
+    reference atomically with the lookup, so an archive may only be deleted after its
+    entry was removed while it had no references left.
+    """
+
+    @abstractmethod
+    async def acquire(self, content_hash: str, processing_key: str) -> str | None:
+        """Finds the archive of a processing result and takes a reference to it.
+
+        Args:
+            content_hash: The hash of the source file.
+            processing_key: The fingerprint of the processing options.
+
+        Returns:
+            str | None: The storage key of the frames archive, or None if the content
+                was never processed with these options.
+        """
+        pass
+
+    @abstractmethod
+    async def register(self, content_hash: str, processing_key: str, processed_file: str) -> bool:
+        """Adds the archive of a new processing result, with one reference.
+
+        Args:
+            content_hash: The hash of the source file.
+            processing_key: The fingerprint of the processing options.
+            processed_file: The storage key of the frames archive.
+
+        Returns:
+            bool: False if another archive was registered for the same content and
+                options first, in which case the index is left unchanged.
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, content_hash: str, processing_key: str) -> int:
+        """Gives back a reference taken with `acquire`.
+
+        Args:
+            content_hash: The hash of the source file.
+            processing_key: The fingerprint of the processing options.
+
+        Returns:
+            int: The number of references left.
+        """
+        pass
+
+
+__all__ = ["IProcessingResultIndex"]
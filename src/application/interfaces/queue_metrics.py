@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict
+
+from src.domain.video import VideoStatus
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class QueueMetrics:
+    """A snapshot of the backlog of the queue and of the workers draining it.
+
+    Attributes:
+        counts: The number of videos in each status.
+        oldest_queued_at: When the video waiting the longest entered the queue, or None
+            if the queue is empty.
+        workers: The number of worker processes that reported recently.
+        slots: The number of videos those workers can process at once.
+        busy_slots: The number of those slots processing a video.
+    """
+
+    counts: Dict[VideoStatus, int] = field(default_factory=dict)
+    oldest_queued_at: datetime | None = None
+    workers: int = 0
+    slots: int = 0
+    busy_slots: int = 0
+
+
+class IQueueMetrics(ABC):
+    """Interface for the metrics of the video queue, read by autoscalers and dashboards.
+
+    The counts by status are kept by the queue and the video repository as they change
+    the status of videos, so reading them does not scan the videos. Each worker process
+    reports its own slots periodically, and stops counting once it misses its reports.
+    """
+
+    @abstractmethod
+    async def get_metrics(self) -> QueueMetrics:
+        """Reads the current metrics of the queue and its workers."""
+        pass
+
+    @abstractmethod
+    async def report_worker(self, slots: int, busy_slots: int) -> None:
+        """Records how many videos this worker process can and does process at once.
+
+        Args:
+            slots: The number of videos the process can process at once.
+            busy_slots: The number of videos being processed by it.
+        """
+        pass
+
+    @abstractmethod
+    async def remove_worker(self) -> None:
+        """Stops counting this worker process, which is about to exit."""
+        pass
+
+    @abstractmethod
+    async def recount(self, min_interval: float) -> bool:
+        """Counts the videos in each status again, fixing counts that drifted.
+
+        Only one caller recounts per `min_interval`, however many processes call it.
+
+        Args:
+            min_interval: The least number of seconds between two recounts.
+
+        Returns:
+            bool: Whether this call recounted.
+        """
+        pass
+
+
+__all__ = ["IQueueMetrics", "QueueMetrics"]
@@ -0,0 +1,154 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Sequence
+
+from src.domain.user import User
+from src.domain.video import Video
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class QueueLoad:
+    """A snapshot of how busy the queue and its workers are.
+
+    Attributes:
+        queued: The number of videos waiting in the queue.
+        finished: The number of claimed videos that were done or failed since the time
+            the snapshot was asked for, which measures how fast the workers drain the
+            queue.
+    """
+
+    queued: int
+    finished: int
+
+
+class IVideoJobQueue(ABC):
+    """Interface for the queue of videos waiting to be processed.
+
+    A queued video is a job. Claiming it moves it to processing for a single worker, so
+    any number of workers, in any number of processes or machines, can share the queue
+    without processing the same video twice.
+
+    A claim is a lease that expires unless the worker renews it. When a worker dies,
+    its videos are put back in the queue once their leases expire, and the worker can
+    no longer complete them, so they are never processed by two workers at once.
+    """
+
+    @abstractmethod
+    async def enqueue(self, video: Video) -> bool:
+        """Moves an uploaded video to the queue and persists its mutable fields.
+
+        Args:
+            video: The video, with the status it was read with.
+
+        Returns:
+            bool: False if the status of the video had changed meanwhile.
+
+        Raises:
+            InvalidStatusTransitionError: If the video cannot be queued from its status.
+        """
+        pass
+
+    @abstractmethod
+    async def enqueue_many(self, videos: Sequence[Video]) -> List[bool]:
+        """Moves several uploaded videos to the queue with a single write.
+
+        The videos of a user are queued one after the other, in the given order.
+
+        Args:
+            videos: The videos, each with the status it was read with.
+
+        Returns:
+            List[bool]: For each video, False if its status had changed meanwhile.
+
+        Raises:
+            InvalidStatusTransitionError: If a video cannot be queued from its status,
+                in which case none is queued.
+        """
+        pass
+
+    @abstractmethod
+    async def claim(self) -> Video | None:
+        """Atomically takes the next queued video, marks it as processing and leases it.
+
+        Returns:
+            Video | None: The claimed video, with its `worker_id` and lease expiry, or
+                None if no video can be processed now.
+        """
+        pass
+
+    @abstractmethod
+    async def renew(self, video: Video) -> bool:
+        """Extends the lease of a claimed video.
+
+        Args:
+            video: The video returned by `claim`.
+
+        Returns:
+            bool: False if the lease was lost, in which case the video must be dropped.
+        """
+        pass
+
+    @abstractmethod
+    async def reclaim_expired(self) -> int:
+        """Puts the videos whose lease expired back in the queue.
+
+        Videos that were already claimed too many times are marked as failed instead,
+        so a video that crashes its workers is not retried forever.
+
+        Returns:
+            int: The number of videos put back in the queue.
+        """
+        pass
+
+    @abstractmethod
+    async def get_load(self, since: datetime) -> QueueLoad:
+        """Counts the queued and the recently finished videos.
+
+        Args:
+            since: From when the finished videos are counted.
+
+        Returns:
+            QueueLoad: The counts.
+        """
+        pass
+
+    @abstractmethod
+    async def count_queued(self, user: User) -> int:
+        """Counts the videos of a user waiting in the queue.
+
+        Args:
+            user: The owner of the videos.
+
+        Returns:
+            int: The number of queued videos.
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, video: Video, processed_file: str) -> bool:
+        """Marks a claimed video as done.
+
+        Args:
+            video: The video returned by `claim`.
+            processed_file: The storage key of the frames archive.
+
+        Returns:
+            bool: False if the video was no longer being processed under this lease.
+        """
+        pass
+
+    @abstractmethod
+    async def fail(self, video: Video) -> bool:
+        """Marks a claimed video as failed.
+
+        Args:
+            video: The video returned by `claim`.
+
+        Returns:
+            bool: False if the video was no longer being processed under this lease.
+        """
+        pass
+
+
+__all__ = ["IVideoJobQueue", "QueueLoad"]
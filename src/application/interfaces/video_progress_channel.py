@@ -0,0 +1,76 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import AsyncIterator
+
+
+class ProcessingStage(StrEnum):
+    """What a worker is doing with a video."""
+
+    DOWNLOADING = "downloading"
+    """The source file is being downloaded and hashed."""
+
+    EXTRACTING = "extracting"
+    """The frames are being extracted and uploaded."""
+
+    DONE = "done"
+    """The frames archive is ready."""
+
+    FAILED = "failed"
+    """The processing failed."""
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class VideoProgress:
+    """An update on the processing of a video.
+
+    Attributes:
+        user_id: The external identifier of the owner of the video.
+        video_id: The external identifier of the video.
+        stage: The current stage of the processing.
+        frames: The number of frames extracted so far.
+        total_frames: An estimate of the number of frames the video will have, once
+            known. In scene change mode it is an upper bound.
+    """
+
+    user_id: str
+    video_id: str
+    stage: ProcessingStage
+    frames: int = 0
+    total_frames: int | None = None
+
+
+class IVideoProgressChannel(ABC):
+    """Interface for the channel that carries processing updates to the API.
+
+    Workers publish small updates as they go, and every API process receives them
+    once and hands them to the clients watching the videos of each user, so watching
+    costs no database reads per client.
+    """
+
+    @abstractmethod
+    async def publish(self, progress: VideoProgress) -> None:
+        """Publishes an update.
+
+        Updates are informative: if one cannot be published it is dropped, and no
+        error is raised.
+        """
+        pass
+
+    @abstractmethod
+    def subscribe(self, user_id: str) -> AsyncIterator[VideoProgress]:
+        """Yields the updates on the videos of a user, from now on, until closed.
+
+        A subscriber that falls behind loses its oldest pending updates rather than
+        slowing the others down.
+
+        Args:
+            user_id: The external identifier of the user.
+
+        Yields:
+            VideoProgress: The next update.
+        """
+        pass
+
+
+__all__ = ["IVideoProgressChannel", "ProcessingStage", "VideoProgress"]
@@ -0,0 +1,193 @@
+import asyncio
+import math
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import AsyncIterable, AsyncIterator, Deque, List, Tuple
+
+from src.application.error import ServiceOverloadedError, TooManyQueuedVideosError
+from src.application.interfaces import IQueueMetrics, IVideoJobQueue, QueueLoad, QueueMetrics
+from src.domain.user import User
+
+MAX_RETRY_AFTER = 3600
+"""The longest wait, in seconds, ever suggested to a refused client."""
+
+
+class AdmissionControl:
+    """Refuses new uploads while the service cannot keep up with them.
+
+    Three signals are checked before a video is accepted:
+
+    - The depth of the queue, which bounds how far it grows during a burst.
+    - The saturation of the workers, as the time they would take to drain the queue and
+      the new videos at the rate they finished videos over the last `rate_window`
+      seconds. When none finished over that window, after an idle period or while the
+      workers are busy with long videos, the rate is unknown rather than zero: uploads
+      are then only refused if every slot of the workers is busy and more videos wait
+      than they can start next, as reported by `queue_metrics`.
+    - The bytes being received by the uploads still in progress in this process, which
+      bounds the memory and connections held by the API.
+
+    When one of them is over its limit, the upload is refused with the time it should
+    take for it to fall back under the limit, at the measured rate. A user with too many
+    videos of their own in the queue is refused as well, even when the service is not
+    overloaded. Every limit can be disabled with None.
+
+    The queue counts are shared by every request of the process and refreshed at most
+    every `refresh_seconds`, so admission costs no query to most requests.
+
+    Args:
+        job_queue: The queue of videos waiting to be processed.
+        queue_metrics: The metrics of the workers, or None to always admit uploads
+            while the processing rate is unknown.
+        max_queued: The most videos waiting in the queue.
+        max_queue_wait: The longest the workers may take to drain the queue, in seconds.
+        max_queued_per_user: The most videos of a single user waiting in the queue.
+        max_inflight_bytes: The most bytes being received by this process at once.
+        rate_window: The period over which the processing and upload rates are measured,
+            in seconds.
+        refresh_seconds: For how long the queue counts are reused.
+    """
+
+    def __init__(
+        self,
+        job_queue: IVideoJobQueue,
+        queue_metrics: IQueueMetrics | None = None,
+        max_queued: int | None = None,
+        max_queue_wait: float | None = None,
+        max_queued_per_user: int | None = None,
+        max_inflight_bytes: int | None = None,
+        rate_window: float = 300.0,
+        refresh_seconds: float = 1.0,
+    ) -> None:
+        self.job_queue = job_queue
+        self.queue_metrics = queue_metrics
+        self.max_queued = max_queued
+        self.max_queue_wait = max_queue_wait
+        self.max_queued_per_user = max_queued_per_user
+        self.max_inflight_bytes = max_inflight_bytes
+        self.rate_window = rate_window
+        self.refresh_seconds = refresh_seconds
+        self.inflight_bytes = 0
+        self._received: Deque[List[float]] = deque()
+        """The bytes received per second, as `[second, bytes]`, over the rate window."""
+        self._load: QueueLoad | None = None
+        self._metrics: QueueMetrics | None = None
+        self._load_expires_at = 0.0
+        self._load_lock = asyncio.Lock()
+
+    async def admit_video(self, user: User, count: int = 1) -> None:
+        """Checks that the queue can take `count` more videos of a user.
+
+        Raises:
+            ServiceOverloadedError: If the queue is too deep or would take the workers
+                too long to drain.
+            TooManyQueuedVideosError: If the user has too many videos in the queue.
+        """
+        load = metrics = None
+        if self.max_queued is not None or self.max_queue_wait is not None:
+            load, metrics = await self._get_load()
+
+        processing_rate = load.finished / self.rate_window if load else 0.0
+        if load:
+            self._check_queue_depth(load, count, processing_rate)
+            self._check_queue_wait(load, metrics, count)
+        await self._check_user_queue(user, count, processing_rate)
+
+    def admit_transfer(self) -> None:
+        """Checks that this process can receive the content of one more upload.
+
+        Raises:
+            ServiceOverloadedError: If too many bytes are already being received.
+        """
+        if self.max_inflight_bytes is None or self.inflight_bytes < self.max_inflight_bytes:
+            return
+
+        excess = self.inflight_bytes - self.max_inflight_bytes + 1
+        raise ServiceOverloadedError(retry_after=self._retry_after(excess, self._upload_rate()))
+
+    async def receive(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Yields the chunks of an upload, counting them as in flight until it ends."""
+        received = 0
+        try:
+            async for chunk in chunks:
+                received += len(chunk)
+                self.inflight_bytes += len(chunk)
+                self._count_received(len(chunk))
+                yield chunk
+        finally:
+            self.inflight_bytes -= received
+
+    def _check_queue_depth(self, load: QueueLoad, count: int, processing_rate: float) -> None:
+        if self.max_queued is None or load.queued + count <= self.max_queued:
+            return
+
+        excess = load.queued + count - self.max_queued
+        raise ServiceOverloadedError(retry_after=self._retry_after(excess, processing_rate))
+
+    def _check_queue_wait(self, load: QueueLoad, metrics: QueueMetrics | None, count: int) -> None:
+        if self.max_queue_wait is None:
+            return
+
+        if not load.finished:
+            if self._is_saturated(load, metrics, count):
+                raise ServiceOverloadedError(retry_after=self._retry_after(load.queued, 0.0))
+            return
+
+        queue_wait = (load.queued + count) / (load.finished / self.rate_window)
+        if queue_wait > self.max_queue_wait:
+            raise ServiceOverloadedError(
+                retry_after=self._retry_after(queue_wait - self.max_queue_wait, 1.0)
+            )
+
+    @staticmethod
+    def _is_saturated(load: QueueLoad, metrics: QueueMetrics | None, count: int) -> bool:
+        """Whether every slot is busy and more videos wait than the slots can start next."""
+        if metrics is None or not metrics.slots:
+            return False
+        return metrics.busy_slots >= metrics.slots and load.queued + count > metrics.slots
+
+    async def _check_user_queue(self, user: User, count: int, processing_rate: float) -> None:
+        if self.max_queued_per_user is None:
+            return
+
+        queued = await self.job_queue.count_queued(user)
+        if queued + count > self.max_queued_per_user:
+            # The user gets at most every worker, so this is the shortest the wait can be.
+            excess = queued + count - self.max_queued_per_user
+            raise TooManyQueuedVideosError(retry_after=self._retry_after(excess, processing_rate))
+
+    async def _get_load(self) -> Tuple[QueueLoad, QueueMetrics | None]:
+        async with self._load_lock:
+            if self._load is None or time.monotonic() >= self._load_expires_at:
+                since = datetime.now() - timedelta(seconds=self.rate_window)
+                self._load = await self.job_queue.get_load(since)
+                if self.queue_metrics and self.max_queue_wait is not None:
+                    self._metrics = await self.queue_metrics.get_metrics()
+                self._load_expires_at = time.monotonic() + self.refresh_seconds
+            return self._load, self._metrics
+
+    def _count_received(self, size: int) -> None:
+        second = math.floor(time.monotonic())
+        if self._received and self._received[-1][0] == second:
+            self._received[-1][1] += size
+        else:
+            self._received.append([second, size])
+
+    def _upload_rate(self) -> float:
+        """The bytes received per second by this process over the rate window."""
+        oldest = time.monotonic() - self.rate_window
+        while self._received and self._received[0][0] < oldest:
+            self._received.popleft()
+        return sum(size for _, size in self._received) / self.rate_window
+
+    def _retry_after(self, excess: float, rate: float) -> int:
+        """The seconds it takes to get `excess` under the limit at `rate` per second.
+
+        Without a measured rate, clients are told to come back after the rate window.
+        """
+        seconds = excess / rate if rate else self.rate_window
+        return max(1, min(math.ceil(seconds), MAX_RETRY_AFTER))
+
+
+__all__ = ["MAX_RETRY_AFTER", "AdmissionControl"]
@@ -0,0 +1,153 @@
+import asyncio
+from itertools import starmap
+from typing import Dict, Iterable, List
+
+from src.application.error import InvalidVideoUploadError, VideoNotFoundError
+from src.application.interfaces import IAsyncFileStorage, IVideoJobQueue, UploadedPart
+from src.application.use_cases.video.complete_upload.dto import (
+    VideoBatchUploadCompletedDTO,
+    VideoBatchUploadCompletionDTO,
+    VideoUploadCompletedDTO,
+    VideoUploadCompletionDTO,
+)
+from src.domain.video import Video, VideoStatus
+from src.domain.video.repository import IVideoRepository
+
+
+class CompleteVideoUploadUC:
+    """Use-case for finishing a direct-to-storage upload and queueing the video.
+
+    A batch of uploads is checked as a whole before any of them is completed, and its
+    videos are read and queued with a single query each.
+
+    Completing is idempotent: once the file is assembled, the video is saved with its
+    whole size committed before it is queued, so a request retried after a failed
+    enqueue queues it without completing the upload again, and a request repeated
+    after the video was queued returns its current status.
+    """
+
+    def __init__(
+        self,
+        video_repo: IVideoRepository,
+        file_storage: IAsyncFileStorage,
+        job_queue: IVideoJobQueue,
+    ) -> None:
+        self.video_repo = video_repo
+        self.file_storage = file_storage
+        self.job_queue = job_queue
+
+    async def complete_upload(self, data: VideoUploadCompletionDTO) -> VideoUploadCompletedDTO:
+        """Checks the parts reported by the client against the storage and completes the upload.
+
+        Raises:
+            VideoNotFoundError: If the video does not exist.
+            InvalidVideoUploadError: If the video is not a direct upload, or the reported
+                parts are missing, out of sequence or do not match the stored ones, or
+                the stored parts do not add up to the declared size.
+        """
+        video = await self.video_repo.find_by_external_id(data.video_id)
+        if not video:
+            raise VideoNotFoundError(video_id=data.video_id)
+
+        if not self._is_assembled(video):
+            stored_parts = await self._check_parts(video, data.parts)
+            await self._complete_multipart_upload(video, stored_parts)
+
+        if video.status == VideoStatus.PENDING_UPLOAD and not await self.job_queue.enqueue(video):
+            raise InvalidVideoUploadError(message="O envio deste video ja foi concluido")
+
+        return VideoUploadCompletedDTO(video_id=str(video.external_id), status=video.status)
+
+    async def complete_batch_upload(
+        self, data: VideoBatchUploadCompletionDTO
+    ) -> VideoBatchUploadCompletedDTO:
+        """Completes several uploads and queues their videos together.
+
+        Videos whose status changed while the batch was being completed are returned
+        with their status unchanged.
+
+        Raises:
+            VideoNotFoundError: If a video does not exist.
+            InvalidVideoUploadError: If a video is sent twice, or the upload of a video
+                cannot be completed, in which case none is.
+        """
+        videos = await self._find_videos([completion.video_id for completion in data.videos])
+        unassembled = [
+            (video, completion.parts)
+            for video, completion in zip(videos, data.videos, strict=True)
+            if not self._is_assembled(video)
+        ]
+        stored_parts = await asyncio.gather(*starmap(self._check_parts, unassembled))
+        await asyncio.gather(
+            *map(self._complete_multipart_upload, [video for video, _ in unassembled], stored_parts)
+        )
+
+        pending = [video for video in videos if video.status == VideoStatus.PENDING_UPLOAD]
+        if pending:
+            await self.job_queue.enqueue_many(pending)
+        return VideoBatchUploadCompletedDTO(
+            videos=[
+                VideoUploadCompletedDTO(video_id=str(video.external_id), status=video.status)
+                for video in videos
+            ]
+        )
+
+    async def _find_videos(self, video_ids: List[str]) -> List[Video]:
+        """Reads the videos of a batch with one query, in the order of their ids."""
+        if len(set(video_ids)) != len(video_ids):
+            raise InvalidVideoUploadError(message="Um video foi informado mais de uma vez")
+
+        found = {
+            str(video.external_id): video
+            for video in await self.video_repo.find_many_by_external_ids(video_ids)
+        }
+        missing = next((video_id for video_id in video_ids if video_id not in found), None)
+        if missing:
+            raise VideoNotFoundError(video_id=missing)
+
+        return [found[video_id] for video_id in video_ids]
+
+    @staticmethod
+    def _is_assembled(video: Video) -> bool:
+        """Whether the whole file of the video is already stored, as a single file."""
+        return not video.upload_id and bool(video.size) and video.upload_offset == video.size
+
+    async def _check_parts(
+        self, video: Video, reported_parts: Iterable[UploadedPart]
+    ) -> List[UploadedPart]:
+        """Returns the stored parts of a pending upload, if the client reported them all."""
+        if video.status != VideoStatus.PENDING_UPLOAD or not video.upload_id:
+            raise InvalidVideoUploadError(message="O envio deste video ja foi concluido")
+
+        stored_parts = await self.file_storage.list_parts(video.filename, video.upload_id)
+        reported = self._etags_by_part(reported_parts)
+        is_sequential = list(reported) == list(range(1, len(reported) + 1))
+        if not is_sequential or reported != self._etags_by_part(stored_parts):
+            raise InvalidVideoUploadError(message="As partes enviadas nao conferem")
+
+        if sum(part.size or 0 for part in stored_parts) != video.size:
+            raise InvalidVideoUploadError(message="O arquivo nao tem o tamanho informado")
+
+        return stored_parts
+
+    async def _complete_multipart_upload(self, video: Video, parts: List[UploadedPart]) -> None:
+        await self.file_storage.complete_multipart_upload(
+            video.filename,
+            video.upload_id,  # type: ignore[arg-type]
+            parts,
+        )
+
+        # Saved before the video is queued, so a retry does not complete the upload again.
+        video.upload_id = None
+        video.upload_offset = video.size  # type: ignore[assignment]
+        await self.video_repo.update(video)
+
+    @staticmethod
+    def _etags_by_part(parts: Iterable[UploadedPart]) -> Dict[int, str]:
+        return {
+            part.part_number: part.etag.strip('"')
+            for part in sorted(parts, key=lambda p: p.part_number)
+        }
+
+
+__all__ = ["CompleteVideoUploadUC"]
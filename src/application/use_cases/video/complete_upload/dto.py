@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import List
+
+from src.application.interfaces import UploadedPart
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoUploadCompletionDTO:
+    """Input data to finish a direct upload of a video."""
+
+    video_id: str
+    parts: List[UploadedPart]
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoUploadCompletedDTO:
+    """Result of a finished video upload."""
+
+    video_id: str
+    status: str
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoBatchUploadCompletionDTO:
+    """Input data to finish direct uploads of several videos at once."""
+
+    videos: List[VideoUploadCompletionDTO]
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoBatchUploadCompletedDTO:
+    """Result of a batch of finished uploads, in the order they were sent."""
+
+    videos: List[VideoUploadCompletedDTO]
+
+
+__all__ = [
+    "VideoBatchUploadCompletedDTO",
+    "VideoBatchUploadCompletionDTO",
+    "VideoUploadCompletedDTO",
+    "VideoUploadCompletionDTO",
+]
@@ -0,0 +1,37 @@
+import hashlib
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+
+class ContentHasher:
+    """Computes the SHA-256 of a file while it streams through, without buffering it.
+
+    Wrap the chunks of a file with `hash_stream` (or `hash_iterable` for blocking
+    sources) and read `hexdigest` once the stream has been fully consumed.
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    async def hash_stream(self, source: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Yields the chunks of an async stream, hashing them on the way."""
+        async for chunk in source:
+            self._update(chunk)
+            yield chunk
+
+    def hash_iterable(self, source: Iterable[bytes]) -> Iterator[bytes]:
+        """Yields the chunks of an iterable, hashing them on the way."""
+        for chunk in source:
+            self._update(chunk)
+            yield chunk
+
+    def hexdigest(self) -> str:
+        """Returns the hash of every chunk seen so far."""
+        return self._hash.hexdigest()
+
+    def _update(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+        self.size += len(chunk)
+
+
+__all__ = ["ContentHasher"]
@@ -0,0 +1,61 @@
+from src.application.interfaces import IProcessingResultIndex, IVideoJobQueue
+from src.domain.video import Video, VideoStatus
+from src.domain.video.repository import IVideoRepository
+
+
+class DeduplicateVideoUC:
+    """Use-case for reusing the frames of a video with identical content.
+
+    Once the hash of a source file is known, the processing result index tells whether
+    the same content was already processed with the same options. The frames archive
+    of that result is then linked to the new video instead of running the extraction
+    again, which takes a single indexed lookup.
+    A video claimed by a worker is completed through the job queue, under the lease of
+    that worker; any other video is moved to done directly.
+    """
+
+    def __init__(
+        self,
+        video_repo: IVideoRepository,
+        job_queue: IVideoJobQueue,
+        result_index: IProcessingResultIndex,
+    ) -> None:
+        self.video_repo = video_repo
+        self.job_queue = job_queue
+        self.result_index = result_index
+
+    async def deduplicate(self, video: Video, content_hash: str) -> bool:
+        """Sets the content hash of a video and completes it with a previous result.
+
+        If there is no previous result, nothing is persisted: the caller saves the hash
+        along with the next status change of the video.
+
+        Args:
+            video: The video whose source file was hashed.
+            content_hash: The SHA-256 of the source file.
+
+        Returns:
+            bool: True if the video was completed with an existing frames archive.
+        """
+        video.content_hash = content_hash
+        processing_key = video.options.processing_key()
+        processed_file = await self.result_index.acquire(content_hash, processing_key)
+        if not processed_file:
+            return False
+
+        if await self._complete(video, processed_file):
+            return True
+
+        video.processed_file = None
+        await self.result_index.release(content_hash, processing_key)
+        return False
+
+    async def _complete(self, video: Video, processed_file: str) -> bool:
+        if video.status == VideoStatus.PROCESSING:
+            return await self.job_queue.complete(video, processed_file)
+
+        video.processed_file = processed_file
+        return await self.video_repo.transition(video, VideoStatus.DONE)
+
+
+__all__ = ["DeduplicateVideoUC"]
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class QueueMetricsDTO:
+    """The backlog of the video queue and how busy its workers are."""
+
+    counts: Dict[str, int]
+    """The number of videos in each status."""
+    oldest_queued_seconds: float | None
+    """For how long the video waiting the longest has been queued, if any is."""
+    workers: int
+    """The number of worker processes running."""
+    slots: int
+    """The number of videos the workers can process at once."""
+    busy_slots: int
+    """The number of videos being processed by the workers."""
+    busy_ratio: float | None
+    """The share of the slots that are busy, from 0 to 1, if any worker is running."""
+
+
+__all__ = ["QueueMetricsDTO"]
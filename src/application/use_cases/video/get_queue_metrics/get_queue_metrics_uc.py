@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from src.application.interfaces import IQueueMetrics
+from src.application.use_cases.video.get_queue_metrics.dto import QueueMetricsDTO
+
+
+class GetQueueMetricsUC:
+    """Use-case for reading the metrics that size the pool of workers.
+
+    A growing number of queued videos, an old oldest job or a busy ratio close to 1
+    call for more workers; an empty queue with a low busy ratio, for fewer.
+    """
+
+    def __init__(self, queue_metrics: IQueueMetrics) -> None:
+        self.queue_metrics = queue_metrics
+
+    async def get_metrics(self) -> QueueMetricsDTO:
+        """Returns the counts of videos by status, the oldest job age and the busy ratio."""
+        metrics = await self.queue_metrics.get_metrics()
+
+        oldest_queued_seconds = None
+        if metrics.oldest_queued_at:
+            waited = datetime.now() - metrics.oldest_queued_at
+            oldest_queued_seconds = max(waited.total_seconds(), 0.0)
+
+        return QueueMetricsDTO(
+            counts={str(status): count for status, count in metrics.counts.items()},
+            oldest_queued_seconds=oldest_queued_seconds,
+            workers=metrics.workers,
+            slots=metrics.slots,
+            busy_slots=metrics.busy_slots,
+            busy_ratio=metrics.busy_slots / metrics.slots if metrics.slots else None,
+        )
+
+
+__all__ = ["GetQueueMetricsUC"]
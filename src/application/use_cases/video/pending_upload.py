@@ -0,0 +1,150 @@
+import asyncio
+import math
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from src.application.error import InvalidVideoUploadError, UserNotFoundError
+from src.application.interfaces import IAsyncFileStorage
+from src.application.use_cases.video.admission_control import AdmissionControl
+from src.application.use_cases.video.storage_keys import source_file_key
+from src.domain.__shared.value_objects.external_entity_id import ExternalEntityId
+from src.domain.user.repository import IUserRepository
+from src.domain.video import ProcessingOptions, Video, VideoPriority, VideoStatus
+from src.domain.video.repository import IVideoRepository
+
+MAX_UPLOAD_PARTS = 10_000
+"""The maximum number of parts of a multipart upload accepted by S3."""
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class PendingFileDTO:
+    """A file about to be uploaded in parts, with how its video is processed."""
+
+    filename: str
+    size: int
+    options: ProcessingOptions
+    priority: VideoPriority = VideoPriority.NORMAL
+
+
+async def start_pending_upload(
+    user_repo: IUserRepository,
+    video_repo: IVideoRepository,
+    file_storage: IAsyncFileStorage,
+    admission: AdmissionControl,
+    *,
+    user_id: str,
+    filename: str,
+    size: int,
+    options: ProcessingOptions,
+    priority: VideoPriority,
+    min_part_size: int,
+) -> Video:
+    """Registers a video whose source file is about to be uploaded in parts.
+
+    The video must be admitted into the queue first. A multipart upload is then opened
+    in the storage and the video is saved as pending, with a part size large enough to
+    fit the whole file in `MAX_UPLOAD_PARTS` parts.
+
+    Args:
+        user_repo: The user repository.
+        video_repo: The video repository.
+        file_storage: The storage that receives the source file.
+        admission: The admission control of new videos.
+        user_id: The external identifier of the owner of the video.
+        filename: The name of the file, as sent by the client.
+        size: The size of the file, in bytes.
+        options: The options used to process the video.
+        priority: The priority class of the video in the processing queue.
+        min_part_size: The smallest part size to use.
+
+    Returns:
+        Video: The pending video.
+
+    Raises:
+        InvalidVideoUploadError: If the file is empty or its name is invalid.
+        UserNotFoundError: If the user does not exist.
+        ServiceOverloadedError: If the service is overloaded.
+        TooManyQueuedVideosError: If the user has too many videos in the queue.
+    """
+    [video] = await start_pending_uploads(
+        user_repo,
+        video_repo,
+        file_storage,
+        admission,
+        user_id=user_id,
+        files=[PendingFileDTO(filename=filename, size=size, options=options, priority=priority)],
+        min_part_size=min_part_size,
+    )
+    return video
+
+
+async def start_pending_uploads(
+    user_repo: IUserRepository,
+    video_repo: IVideoRepository,
+    file_storage: IAsyncFileStorage,
+    admission: AdmissionControl,
+    *,
+    user_id: str,
+    files: Sequence[PendingFileDTO],
+    min_part_size: int,
+) -> List[Video]:
+    """Registers the videos of a user whose source files are about to be uploaded in parts.
+
+    Works like `start_pending_upload` for every file, but the user is looked up and the
+    videos are admitted once, the multipart uploads are opened concurrently and the
+    videos are saved with a single write.
+
+    Args:
+        user_repo: The user repository.
+        video_repo: The video repository.
+        file_storage: The storage that receives the source files.
+        admission: The admission control of new videos.
+        user_id: The external identifier of the owner of the videos.
+        files: The files to be uploaded.
+        min_part_size: The smallest part size to use.
+
+    Returns:
+        List[Video]: The pending videos, in the order of `files`.
+
+    Raises:
+        InvalidVideoUploadError: If a file is empty or its name is invalid.
+        UserNotFoundError: If the user does not exist.
+        ServiceOverloadedError: If the service is overloaded.
+        TooManyQueuedVideosError: If the user has too many videos in the queue.
+    """
+    if any(file.size <= 0 for file in files):
+        raise InvalidVideoUploadError(message="O arquivo esta vazio")
+
+    user = await user_repo.find_by_external_id(user_id)
+    if not user:
+        raise UserNotFoundError(user_id=user_id)
+
+    await admission.admit_video(user, count=len(files))
+
+    external_ids = [ExternalEntityId() for _ in files]
+    keys = [
+        source_file_key(str(external_id), file.filename)
+        for external_id, file in zip(external_ids, files, strict=True)
+    ]
+    upload_ids = await asyncio.gather(*(file_storage.create_multipart_upload(key) for key in keys))
+
+    return await video_repo.insert_many([
+        Video(
+            external_id=external_id,
+            user=user,
+            filename=key,
+            status=VideoStatus.PENDING_UPLOAD,
+            processed_file=None,
+            upload_id=upload_id,
+            size=file.size,
+            upload_part_size=max(min_part_size, math.ceil(file.size / MAX_UPLOAD_PARTS)),
+            options=file.options,
+            priority=file.priority,
+        )
+        for external_id, key, upload_id, file in zip(
+            external_ids, keys, upload_ids, files, strict=True
+        )
+    ])
+
+
+__all__ = ["MAX_UPLOAD_PARTS", "PendingFileDTO", "start_pending_upload", "start_pending_uploads"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoProcessedDTO:
+    """Result of processing a video."""
+
+    video_id: str
+    status: str
+    frames: int
+    """The number of extracted frames, 0 if an existing archive was reused."""
+    frames_per_second: float
+    """How many frames were extracted and uploaded per second of processing."""
+    decode_seconds: float = 0.0
+    """The time spent decoding and selecting frames."""
+    encode_seconds: float = 0.0
+    """The time spent encoding frames, summed over the encoders running in parallel."""
+
+
+__all__ = ["VideoProcessedDTO"]
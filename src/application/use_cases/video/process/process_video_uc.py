@@ -0,0 +1,210 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import ExitStack
+from pathlib import Path
+
+from src.application.interfaces import (
+    ExtractionStats,
+    IFileStorage,
+    IFrameExtractor,
+    IMediaProber,
+    IProcessingResultIndex,
+    IVideoJobQueue,
+    IVideoProgressChannel,
+    ProcessingStage,
+    VideoProgress,
+)
+from src.application.use_cases.video.content_hasher import ContentHasher
+from src.application.use_cases.video.deduplicate.deduplicate_video_uc import DeduplicateVideoUC
+from src.application.use_cases.video.process.dto import VideoProcessedDTO
+from src.application.use_cases.video.storage_keys import processed_file_key
+from src.domain.video import Video, VideoStatus
+from src.domain.video.repository import IVideoRepository
+
+_READ_SIZE = 1024 * 1024
+
+
+class ProcessVideoUC:
+    """Use-case for extracting the frames of a video claimed from the job queue.
+
+    The source file is read from the local path the storage gives for it, which is the
+    cached copy itself when there is one. Its frames archive is streamed into the
+    storage while it is produced, so neither the frames nor the archive are ever fully
+    kept in memory or on disk. Before any of that, a video whose content and options
+    are found in the processing result index is completed with the indexed archive;
+    videos uploaded without being hashed are hashed first and looked up then. Every
+    new archive is added to the index.
+    Once available locally, the source file is probed and its properties are saved on the
+    video before the extraction starts.
+    The blocking work runs in threads, so a worker can process several videos at once.
+    The stages of the processing, and the number of frames extracted every
+    `progress_interval` seconds, are published to the progress channel.
+    """
+
+    def __init__(
+        self,
+        job_queue: IVideoJobQueue,
+        video_repo: IVideoRepository,
+        file_storage: IFileStorage,
+        frame_extractor: IFrameExtractor,
+        media_prober: IMediaProber,
+        deduplicate_video: DeduplicateVideoUC,
+        result_index: IProcessingResultIndex,
+        progress_channel: IVideoProgressChannel,
+        work_dir: str | None = None,
+        progress_interval: float = 1.0,
+    ) -> None:
+        self.job_queue = job_queue
+        self.video_repo = video_repo
+        self.file_storage = file_storage
+        self.frame_extractor = frame_extractor
+        self.media_prober = media_prober
+        self.deduplicate_video = deduplicate_video
+        self.result_index = result_index
+        self.progress_channel = progress_channel
+        self.work_dir = work_dir
+        self.progress_interval = progress_interval
+
+    async def process(self, video: Video) -> VideoProcessedDTO:
+        """Extracts the frames of a claimed video and marks it as done.
+
+        The video is marked as failed if anything goes wrong, and the error is re-raised.
+        """
+        try:
+            result = await self._process(video)
+        except Exception:
+            await self.job_queue.fail(video)
+            await self._publish(video, ProcessingStage.FAILED)
+            raise
+
+        await self._publish(
+            video, ProcessingStage.DONE, frames=result.frames, total_frames=result.frames
+        )
+        return result
+
+    async def _process(self, video: Video) -> VideoProcessedDTO:
+        if video.content_hash and await self.deduplicate_video.deduplicate(
+            video, video.content_hash
+        ):
+            return self._reused(video)
+
+        await self._publish(video, ProcessingStage.DOWNLOADING)
+        with ExitStack() as stack:
+            source = await asyncio.to_thread(self._open_source, stack, video)
+            content_hash = await asyncio.to_thread(self._hash, source)
+
+            if not video.content_hash and await self.deduplicate_video.deduplicate(
+                video, content_hash
+            ):
+                return self._reused(video)
+
+            video.media = await asyncio.to_thread(self.media_prober.probe, source)
+            await self.video_repo.update(video)
+
+            key = processed_file_key(str(video.external_id))
+            stats = ExtractionStats()
+            started_at = time.perf_counter()
+            await self._extract_reporting_progress(video, source, key, stats)
+            elapsed = time.perf_counter() - started_at
+
+        if await self.job_queue.complete(video, key):
+            await self.result_index.register(
+                video.content_hash,  # type: ignore[arg-type]
+                video.options.processing_key(),
+                key,
+            )
+
+        return VideoProcessedDTO(
+            video_id=str(video.external_id),
+            status=VideoStatus.DONE,
+            frames=stats.frames,
+            frames_per_second=stats.frames / elapsed if elapsed else 0.0,
+            decode_seconds=stats.decode_seconds,
+            encode_seconds=stats.encode_seconds,
+        )
+
+    @staticmethod
+    def _reused(video: Video) -> VideoProcessedDTO:
+        return VideoProcessedDTO(
+            video_id=str(video.external_id),
+            status=video.status,
+            frames=0,
+            frames_per_second=0.0,
+        )
+
+    def _open_source(self, stack: ExitStack, video: Video) -> Path:
+        """Gets the local path of the source file, open until the stack is closed.
+
+        Opening may download the whole file, so it must run in a thread, not the loop.
+        """
+        return stack.enter_context(self.file_storage.open_local(video.filename, self.work_dir))
+
+    @staticmethod
+    def _hash(source: Path) -> str:
+        """Hashes the source file."""
+        hasher = ContentHasher()
+        with open(source, "rb") as file:
+            deque(hasher.hash_iterable(iter(lambda: file.read(_READ_SIZE), b"")), maxlen=0)
+        return hasher.hexdigest()
+
+    async def _extract_reporting_progress(
+        self, video: Video, source: Path, key: str, stats: ExtractionStats
+    ) -> None:
+        """Extracts the frames in a thread, publishing the frame count while it changes.
+
+        The first update is published before the extraction starts, with the number of
+        frames estimated from the properties of the video.
+        """
+        if video.media:
+            stats.expected_frames = video.media.estimated_frames(
+                video.options.frame_interval, video.options.max_frames
+            )
+        await self._publish(video, ProcessingStage.EXTRACTING, total_frames=stats.expected_frames)
+
+        extraction = asyncio.ensure_future(
+            asyncio.to_thread(self._extract, source, video, key, stats)
+        )
+
+        reported = None
+        while not extraction.done():
+            await asyncio.wait({extraction}, timeout=self.progress_interval)
+            if not extraction.done() and stats.frames != reported:
+                reported = stats.frames
+                await self._publish(
+                    video,
+                    ProcessingStage.EXTRACTING,
+                    frames=stats.frames,
+                    total_frames=stats.expected_frames,
+                )
+
+        await extraction
+
+    def _extract(self, source: Path, video: Video, key: str, stats: ExtractionStats) -> None:
+        """Streams the frames archive of the source file into the storage.
+
+        The keyframes found by the probe tell the extractor where it can split the video.
+        """
+        keyframes = video.media.keyframes if video.media else ()
+        archive = self.frame_extractor.extract(source, video.options, stats, keyframes)
+        self.file_storage.upload_stream(key, archive)
+
+    async def _publish(
+        self,
+        video: Video,
+        stage: ProcessingStage,
+        frames: int = 0,
+        total_frames: int | None = None,
+    ) -> None:
+        await self.progress_channel.publish(
+            VideoProgress(
+                user_id=str(video.user.external_id),
+                video_id=str(video.external_id),
+                stage=stage,
+                frames=frames,
+                total_frames=total_frames,
+            )
+        )
+
+
+__all__ = ["ProcessVideoUC"]
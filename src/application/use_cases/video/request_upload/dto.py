@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from typing import List
+
+from src.application.use_cases.video.pending_upload import PendingFileDTO
+from src.domain.video import ProcessingOptions, VideoPriority
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoUploadRequestDTO:
+    """Input data to start a direct upload of a video."""
+
+    user_id: str
+    filename: str
+    size: int
+    options: ProcessingOptions
+    priority: VideoPriority = VideoPriority.NORMAL
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoBatchUploadRequestDTO:
+    """Input data to start direct uploads of several videos of a user at once."""
+
+    user_id: str
+    videos: List[PendingFileDTO]
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class PresignedPartDTO:
+    """A presigned URL that accepts one part of the video."""
+
+    part_number: int
+    url: str
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoUploadTicketDTO:
+    """Everything a client needs to upload the video straight to the storage."""
+
+    video_id: str
+    part_size: int
+    expires_in: int
+    parts: List[PresignedPartDTO]
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoBatchUploadTicketDTO:
+    """The upload tickets of a batch, in the order the videos were requested."""
+
+    videos: List[VideoUploadTicketDTO]
+
+
+__all__ = [
+    "PresignedPartDTO",
+    "VideoBatchUploadRequestDTO",
+    "VideoBatchUploadTicketDTO",
+    "VideoUploadRequestDTO",
+    "VideoUploadTicketDTO",
+]
@@ -0,0 +1,105 @@
+import asyncio
+import math
+
+from src.application.interfaces import IAsyncFileStorage
+from src.application.use_cases.video.admission_control import AdmissionControl
+from src.application.use_cases.video.pending_upload import (
+    start_pending_upload,
+    start_pending_uploads,
+)
+from src.application.use_cases.video.request_upload.dto import (
+    PresignedPartDTO,
+    VideoBatchUploadRequestDTO,
+    VideoBatchUploadTicketDTO,
+    VideoUploadRequestDTO,
+    VideoUploadTicketDTO,
+)
+from src.domain.user.repository import IUserRepository
+from src.domain.video import Video
+from src.domain.video.repository import IVideoRepository
+
+
+class RequestVideoUploadUC:
+    """Use-case for starting a direct-to-storage upload of a video.
+
+    The video is registered as pending and a multipart upload is opened in the
+    storage, with one presigned URL per part, so the bytes never go through the API.
+    A batch of videos is registered with a single write.
+    """
+
+    def __init__(
+        self,
+        user_repo: IUserRepository,
+        video_repo: IVideoRepository,
+        file_storage: IAsyncFileStorage,
+        admission: AdmissionControl,
+        part_size: int,
+        url_expiration: int,
+    ) -> None:
+        self.user_repo = user_repo
+        self.video_repo = video_repo
+        self.file_storage = file_storage
+        self.admission = admission
+        self.part_size = part_size
+        self.url_expiration = url_expiration
+
+    async def request_upload(self, data: VideoUploadRequestDTO) -> VideoUploadTicketDTO:
+        """Registers a pending video and returns the presigned part URLs."""
+        video = await start_pending_upload(
+            self.user_repo,
+            self.video_repo,
+            self.file_storage,
+            self.admission,
+            user_id=data.user_id,
+            filename=data.filename,
+            size=data.size,
+            options=data.options,
+            priority=data.priority,
+            min_part_size=self.part_size,
+        )
+        return await self._ticket(video)
+
+    async def request_batch_upload(
+        self, data: VideoBatchUploadRequestDTO
+    ) -> VideoBatchUploadTicketDTO:
+        """Registers several pending videos of a user and returns their presigned part URLs."""
+        videos = await start_pending_uploads(
+            self.user_repo,
+            self.video_repo,
+            self.file_storage,
+            self.admission,
+            user_id=data.user_id,
+            files=data.videos,
+            min_part_size=self.part_size,
+        )
+        tickets = await asyncio.gather(*(self._ticket(video) for video in videos))
+        return VideoBatchUploadTicketDTO(videos=list(tickets))
+
+    async def _ticket(self, video: Video) -> VideoUploadTicketDTO:
+        part_size: int = video.upload_part_size  # type: ignore[assignment]
+        part_count = math.ceil(video.size / part_size)  # type: ignore[operator]
+
+        urls = await asyncio.gather(
+            *(
+                self.file_storage.presign_upload_part(
+                    video.filename,
+                    video.upload_id,  # type: ignore[arg-type]
+                    part_number,
+                    self.url_expiration,
+                )
+                for part_number in range(1, part_count + 1)
+            )
+        )
+
+        return VideoUploadTicketDTO(
+            video_id=str(video.external_id),
+            part_size=part_size,
+            expires_in=self.url_expiration,
+            parts=[
+                PresignedPartDTO(part_number=part_number, url=url)
+                for part_number, url in enumerate(urls, start=1)
+            ],
+        )
+
+
+__all__ = ["RequestVideoUploadUC"]
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from src.domain.video import ProcessingOptions, VideoPriority
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResumableUploadStartDTO:
+    """Input data to start a resumable upload of a video."""
+
+    user_id: str
+    filename: str
+    size: int
+    options: ProcessingOptions
+    priority: VideoPriority = VideoPriority.NORMAL
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ResumableUploadDTO:
+    """The progress of a resumable upload."""
+
+    video_id: str
+    size: int
+    offset: int
+    part_size: int
+    status: str
+
+
+__all__ = ["ResumableUploadDTO", "ResumableUploadStartDTO"]
@@ -0,0 +1,170 @@
+from typing import AsyncIterable
+
+from src.application.error import (
+    InvalidVideoUploadError,
+    UploadOffsetMismatchError,
+    VideoNotFoundError,
+)
+from src.application.interfaces import IAsyncFileStorage, IVideoJobQueue
+from src.application.use_cases.video.admission_control import AdmissionControl
+from src.application.use_cases.video.pending_upload import start_pending_upload
+from src.application.use_cases.video.resumable_upload.dto import (
+    ResumableUploadDTO,
+    ResumableUploadStartDTO,
+)
+from src.domain.user.repository import IUserRepository
+from src.domain.video import Video, VideoStatus
+from src.domain.video.repository import IVideoRepository
+
+
+class ResumableVideoUploadUC:
+    """Use-case for uploading a video through the API in resumable steps.
+
+    The client sends the file from the committed offset onwards. Every full part is
+    stored in the multipart upload and acknowledged by moving the committed offset
+    forward, so an interrupted request only loses the incomplete part it was sending.
+    The client then asks for the committed offset and continues from there.
+    New uploads go through admission control, and so does every request that sends
+    data, so an overloaded process can ask the client to continue later.
+    """
+
+    def __init__(
+        self,
+        user_repo: IUserRepository,
+        video_repo: IVideoRepository,
+        file_storage: IAsyncFileStorage,
+        admission: AdmissionControl,
+        job_queue: IVideoJobQueue,
+        part_size: int,
+    ) -> None:
+        self.user_repo = user_repo
+        self.video_repo = video_repo
+        self.file_storage = file_storage
+        self.admission = admission
+        self.job_queue = job_queue
+        self.part_size = part_size
+
+    async def start(self, data: ResumableUploadStartDTO) -> ResumableUploadDTO:
+        """Registers a pending video that will receive its file in resumable steps."""
+        video = await start_pending_upload(
+            self.user_repo,
+            self.video_repo,
+            self.file_storage,
+            self.admission,
+            user_id=data.user_id,
+            filename=data.filename,
+            size=data.size,
+            options=data.options,
+            priority=data.priority,
+            min_part_size=self.part_size,
+        )
+        return self._progress(video)
+
+    async def get_progress(self, video_id: str) -> ResumableUploadDTO:
+        """Returns the committed offset of an upload."""
+        return self._progress(await self._find(video_id))
+
+    async def append(
+        self, video_id: str, offset: int, chunks: AsyncIterable[bytes]
+    ) -> ResumableUploadDTO:
+        """Stores the bytes sent from `offset` onwards, one full part at a time.
+
+        Raises:
+            VideoNotFoundError: If the video does not exist.
+            InvalidVideoUploadError: If the upload is finished or the data exceeds its size.
+            UploadOffsetMismatchError: If `offset` is not the committed offset.
+            ServiceOverloadedError: If this process is receiving too much data.
+        """
+        video = await self._find(video_id)
+        self._check_offset(video, offset)
+
+        self.admission.admit_transfer()
+        await self._store_parts(video, chunks)
+
+        if video.upload_offset == video.size:
+            await self._finish(video)
+
+        return self._progress(video)
+
+    @staticmethod
+    def _check_offset(video: Video, offset: int) -> None:
+        """Checks that a video is receiving a resumable upload, committed up to `offset`.
+
+        A video whose file is already assembled is still accepted at its full size, so a
+        request retried after a failed enqueue can queue it.
+        """
+        is_receiving = (
+            video.status == VideoStatus.PENDING_UPLOAD
+            and video.size
+            and (video.upload_id or video.upload_offset == video.size)
+        )
+        if not is_receiving:
+            raise InvalidVideoUploadError(message="O envio deste video ja foi concluido")
+
+        if offset != video.upload_offset:
+            raise UploadOffsetMismatchError(offset=video.upload_offset)
+
+    async def _store_parts(self, video: Video, chunks: AsyncIterable[bytes]) -> None:
+        """Stores every full part received, and the last part once the file is complete."""
+        part_size: int = video.upload_part_size  # type: ignore[assignment]
+        buffer = bytearray()
+        async for chunk in self.admission.receive(chunks):
+            buffer += chunk
+            if video.upload_offset + len(buffer) > video.size:  # type: ignore[operator]
+                raise InvalidVideoUploadError(message="O arquivo excede o tamanho informado")
+
+            while len(buffer) >= part_size:
+                await self._commit_part(video, bytes(buffer[:part_size]))
+                del buffer[:part_size]
+
+        if buffer and video.upload_offset + len(buffer) == video.size:
+            await self._commit_part(video, bytes(buffer))
+
+    async def _commit_part(self, video: Video, data: bytes) -> None:
+        part_number = video.upload_offset // video.upload_part_size + 1  # type: ignore[operator]
+        await self.file_storage.upload_part(
+            video.filename,
+            video.upload_id,  # type: ignore[arg-type]
+            part_number,
+            data,
+        )
+
+        expected_offset = video.upload_offset
+        if not await self.video_repo.advance_upload_offset(video, expected_offset + len(data)):
+            raise UploadOffsetMismatchError(offset=expected_offset)
+
+    async def _finish(self, video: Video) -> None:
+        """Assembles the stored parts and queues the video.
+
+        The video is saved with its upload id cleared before it is queued, so a retry
+        after a failed enqueue does not complete the upload again.
+        """
+        if video.upload_id:
+            parts = await self.file_storage.list_parts(video.filename, video.upload_id)
+            await self.file_storage.complete_multipart_upload(
+                video.filename, video.upload_id, parts
+            )
+            video.upload_id = None
+            await self.video_repo.update(video)
+
+        if not await self.job_queue.enqueue(video):
+            raise InvalidVideoUploadError(message="O envio deste video ja foi concluido")
+
+    async def _find(self, video_id: str) -> Video:
+        video = await self.video_repo.find_by_external_id(video_id)
+        if not video:
+            raise VideoNotFoundError(video_id=video_id)
+        return video
+
+    @staticmethod
+    def _progress(video: Video) -> ResumableUploadDTO:
+        return ResumableUploadDTO(
+            video_id=str(video.external_id),
+            size=video.size or 0,
+            offset=video.upload_offset,
+            part_size=video.upload_part_size or 0,
+            status=video.status,
+        )
+
+
+__all__ = ["ResumableVideoUploadUC"]
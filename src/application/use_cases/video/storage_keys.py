@@ -0,0 +1,42 @@
+from pathlib import PurePosixPath
+
+from src.application.error import InvalidVideoUploadError
+
+
+def source_file_key(video_id: str, filename: str) -> str:
+    """Builds the storage key of the source file of a video.
+
+    Only the last component of the client provided name is kept, so it cannot
+    escape the folder of the source file, and source files and outputs live under
+    separate prefixes, so no client provided name can collide with an output.
+
+    Args:
+        video_id: The external identifier of the video.
+        filename: The name of the file, as sent by the client.
+
+    Returns:
+        str: The storage key of the file.
+
+    Raises:
+        InvalidVideoUploadError: If the filename is empty.
+    """
+    name = PurePosixPath(filename.replace("\\", "/")).name
+    if not name or name in {".", ".."}:
+        raise InvalidVideoUploadError(message="Nome de arquivo invalido")
+
+    return f"videos/{video_id}/source/{name}"
+
+
+def processed_file_key(video_id: str) -> str:
+    """Builds the storage key of the frames archive of a video.
+
+    Args:
+        video_id: The external identifier of the video.
+
+    Returns:
+        str: The storage key of the archive.
+    """
+    return f"videos/{video_id}/processed/frames.zip"
+
+
+__all__ = ["processed_file_key", "source_file_key"]
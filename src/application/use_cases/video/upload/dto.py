@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import AsyncIterable
+
+from src.domain.video import ProcessingOptions, VideoPriority
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoUploadDTO:
+    """Input data to upload a video through the API."""
+
+    user_id: str
+    filename: str
+    options: ProcessingOptions
+    priority: VideoPriority = VideoPriority.NORMAL
+    content: AsyncIterable[bytes]
+    """The content of the file, consumed once as it is uploaded to the storage."""
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoUploadedDTO:
+    """Result of a video upload."""
+
+    video_id: str
+    status: str
+
+
+__all__ = ["VideoUploadDTO", "VideoUploadedDTO"]
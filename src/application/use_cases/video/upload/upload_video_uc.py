@@ -0,0 +1,93 @@
+from src.application.error import InvalidVideoUploadError, UserNotFoundError
+from src.application.interfaces import IAsyncFileStorage, IVideoJobQueue
+from src.application.use_cases.video.admission_control import AdmissionControl
+from src.application.use_cases.video.content_hasher import ContentHasher
+from src.application.use_cases.video.deduplicate.deduplicate_video_uc import DeduplicateVideoUC
+from src.application.use_cases.video.storage_keys import source_file_key
+from src.application.use_cases.video.upload.dto import VideoUploadDTO, VideoUploadedDTO
+from src.domain.__shared.value_objects.external_entity_id import ExternalEntityId
+from src.domain.user.repository import IUserRepository
+from src.domain.video import Video, VideoStatus
+from src.domain.video.repository import IVideoRepository
+
+
+class UploadVideoUC:
+    """Use-case for uploading a video through the API.
+
+    The video is saved as pending, then its content is streamed to the storage as it
+    arrives, so the memory used does not depend on the size of the file. The content
+    is hashed on the way, which lets an identical video that was already processed
+    be reused instead of queueing the new one. Uploads are refused by admission control
+    before anything is stored while the service is overloaded.
+    """
+
+    def __init__(
+        self,
+        user_repo: IUserRepository,
+        video_repo: IVideoRepository,
+        file_storage: IAsyncFileStorage,
+        job_queue: IVideoJobQueue,
+        deduplicate_video: DeduplicateVideoUC,
+        admission: AdmissionControl,
+    ) -> None:
+        self.user_repo = user_repo
+        self.video_repo = video_repo
+        self.file_storage = file_storage
+        self.job_queue = job_queue
+        self.deduplicate_video = deduplicate_video
+        self.admission = admission
+
+    async def upload(self, data: VideoUploadDTO) -> VideoUploadedDTO:
+        """Stores the source file of a new video and queues it for processing.
+
+        Raises:
+            UserNotFoundError: If the user does not exist.
+            InvalidVideoUploadError: If the file name is invalid or the file is empty.
+            ServiceOverloadedError: If the service is overloaded.
+            TooManyQueuedVideosError: If the user has too many videos in the queue.
+        """
+        user = await self.user_repo.find_by_external_id(data.user_id)
+        if not user:
+            raise UserNotFoundError(user_id=data.user_id)
+
+        await self.admission.admit_video(user)
+        self.admission.admit_transfer()
+
+        external_id = ExternalEntityId()
+        video = await self.video_repo.insert(
+            Video(
+                external_id=external_id,
+                user=user,
+                filename=source_file_key(str(external_id), data.filename),
+                status=VideoStatus.PENDING_UPLOAD,
+                processed_file=None,
+                options=data.options,
+                priority=data.priority,
+            )
+        )
+
+        hasher = ContentHasher()
+        try:
+            await self.file_storage.upload_stream(
+                video.filename, hasher.hash_stream(self.admission.receive(data.content))
+            )
+        except BaseException:
+            await self._mark_failed(video)
+            raise
+
+        if not hasher.size:
+            await self._mark_failed(video)
+            raise InvalidVideoUploadError(message="O arquivo esta vazio")
+
+        video.size = hasher.size
+        video.upload_offset = hasher.size
+        if not await self.deduplicate_video.deduplicate(video, hasher.hexdigest()):
+            await self.job_queue.enqueue(video)
+
+        return VideoUploadedDTO(video_id=str(video.external_id), status=video.status)
+
+    async def _mark_failed(self, video: Video) -> None:
+        await self.video_repo.transition(video, VideoStatus.FAILED)
+
+
+__all__ = ["UploadVideoUC"]
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class VideoProgressDTO:
+    """An update on the processing of a video."""
+
+    video_id: str
+    stage: str
+    frames: int
+    """The number of frames extracted so far."""
+    total_frames: int | None
+    """An estimate of the number of frames, once known; an upper bound in scene change mode."""
+
+
+__all__ = ["VideoProgressDTO"]
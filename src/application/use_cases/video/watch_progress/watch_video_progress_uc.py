@@ -0,0 +1,39 @@
+from typing import AsyncIterator
+
+from src.application.error import UserNotFoundError
+from src.application.interfaces import IVideoProgressChannel
+from src.application.use_cases.video.watch_progress.dto import VideoProgressDTO
+from src.domain.user.repository import IUserRepository
+
+
+class WatchVideoProgressUC:
+    """Use-case for following the processing of the videos of a user as it happens."""
+
+    def __init__(self, user_repo: IUserRepository, progress_channel: IVideoProgressChannel) -> None:
+        self.user_repo = user_repo
+        self.progress_channel = progress_channel
+
+    async def watch(self, user_id: str) -> AsyncIterator[VideoProgressDTO]:
+        """Checks the user and returns the updates on their videos, from now on.
+
+        The updates never end on their own; closing the iterator stops them.
+
+        Raises:
+            UserNotFoundError: If the user does not exist.
+        """
+        if not await self.user_repo.find_by_external_id(user_id):
+            raise UserNotFoundError(user_id=user_id)
+
+        return self._updates(user_id)
+
+    async def _updates(self, user_id: str) -> AsyncIterator[VideoProgressDTO]:
+        async for progress in self.progress_channel.subscribe(user_id):
+            yield VideoProgressDTO(
+                video_id=progress.video_id,
+                stage=progress.stage,
+                frames=progress.frames,
+                total_frames=progress.total_frames,
+            )
+
+
+__all__ = ["WatchVideoProgressUC"]
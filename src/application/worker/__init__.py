@@ -0,0 +1,9 @@
+"""Worker.
+
+This module runs the video processing outside the API: a pool of processes, each one
+taking jobs from the video job queue with a bounded number of jobs at a time.
+"""
+
+from .worker import run_worker, run_workers
+
+__all__ = ["run_worker", "run_workers"]
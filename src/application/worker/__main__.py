@@ -0,0 +1,9 @@
+from src.application.worker import run_workers
+from src.config.settings import settings
+
+if __name__ == "__main__":
+    run_workers(
+        processes=settings.WORKER_PROCESSES,
+        concurrency=settings.WORKER_CONCURRENCY,
+        poll_interval=settings.WORKER_POLL_INTERVAL,
+    )
@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import multiprocessing
+import signal
+from contextlib import suppress
+from dataclasses import dataclass
+
+from src.application.di import dependency_injector
+from src.application.interfaces import IQueueMetrics, IVideoJobQueue
+from src.application.use_cases.video.process.dto import VideoProcessedDTO
+from src.application.use_cases.video.process.process_video_uc import ProcessVideoUC
+from src.config.settings import settings
+from src.domain.video import Video
+from src.infra.database.beanie import initialize_database
+
+logger = logging.getLogger(__name__)
+
+_MAX_CLAIM_BACKOFF = 30.0
+"""The longest wait, in seconds, of a consumer after failing to claim a video."""
+
+
+@dataclass(kw_only=True, slots=True)
+class _Slots:
+    """The consumers of a worker process, and how many of them hold a video."""
+
+    total: int
+    busy: int = 0
+
+
+async def run_worker(concurrency: int, poll_interval: float, stop: asyncio.Event) -> None:
+    """Processes queued videos until `stop` is set.
+
+    Each of the `concurrency` consumers claims one video at a time, so at most that many
+    videos are processed at once by this process. Consumers that find the queue empty
+    wait `poll_interval` seconds before trying again.
+
+    The leases of the videos being processed are renewed three times per
+    `WORKER_LEASE_SECONDS`, and as often the videos whose lease expired, because
+    their worker died, are put back in the queue. The number of busy consumers is
+    reported to the queue metrics as often, and the counts of videos by status are
+    rebuilt every `QUEUE_METRICS_RECOUNT_SECONDS` by one of the workers.
+
+    Args:
+        concurrency: The maximum number of videos processed at the same time.
+        poll_interval: For how many seconds to wait when the queue is empty.
+        stop: An event that makes the consumers exit once their current video is done.
+    """
+    async with initialize_database(settings.DB_URI, settings.DB_NAME):
+        job_queue = dependency_injector.get(IVideoJobQueue)
+        process_video = dependency_injector.get(ProcessVideoUC)
+        queue_metrics = dependency_injector.get(IQueueMetrics)
+        heartbeat_interval = settings.WORKER_LEASE_SECONDS / 3
+        slots = _Slots(total=concurrency)
+
+        await asyncio.gather(
+            _reclaim_expired(job_queue, heartbeat_interval, stop),
+            _report_metrics(queue_metrics, slots, heartbeat_interval, stop),
+            *(
+                _consume(job_queue, process_video, slots, poll_interval, heartbeat_interval, stop)
+                for _ in range(concurrency)
+            ),
+        )
+
+
+async def _reclaim_expired(job_queue: IVideoJobQueue, interval: float, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            if reclaimed := await job_queue.reclaim_expired():
+                logger.warning("Put %d videos with expired leases back in the queue", reclaimed)
+        except Exception:
+            logger.exception("Failed to reclaim expired leases")
+
+        with suppress(TimeoutError):
+            await asyncio.wait_for(stop.wait(), interval)
+
+
+async def _report_metrics(
+    queue_metrics: IQueueMetrics, slots: _Slots, interval: float, stop: asyncio.Event
+) -> None:
+    while not stop.is_set():
+        try:
+            await queue_metrics.report_worker(slots.total, slots.busy)
+            if await queue_metrics.recount(settings.QUEUE_METRICS_RECOUNT_SECONDS):
+                logger.info("Recounted the videos by status")
+        except Exception:
+            logger.exception("Failed to report the queue metrics")
+
+        with suppress(TimeoutError):
+            await asyncio.wait_for(stop.wait(), interval)
+
+    try:
+        await queue_metrics.remove_worker()
+    except Exception:
+        logger.exception("Failed to remove the worker from the queue metrics")
+
+
+async def _consume(
+    job_queue: IVideoJobQueue,
+    process_video: ProcessVideoUC,
+    slots: _Slots,
+    poll_interval: float,
+    heartbeat_interval: float,
+    stop: asyncio.Event,
+) -> None:
+    """Claims and processes videos until `stop` is set.
+
+    A consumer that fails to claim, because the database is unreachable for example,
+    waits twice as long after every consecutive failure, up to `_MAX_CLAIM_BACKOFF`
+    seconds, instead of exiting.
+    """
+    failures = 0
+    while not stop.is_set():
+        try:
+            video = await job_queue.claim()
+            failures = 0
+        except Exception:
+            logger.exception("Failed to claim a video")
+            video = None
+            failures += 1
+
+        if not video:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    stop.wait(), min(poll_interval * 2**failures, _MAX_CLAIM_BACKOFF)
+                )
+            continue
+
+        slots.busy += 1
+        try:
+            await _process_claimed(job_queue, process_video, video, heartbeat_interval)
+        finally:
+            slots.busy -= 1
+
+
+async def _process_claimed(
+    job_queue: IVideoJobQueue,
+    process_video: ProcessVideoUC,
+    video: Video,
+    heartbeat_interval: float,
+) -> None:
+    try:
+        result = await _process_holding_lease(job_queue, process_video, video, heartbeat_interval)
+    except Exception:
+        logger.exception("Failed to process video %s", video.external_id)
+        return
+
+    if not result:
+        logger.warning("Lost the lease of video %s, dropping it", video.external_id)
+        return
+
+    logger.info(
+        "Video %s processed: %d frames at %.1f fps (decode %.2fs, encode %.2fs)",
+        result.video_id,
+        result.frames,
+        result.frames_per_second,
+        result.decode_seconds,
+        result.encode_seconds,
+    )
+
+
+async def _process_holding_lease(
+    job_queue: IVideoJobQueue,
+    process_video: ProcessVideoUC,
+    video: Video,
+    heartbeat_interval: float,
+) -> VideoProcessedDTO | None:
+    """Processes a video while renewing its lease, or returns None once it is lost.
+
+    The output keys of a video do not depend on the worker, so a worker that carries
+    on in a thread after losing the lease only rewrites the same archive.
+    """
+    processing = asyncio.ensure_future(process_video.process(video))
+    while not processing.done():
+        await asyncio.wait({processing}, timeout=heartbeat_interval)
+        if processing.done():
+            break
+
+        try:
+            renewed = await job_queue.renew(video)
+        except Exception:
+            # The lease is still valid for a while; the next heartbeat tries again.
+            logger.exception("Failed to renew the lease of video %s", video.external_id)
+            continue
+
+        if not renewed:
+            processing.cancel()
+            with suppress(asyncio.CancelledError):
+                await processing
+            return None
+
+    return processing.result()
+
+
+def _worker_process(concurrency: int, poll_interval: float) -> None:
+    """Entry point of a worker process, which stops gracefully on SIGTERM or SIGINT."""
+    logging.basicConfig(level=logging.INFO, format="%(processName)s %(levelname)s %(message)s")
+
+    async def main() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stop.set)
+
+        await run_worker(concurrency, poll_interval, stop)
+
+    asyncio.run(main())
+
+
+def run_workers(processes: int, concurrency: int, poll_interval: float) -> None:
+    """Runs `processes` worker processes and waits for them to exit.
+
+    The queue is shared through the database, so throughput grows with the number of
+    processes and the same command can be run on any number of machines.
+
+    Args:
+        processes: The number of worker processes.
+        concurrency: The maximum number of videos processed at once by each process.
+        poll_interval: For how many seconds a consumer waits when the queue is empty.
+    """
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(
+            target=_worker_process,
+            args=(concurrency, poll_interval),
+            name=f"video-worker-{index}",
+        )
+        for index in range(processes)
+    ]
+
+    for worker in workers:
+        worker.start()
+
+    # The workers receive SIGINT from the terminal themselves; SIGTERM is forwarded.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda *_: [worker.terminate() for worker in workers])
+
+    for worker in workers:
+        worker.join()
+
+
+__all__ = ["run_worker", "run_workers"]
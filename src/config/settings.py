@@ -1,3 +1,5 @@
+from typing import Dict, Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -11,6 +13,136 @@ class EnvSettings(BaseSettings):
     AWS_REGION: str
     S3_BUCKET_NAME: str
 
+    AWS_MAX_POOL_CONNECTIONS: int = 64
+    """The maximum number of pooled connections of each AWS client.
+
+    Should cover `STORAGE_MAX_WORKERS` times `S3_DOWNLOAD_CONCURRENCY`, or requests wait
+    for a free connection.
+    """
+
+    AWS_RETRY_MODE: Literal["legacy", "standard", "adaptive"] = "adaptive"
+    """How failed AWS requests are retried. "adaptive" also slows down on throttling."""
+
+    AWS_MAX_ATTEMPTS: int = 5
+    """The maximum number of attempts of an AWS request, including the first one."""
+
+    AWS_CONNECT_TIMEOUT: float = 5
+    """For how many seconds to wait for a connection to AWS."""
+
+    AWS_READ_TIMEOUT: float = 60
+    """For how many seconds to wait for data from AWS."""
+
+    S3_MULTIPART_THRESHOLD: int = 16 * 1024 * 1024
+    """Files of at least this many bytes are uploaded as multipart uploads."""
+
+    S3_MULTIPART_CHUNKSIZE: int = 8 * 1024 * 1024
+    """The size of each part of a multipart upload (at least 5 MiB)."""
+
+    STORAGE_BACKEND: Literal["s3", "filesystem"] = "s3"
+    """Where files are stored: an S3 bucket or a local directory."""
+
+    FILESYSTEM_STORAGE_ROOT: str = "storage"
+    """The root directory of the files when `STORAGE_BACKEND` is "filesystem"."""
+
+    S3_DOWNLOAD_PART_SIZE: int = 16 * 1024 * 1024
+    """The size of each byte range fetched by parallel downloads."""
+
+    S3_DOWNLOAD_CONCURRENCY: int = 8
+    """The number of byte ranges fetched at the same time by a parallel download."""
+
+    FILE_CACHE_DIR: str | None = None
+    """A local directory where downloaded files are cached. Caching is disabled if unset."""
+
+    FILE_CACHE_MAX_BYTES: int = 10 * 1024 * 1024 * 1024
+    """The maximum size of the local file cache, in bytes."""
+
+    STORAGE_MAX_WORKERS: int = 16
+    """The maximum number of storage transfers running at the same time per process."""
+
+    EMAIL_SENDER_MAX_WORKERS: int = 4
+    """The maximum number of emails being sent at the same time per process."""
+
+    VIDEO_UPLOAD_PART_SIZE: int = 16 * 1024 * 1024
+    """The size of each part of a direct video upload (at least 5 MiB for S3)."""
+
+    PRESIGNED_URL_EXPIRATION: int = 3600
+    """For how many seconds the presigned upload URLs are valid."""
+
+    WORKER_PROCESSES: int = 2
+    """The number of video processing worker processes started by `make worker`."""
+
+    WORKER_CONCURRENCY: int = 2
+    """The maximum number of videos processed at the same time by each worker process."""
+
+    WORKER_POLL_INTERVAL: float = 1.0
+    """For how many seconds an idle worker waits before checking the queue again."""
+
+    QUEUE_USER_WEIGHTS: Dict[str, float] = {}
+    """The share of the workers given to some users, by user id, as a JSON object.
+
+    Every other user has a weight of 1; a user with weight 2 gets twice their share
+    while several users have videos waiting.
+    """
+
+    QUEUE_MAX_PROCESSING_PER_USER: int | None = None
+    """The most videos of a single user processed at the same time, or no limit."""
+
+    WORKER_TEMP_DIR: str | None = None
+    """Where the workers keep the files being processed. Defaults to the system temp dir."""
+
+    WORKER_LEASE_SECONDS: float = 60.0
+    """For how long a worker holds a video without renewing its lease.
+
+    Workers renew the leases of their videos three times per period. When a worker
+    dies, its videos go back to the queue at most this long after its last renewal.
+    """
+
+    WORKER_MAX_ATTEMPTS: int = 3
+    """How many times a video is claimed before a lost lease fails it for good."""
+
+    QUEUE_METRICS_RECOUNT_SECONDS: float = 3600.0
+    """How often the counts of videos by status are rebuilt from the videos collection.
+
+    The counts are kept up to date as videos change status; the recount only fixes the
+    ones left off by processes that died in between. One worker recounts per period.
+    """
+
+    ADMISSION_MAX_QUEUED_VIDEOS: int | None = 10_000
+    """The most videos waiting in the queue before new uploads are refused, or no limit."""
+
+    ADMISSION_MAX_QUEUE_WAIT_SECONDS: float | None = 6 * 3600
+    """The longest the workers may take to drain the queue before new uploads are refused.
+
+    The wait is estimated from the videos finished over `ADMISSION_RATE_WINDOW_SECONDS`.
+    When none finished in that window, uploads are only refused while every worker slot
+    is busy and more videos are queued than there are slots.
+    """
+
+    ADMISSION_MAX_QUEUED_PER_USER: int | None = 1000
+    """The most videos of a single user waiting in the queue, or no limit."""
+
+    ADMISSION_MAX_INFLIGHT_BYTES: int | None = 4 * 1024 * 1024 * 1024
+    """The most bytes being uploaded through each API process at once, or no limit."""
+
+    ADMISSION_RATE_WINDOW_SECONDS: float = 300.0
+    """Over how many seconds the rates used to compute `Retry-After` are measured."""
+
+    PROGRESS_INTERVAL: float = 1.0
+    """How often, in seconds, workers publish the number of frames extracted so far."""
+
+    FRAME_EXTRACTION_PROCESSES: int | None = None
+    """The number of processes decoding segments of a video, per worker process.
+
+    Defaults to the number of CPUs. With several worker processes on the same machine,
+    split the CPUs between them.
+    """
+
+    FRAME_EXTRACTION_SEGMENT_SECONDS: float = 30.0
+    """The length of the segments of a video decoded in parallel, in seconds."""
+
+    FRAME_ENCODING_THREADS: int = 4
+    """The number of threads encoding frames into images, per decoding process."""
+
     DB_URI: str
     """The database connection URI."""
 
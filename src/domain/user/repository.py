@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from src.domain.__shared.interfaces import IRepository
 from src.domain.__shared.value_objects import EmailAddress
+from src.domain.__shared.value_objects.external_entity_id import ExternalEntityId
 from src.domain.user import User
 
 
@@ -13,5 +14,10 @@ class IUserRepository(IRepository[User], ABC):
         """Finds a user by their email address."""
         pass
 
+    @abstractmethod
+    async def find_by_external_id(self, external_id: str | ExternalEntityId) -> User | None:
+        """Finds a user by their external identifier."""
+        pass
+
 
 __all__ = ["IUserRepository"]
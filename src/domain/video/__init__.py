@@ -1,3 +1,19 @@
+from .error import InvalidStatusTransitionError
+from .image_format import ImageFormat
+from .media_info import MediaInfo
+from .processing_options import ProcessingOptions
+from .sampling_mode import SamplingMode
 from .video_entity import Video
+from .video_priority import VideoPriority
+from .video_status import VideoStatus
 
-__all__ = ["Video"]
+__all__ = [
+    "ImageFormat",
+    "InvalidStatusTransitionError",
+    "MediaInfo",
+    "ProcessingOptions",
+    "SamplingMode",
+    "Video",
+    "VideoPriority",
+    "VideoStatus",
+]
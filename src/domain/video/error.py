@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from src.domain.__shared.error import DomainError
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class InvalidStatusTransitionError(DomainError):
+    """Exception raised when a video is moved to a status it cannot reach from its own."""
+
+    message: str = "Transicao de status invalida"
+    current: str
+    target: str
+
+
+__all__ = ["InvalidStatusTransitionError"]
@@ -0,0 +1,13 @@
+from enum import StrEnum
+
+
+class ImageFormat(StrEnum):
+    """The image formats the extracted frames can be saved in."""
+
+    JPEG = "jpeg"
+    WEBP = "webp"
+    PNG = "png"
+    """Lossless, so the image quality is ignored."""
+
+
+__all__ = ["ImageFormat"]
@@ -0,0 +1,43 @@
+import math
+from typing import Tuple
+
+from src.domain.__shared.validator import ValidationResult
+from src.domain.__shared.value_objects import ValueObject, value_object
+from src.domain.video.media_info_validator import MediaInfoValidatorFactory
+
+
+@value_object
+class MediaInfo(ValueObject):
+    """The properties of the video stream of a source file.
+
+    Attributes:
+        duration: The length of the video, in seconds, if the container declares it.
+        frame_rate: The average number of frames per second, if known.
+        width: The width of the frames, in pixels.
+        height: The height of the frames, in pixels.
+        codec: The name of the codec of the video stream.
+        keyframes: The times of the keyframes, in seconds, in ascending order. Decoding
+            can only start at a keyframe, so these are the points a video can be split
+            at without decoding frames outside of each part.
+    """
+
+    duration: float | None = None
+    frame_rate: float | None = None
+    width: int
+    height: int
+    codec: str
+    keyframes: Tuple[float, ...] = ()
+
+    def _validate(self) -> ValidationResult:
+        return MediaInfoValidatorFactory.create().validate(self)
+
+    def estimated_frames(self, frame_interval: float, max_frames: int | None = None) -> int | None:
+        """The number of frames sampled every `frame_interval` seconds, if the duration is known."""
+        if self.duration is None:
+            return None
+
+        frames = max(1, math.ceil(self.duration / frame_interval))
+        return min(frames, max_frames or frames)
+
+
+__all__ = ["MediaInfo"]
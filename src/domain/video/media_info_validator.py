@@ -0,0 +1,28 @@
+from typing import Tuple, Type
+
+from pydantic import BaseModel, Field
+
+from src.domain.__shared.validator import IPydanticValidator
+
+
+class MediaInfoValidationRule(BaseModel):
+    duration: float | None = Field(default=None, ge=0)
+    frame_rate: float | None = Field(default=None, gt=0)
+    width: int = Field(gt=0)
+    height: int = Field(gt=0)
+    codec: str
+    keyframes: Tuple[float, ...]
+
+
+class MediaInfoValidator(IPydanticValidator):
+    def get_pydantic_model(self) -> Type[MediaInfoValidationRule]:
+        return MediaInfoValidationRule
+
+
+class MediaInfoValidatorFactory:  # noqa: D101
+    @staticmethod
+    def create() -> MediaInfoValidator:  # noqa: D102
+        return MediaInfoValidator()
+
+
+__all__ = ["MediaInfoValidatorFactory"]
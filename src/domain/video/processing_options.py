@@ -0,0 +1,49 @@
+import hashlib
+import json
+from dataclasses import asdict
+
+from src.domain.__shared.validator import ValidationResult
+from src.domain.__shared.value_objects import ValueObject, value_object
+from src.domain.video.image_format import ImageFormat
+from src.domain.video.processing_options_validator import ProcessingOptionsValidatorFactory
+from src.domain.video.sampling_mode import SamplingMode
+
+
+@value_object
+class ProcessingOptions(ValueObject):
+    """The parameters used to extract the frames of a video.
+
+    Attributes:
+        frame_interval: The number of seconds between two sampled frames.
+        sampling_mode: Whether every sampled frame is kept, or only scene changes.
+        scene_threshold: The mean difference of brightness, from 0 to 1, between a
+            sampled frame and the previous one for it to be a scene change.
+        max_frames: The maximum number of frames kept, or None for no limit.
+        image_format: The format the frames are saved in.
+        image_quality: The quality of lossy formats, from 1 to 100.
+        frame_width: The width frames are scaled down to, keeping their aspect
+            ratio, or None to keep their size.
+    """
+
+    frame_interval: float = 1.0
+    sampling_mode: str = SamplingMode.INTERVAL
+    scene_threshold: float = 0.1
+    max_frames: int | None = None
+    image_format: str = ImageFormat.JPEG
+    image_quality: int = 90
+    frame_width: int | None = None
+
+    def _validate(self) -> ValidationResult:
+        return ProcessingOptionsValidatorFactory.create().validate(self)
+
+    def processing_key(self) -> str:
+        """Returns a stable key that identifies this set of parameters.
+
+        Two videos with the same content and the same key produce the same frames, so
+        the result of one can be reused by the other.
+        """
+        canonical = json.dumps(asdict(self), sort_keys=True)
+        return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+__all__ = ["ProcessingOptions"]
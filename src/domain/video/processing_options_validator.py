@@ -0,0 +1,31 @@
+from typing import Literal, Type
+
+from pydantic import BaseModel, Field
+
+from src.domain.__shared.validator import IPydanticValidator
+from src.domain.video.image_format import ImageFormat
+from src.domain.video.sampling_mode import SamplingMode
+
+
+class ProcessingOptionsValidationRule(BaseModel):
+    frame_interval: float = Field(gt=0)
+    sampling_mode: Literal[*SamplingMode]  # type: ignore[valid-type]
+    scene_threshold: float = Field(gt=0, le=1)
+    max_frames: int | None = Field(default=None, gt=0)
+    image_format: Literal[*ImageFormat]  # type: ignore[valid-type]
+    image_quality: int = Field(ge=1, le=100)
+    frame_width: int | None = Field(default=None, gt=0)
+
+
+class ProcessingOptionsValidator(IPydanticValidator):
+    def get_pydantic_model(self) -> Type[ProcessingOptionsValidationRule]:
+        return ProcessingOptionsValidationRule
+
+
+class ProcessingOptionsValidatorFactory:  # noqa: D101
+    @staticmethod
+    def create() -> ProcessingOptionsValidator:  # noqa: D102
+        return ProcessingOptionsValidator()
+
+
+__all__ = ["ProcessingOptionsValidatorFactory"]
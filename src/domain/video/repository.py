@@ -0,0 +1,93 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+from src.domain.__shared.interfaces import IRepository
+from src.domain.__shared.value_objects.external_entity_id import ExternalEntityId
+from src.domain.video import Video, VideoStatus
+
+
+class IVideoRepository(IRepository[Video], ABC):
+    """Repository for the video Entity."""
+
+    @abstractmethod
+    async def find_by_external_id(self, external_id: str | ExternalEntityId) -> Video | None:
+        """Finds a video by its external identifier."""
+        pass
+
+    @abstractmethod
+    async def find_many_by_external_ids(
+        self, external_ids: Sequence[str | ExternalEntityId]
+    ) -> List[Video]:
+        """Finds the videos with any of the given external identifiers.
+
+        Args:
+            external_ids (Sequence[str | ExternalEntityId]): The external identifiers.
+
+        Returns:
+            List[Video]: The videos found, in no particular order.
+        """
+        pass
+
+    @abstractmethod
+    async def insert_many(self, entities: Sequence[Video]) -> List[Video]:
+        """Creates several videos with a single write.
+
+        Args:
+            entities (Sequence[Video]): The videos to be created.
+
+        Returns:
+            List[Video]: The created videos, in the same order.
+        """
+        pass
+
+    @abstractmethod
+    async def advance_upload_offset(self, entity: Video, new_offset: int) -> bool:
+        """Moves the committed upload offset forward, if nobody else did it first.
+
+        The offset is only changed if it still holds `entity.upload_offset`, so two
+        concurrent uploads of the same bytes cannot both commit them.
+
+        Args:
+            entity (Video): The video being uploaded, with the offset it was read with.
+            new_offset (int): The offset after the bytes that were just stored.
+
+        Returns:
+            bool: True if the offset was moved, False if it had changed meanwhile.
+        """
+        pass
+
+    @abstractmethod
+    async def transition(self, entity: Video, status: VideoStatus) -> bool:
+        """Moves a video to another status and persists its mutable fields, atomically.
+
+        The video is only changed if it is still in `entity.status`, so when concurrent
+        workers or requests move the same video, exactly one of them succeeds.
+
+        Args:
+            entity (Video): The video, with the status it was read with.
+            status (VideoStatus): The status to move the video to.
+
+        Returns:
+            bool: True if the video was moved, False if its status had changed meanwhile.
+
+        Raises:
+            InvalidStatusTransitionError: If the video cannot reach `status` from its own.
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, entity: Video) -> Video:
+        """Persists the mutable fields of a video, except its status.
+
+        The status only changes through `transition`.
+
+        Args:
+            entity (Video): The video to be updated. It must have been inserted before.
+
+        Returns:
+            Video: The updated video.
+        """
+        pass
+
+
+__all__ = ["IVideoRepository"]
@@ -0,0 +1,15 @@
+from enum import StrEnum
+
+
+class SamplingMode(StrEnum):
+    """How the frames kept from a video are chosen."""
+
+    INTERVAL = "interval"
+    """One frame every `frame_interval` seconds."""
+
+    SCENE_CHANGE = "scene_change"
+    """Among the frames sampled every `frame_interval` seconds, only those that differ
+    enough from the previous one."""
+
+
+__all__ = ["SamplingMode"]
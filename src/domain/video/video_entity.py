@@ -1,9 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 
 from src.domain.__shared.entity import Entity
 from src.domain.__shared.validator import ValidationResult
 from src.domain.user import User
+from src.domain.video.error import InvalidStatusTransitionError
+from src.domain.video.media_info import MediaInfo
+from src.domain.video.processing_options import ProcessingOptions
 from src.domain.video.video_entity_validator import VideoValidatorFactory
+from src.domain.video.video_priority import VideoPriority
+from src.domain.video.video_status import VideoStatus
 
 
 @dataclass(kw_only=True, slots=True)
@@ -12,8 +18,33 @@ class Video(Entity):
 
     user: User
     filename: str
-    status: str
+    status: VideoStatus
     processed_file: str | None
+    upload_id: str | None = None
+    size: int | None = None
+    """The size of the source file, in bytes, as declared when the upload started."""
+    upload_part_size: int | None = None
+    upload_offset: int = 0
+    """How many bytes of the source file were durably stored so far."""
+    options: ProcessingOptions = field(default_factory=ProcessingOptions)
+    content_hash: str | None = None
+    """The SHA-256 of the source file, once it is known."""
+    priority: VideoPriority = VideoPriority.NORMAL
+    worker_id: str | None = None
+    """The worker holding the lease of the video while it is processed."""
+    lease_expires_at: datetime | None = None
+    """When the lease ends unless the worker renews it."""
+    media: MediaInfo | None = None
+    """The properties of the source file, once it was probed."""
+
+    def check_transition(self, status: VideoStatus) -> None:
+        """Ensures the video may move from its current status to `status`.
+
+        Raises:
+            InvalidStatusTransitionError: If the transition is not allowed.
+        """
+        if not self.status.can_transition_to(status):
+            raise InvalidStatusTransitionError(current=self.status, target=status)
 
     def _validate(self) -> ValidationResult:
         return VideoValidatorFactory.create().validate(self)
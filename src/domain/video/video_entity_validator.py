@@ -1,16 +1,31 @@
+from datetime import datetime
 from typing import Type
 
 from pydantic import BaseModel
 
 from src.domain.__shared.validator import IPydanticValidator
 from src.domain.user import User
+from src.domain.video.media_info import MediaInfo
+from src.domain.video.processing_options import ProcessingOptions
+from src.domain.video.video_priority import VideoPriority
+from src.domain.video.video_status import VideoStatus
 
 
 class VideoValidationRule(BaseModel):
     user: User
     filename: str
-    status: str
+    status: VideoStatus
     processed_file: str | None
+    upload_id: str | None
+    size: int | None
+    upload_part_size: int | None
+    upload_offset: int
+    options: ProcessingOptions
+    content_hash: str | None
+    priority: VideoPriority
+    worker_id: str | None
+    lease_expires_at: datetime | None
+    media: MediaInfo | None
 
 
 class VideoValidator(IPydanticValidator):
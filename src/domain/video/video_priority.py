@@ -0,0 +1,28 @@
+from enum import StrEnum
+
+
+class VideoPriority(StrEnum):
+    """The priority class of a video in the processing queue.
+
+    Queued videos of a higher class are always processed before those of a lower one.
+    """
+
+    LOW = "low"
+    """Background work, processed when nothing else is waiting."""
+
+    NORMAL = "normal"
+    """The default class."""
+
+    HIGH = "high"
+    """Work someone is waiting for."""
+
+    @property
+    def rank(self) -> int:
+        """A number that grows with the priority, used to order the queue."""
+        return _RANKS[self]
+
+
+_RANKS = {VideoPriority.LOW: 0, VideoPriority.NORMAL: 1, VideoPriority.HIGH: 2}
+
+
+__all__ = ["VideoPriority"]
@@ -0,0 +1,47 @@
+from enum import StrEnum
+from typing import Dict, FrozenSet
+
+
+class VideoStatus(StrEnum):
+    """The stages a video goes through, from upload to the extracted frames."""
+
+    PENDING_UPLOAD = "pending_upload"
+    """The video was registered, but its file was not fully uploaded yet."""
+
+    QUEUED = "queued"
+    """The file was uploaded and the video waits for a worker."""
+
+    PROCESSING = "processing"
+    """A worker is extracting the frames of the video."""
+
+    DONE = "done"
+    """The frames were extracted and stored in `processed_file`."""
+
+    FAILED = "failed"
+    """The processing failed."""
+
+    def can_transition_to(self, status: "VideoStatus") -> bool:
+        """Tells whether a video in this status may move to `status`."""
+        return status in _TRANSITIONS[self]
+
+
+_TRANSITIONS: Dict[VideoStatus, FrozenSet[VideoStatus]] = {
+    # A video whose content was already processed is done as soon as it is uploaded.
+    VideoStatus.PENDING_UPLOAD: frozenset({
+        VideoStatus.QUEUED,
+        VideoStatus.DONE,
+        VideoStatus.FAILED,
+    }),
+    VideoStatus.QUEUED: frozenset({VideoStatus.PROCESSING}),
+    # A video whose worker stopped renewing its lease goes back to the queue.
+    VideoStatus.PROCESSING: frozenset({
+        VideoStatus.QUEUED,
+        VideoStatus.DONE,
+        VideoStatus.FAILED,
+    }),
+    VideoStatus.DONE: frozenset(),
+    VideoStatus.FAILED: frozenset(),
+}
+
+
+__all__ = ["VideoStatus"]
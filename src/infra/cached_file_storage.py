@@ -0,0 +1,257 @@
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from contextlib import suppress
+from operator import itemgetter
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Sequence, TextIO
+
+from src.application.interfaces import IFileStorage, StoredFileInfo, UploadedPart
+from src.infra.error import StorageError
+from src.infra.local_file import LocalFile
+
+_LOCKS_DIR = ".locks"
+_LOCK_STRIPE_CHARS = 3
+"""The fill locks are shared by the keys whose hashes start alike, in 16^3 stripes."""
+
+
+class CachedFileStorage(IFileStorage):
+    """Keeps recently downloaded files of another `IFileStorage` on the local disk.
+
+    Downloads are served from a local copy while its ETag still matches the one in
+    the wrapped storage, and `open_local` hands out the path of the copy itself. The
+    copies are kept within a byte budget, evicting the least recently used ones first.
+    Uploads go straight to the wrapped storage and invalidate the local copy.
+
+    The directory is the index, so it can be shared by every process of the machine:
+
+    - Misses on a key are serialized with a file lock, so each key is downloaded once,
+      whichever thread or process asks for it.
+    - A copy being read holds a shared lock on its file, and eviction skips the locked
+      copies. Every hit checks that the path still leads to the file it opened.
+
+    A copy replaced because its file changed in the wrapped storage keeps being read
+    by its current readers, but `open_local` paths then lead to the new content.
+    """
+
+    def __init__(self, storage: IFileStorage, cache_dir: str | Path, max_bytes: int) -> None:
+        self.storage = storage
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+        (self.cache_dir / _LOCKS_DIR).mkdir(parents=True, exist_ok=True)
+
+    def upload_file(self, file_name: str, file_data: bytes) -> None:
+        """Uploads a file to the wrapped storage and invalidates its local copy."""
+        self.storage.upload_file(file_name, file_data)
+        self.invalidate(file_name)
+
+    def upload_stream(self, file_name: str, source: BinaryIO | Iterable[bytes]) -> None:
+        """Streams a file to the wrapped storage and invalidates its local copy."""
+        self.storage.upload_stream(file_name, source)
+        self.invalidate(file_name)
+
+    def download_file(self, file_name: str) -> bytes:
+        """Returns the content of a file, downloading it only on a cache miss."""
+        with self._open_cached(file_name) as file:
+            return file.read()
+
+    def stream_file(self, file_name: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Streams a file from its local copy, downloading it only on a cache miss."""
+        with self._open_cached(file_name) as file:
+            yield from iter(lambda: file.read(chunk_size), b"")
+
+    def download_to(self, file_name: str, target: BinaryIO) -> int:
+        """Copies a file from its local copy into `target`."""
+        with self._open_cached(file_name) as file:
+            shutil.copyfileobj(file, target)
+            return file.tell()
+
+    def download_to_path(self, file_name: str, destination: str | Path) -> None:
+        """Copies a file from its local copy into `destination`."""
+        with self._open_cached(file_name) as file, open(destination, "wb") as target:
+            shutil.copyfileobj(file, target)
+
+    def open_local(
+        self,
+        file_name: str,
+        temp_dir: str | Path | None = None,  # noqa: ARG002
+    ) -> LocalFile:
+        """Yields the path of the local copy, which is not evicted inside the context."""
+        file = self._open_cached(file_name)
+        return LocalFile(self._path(file_name), file.close)
+
+    def stat_file(self, file_name: str) -> StoredFileInfo:
+        """Retrieves the metadata of a file from the wrapped storage."""
+        return self.storage.stat_file(file_name)
+
+    def create_multipart_upload(self, file_name: str) -> str:
+        """Starts a multipart upload in the wrapped storage."""
+        return self.storage.create_multipart_upload(file_name)
+
+    def upload_part(
+        self, file_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> UploadedPart:
+        """Uploads a single part to the wrapped storage."""
+        return self.storage.upload_part(file_name, upload_id, part_number, data)
+
+    def presign_upload_part(
+        self, file_name: str, upload_id: str, part_number: int, expires_in: int
+    ) -> str:
+        """Creates a presigned part upload URL in the wrapped storage."""
+        return self.storage.presign_upload_part(file_name, upload_id, part_number, expires_in)
+
+    def list_parts(self, file_name: str, upload_id: str) -> List[UploadedPart]:
+        """Lists the parts stored so far in the wrapped storage."""
+        return self.storage.list_parts(file_name, upload_id)
+
+    def complete_multipart_upload(
+        self, file_name: str, upload_id: str, parts: Sequence[UploadedPart]
+    ) -> None:
+        """Completes a multipart upload and invalidates the local copy of the file."""
+        self.storage.complete_multipart_upload(file_name, upload_id, parts)
+        self.invalidate(file_name)
+
+    def abort_multipart_upload(self, file_name: str, upload_id: str) -> None:
+        """Aborts a multipart upload in the wrapped storage."""
+        self.storage.abort_multipart_upload(file_name, upload_id)
+
+    def invalidate(self, file_name: str) -> None:
+        """Removes the local copy of a file, unless it is being read.
+
+        A copy that is being read is left to fail the ETag check of the next read.
+        """
+        self._remove(self._path(file_name))
+
+    def _open_cached(self, file_name: str) -> BinaryIO:
+        """Opens the up-to-date local copy of a file, downloading it if needed.
+
+        The copy stays locked in shared mode until the file is closed.
+        """
+        info = self.storage.stat_file(file_name)
+        path = self._path(file_name)
+
+        file = self._open_entry(path, info.etag)
+        if file is None:
+            with self._fill_lock(path):
+                file = self._open_entry(path, info.etag) or self._fill(file_name, path, info)
+
+        return file
+
+    def _path(self, file_name: str) -> Path:
+        return self.cache_dir / hashlib.sha256(file_name.encode()).hexdigest()
+
+    @staticmethod
+    def _open_entry(path: Path, etag: str) -> BinaryIO | None:
+        """Opens and locks a copy, if it exists and holds the given version of its file."""
+        try:
+            file = open(path, "rb")  # noqa: SIM115
+        except FileNotFoundError:
+            return None
+
+        fcntl.flock(file, fcntl.LOCK_SH)
+        try:
+            metadata = json.loads(path.with_suffix(".json").read_text())
+            # An eviction may have unlinked the copy before the lock was taken.
+            is_current = path.stat().st_ino == os.fstat(file.fileno()).st_ino
+        except (OSError, ValueError):
+            is_current = False
+
+        if not is_current or metadata.get("etag") != etag:
+            file.close()
+            return None
+
+        with suppress(OSError):
+            os.utime(path)
+        return file
+
+    def _fill(self, file_name: str, path: Path, info: StoredFileInfo) -> BinaryIO:
+        """Downloads a copy while holding the fill lock of its key, and opens it locked."""
+        # Only the holder of the fill lock writes a key, so these were left by a dead fill.
+        for leftover in self.cache_dir.glob(f".{path.name}.*.part"):
+            leftover.unlink(missing_ok=True)
+
+        temp_path = self.cache_dir / f".{path.name}.{uuid.uuid4().hex}.part"
+        try:
+            self.storage.download_to_path(file_name, temp_path)
+            metadata = {"key": file_name, "etag": info.etag, "size": info.size}
+            file = self._publish(temp_path, path, metadata)
+        except OSError as e:
+            raise StorageError(message="Falha no download do arquivo") from e
+        finally:
+            with suppress(FileNotFoundError):
+                temp_path.unlink()
+
+        self._evict(keep=path)
+        return file
+
+    @staticmethod
+    def _publish(temp_path: Path, path: Path, metadata: dict) -> BinaryIO:
+        """Moves a downloaded copy into place, locked before any other reader can see it."""
+        file = open(temp_path, "rb")  # noqa: SIM115
+        try:
+            fcntl.flock(file, fcntl.LOCK_SH)
+            metadata_path = path.with_suffix(".json")
+            metadata_path.unlink(missing_ok=True)
+            os.replace(temp_path, path)
+            metadata_path.write_text(json.dumps(metadata))
+        except BaseException:
+            file.close()
+            raise
+
+        return file
+
+    def _evict(self, keep: Path) -> None:
+        """Removes the least recently used copies not being read, down to the budget."""
+        entries = []
+        for path in self.cache_dir.iterdir():
+            if path.name.startswith(".") or path.suffix:
+                continue
+            with suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=itemgetter(0)):
+            if total_bytes <= self.max_bytes:
+                break
+            if path != keep and self._remove(path):
+                total_bytes -= size
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        """Removes a copy unless it is being read, and tells whether it is gone."""
+        try:
+            file = open(path, "rb")  # noqa: SIM115
+        except FileNotFoundError:
+            path.with_suffix(".json").unlink(missing_ok=True)
+            return True
+
+        with file:
+            try:
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+
+            # The copy may have been replaced by a fill since it was opened.
+            with suppress(FileNotFoundError):
+                if path.stat().st_ino == os.fstat(file.fileno()).st_ino:
+                    path.with_suffix(".json").unlink(missing_ok=True)
+                    path.unlink()
+            return True
+
+    def _fill_lock(self, path: Path) -> TextIO:
+        """Serializes the fills of a key across threads and processes, until closed.
+
+        File locks belong to an open file, so every fill opens the lock file itself.
+        """
+        lock_path = self.cache_dir / _LOCKS_DIR / f"{path.name[:_LOCK_STRIPE_CHARS]}.lock"
+        lock = open(lock_path, "a")  # noqa: SIM115
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+
+__all__ = ["CachedFileStorage"]
@@ -1,4 +1,16 @@
+from .processing_result_pm import ProcessingResultPM
+from .queue_counters_pm import QUEUE_COUNTERS_KEY, QueueCountersPM
 from .user_pm import UserPM
 from .video_pm import VideoPM
+from .video_progress_pm import VideoProgressPM
+from .worker_pm import WorkerPM
 
-__all__ = ["UserPM", "VideoPM"]
+__all__ = [
+    "QUEUE_COUNTERS_KEY",
+    "ProcessingResultPM",
+    "QueueCountersPM",
+    "UserPM",
+    "VideoPM",
+    "VideoProgressPM",
+    "WorkerPM",
+]
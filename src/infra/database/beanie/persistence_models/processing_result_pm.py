@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import ClassVar
+
+import pymongo
+from beanie import Document
+from pydantic import Field
+
+
+class ProcessingResultPM(Document):
+    """The persistence model of a frames archive indexed by content and options."""
+
+    content_hash: str
+    processing_key: str
+    """The fingerprint of the options the archive was produced with."""
+    processed_file: str
+    references: int = 1
+    """How many videos reference the archive."""
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:  # noqa: D106
+        name = "processing_results"
+        indexes: ClassVar[list] = [
+            pymongo.IndexModel(
+                [("content_hash", pymongo.ASCENDING), ("processing_key", pymongo.ASCENDING)],
+                unique=True,
+            ),
+        ]
+
+
+__all__ = ["ProcessingResultPM"]
@@ -0,0 +1,48 @@
+from collections import Counter
+from datetime import datetime
+from typing import ClassVar, Dict, Mapping
+
+import pymongo
+from beanie import Document
+from pydantic import Field
+
+from src.domain.video import VideoStatus
+
+QUEUE_COUNTERS_KEY = "videos"
+"""The key of the single document holding the counts of the videos collection."""
+
+
+class QueueCountersPM(Document):
+    """The persistence model of the number of videos in each status.
+
+    The counts live in a single document, so a status change moves one video between
+    two counts with a single atomic `$inc`, written right after the change itself.
+    """
+
+    key: str = QUEUE_COUNTERS_KEY
+    counts: Dict[VideoStatus, int] = Field(default_factory=dict)
+    recounted_at: datetime | None = None
+    """When the counts were last rebuilt from the videos collection."""
+
+    class Settings:  # noqa: D106
+        name = "queue_counters"
+        indexes: ClassVar[list] = [pymongo.IndexModel("key", unique=True)]
+
+    @classmethod
+    async def add(cls, changes: Mapping[VideoStatus, int]) -> None:
+        """Adds a number of videos, negative to remove them, to the count of each status."""
+        increments = {f"counts.{status}": change for status, change in changes.items() if change}
+        if increments:
+            await cls.get_motor_collection().update_one(
+                {"key": QUEUE_COUNTERS_KEY}, {"$inc": increments}, upsert=True
+            )
+
+    @classmethod
+    async def move(cls, previous: VideoStatus, status: VideoStatus, videos: int = 1) -> None:
+        """Moves a number of videos from the count of a status to the count of another."""
+        changes = Counter({status: videos})
+        changes[previous] -= videos
+        await cls.add(changes)
+
+
+__all__ = ["QUEUE_COUNTERS_KEY", "QueueCountersPM"]
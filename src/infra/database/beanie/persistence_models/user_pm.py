@@ -33,7 +33,7 @@ class UserPM(EntityPM):
             created_at=self.created_at,
             updated_at=self.updated_at,
             username=self.username,
-            email=EmailAddress(self.email),
+            email=EmailAddress(address=self.email),
             hashed_password=self.hashed_password,
         )
 
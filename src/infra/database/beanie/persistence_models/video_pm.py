@@ -1,40 +1,172 @@
-from typing import ClassVar, Self
+from datetime import datetime
+from typing import Any, ClassVar, Dict, List, Self
 
 import pymongo
 from beanie import Link
+from pydantic import BaseModel
 
 from src.domain.__shared.value_objects.external_entity_id import ExternalEntityId
-from src.domain.video import Video
+from src.domain.video import (
+    ImageFormat,
+    MediaInfo,
+    ProcessingOptions,
+    SamplingMode,
+    Video,
+    VideoPriority,
+    VideoStatus,
+)
 from src.infra.database.beanie.persistence_models import UserPM
 from src.infra.database.beanie.persistence_models.entity_pm import EntityPM
 
 
+class ProcessingOptionsPM(BaseModel):
+    """The persistence model of the processing options of a video."""
+
+    frame_interval: float
+    sampling_mode: str = SamplingMode.INTERVAL
+    scene_threshold: float = 0.1
+    max_frames: int | None = None
+    image_format: str = ImageFormat.JPEG
+    image_quality: int = 90
+    frame_width: int | None = None
+
+    def to_domain(self) -> ProcessingOptions:
+        """Converts the persistence model to the domain model."""
+        return ProcessingOptions(
+            frame_interval=self.frame_interval,
+            sampling_mode=self.sampling_mode,
+            scene_threshold=self.scene_threshold,
+            max_frames=self.max_frames,
+            image_format=self.image_format,
+            image_quality=self.image_quality,
+            frame_width=self.frame_width,
+        )
+
+    @classmethod
+    def from_domain(cls, dm: ProcessingOptions) -> Self:
+        """Converts the domain model to the persistence model."""
+        return cls(
+            frame_interval=dm.frame_interval,
+            sampling_mode=dm.sampling_mode,
+            scene_threshold=dm.scene_threshold,
+            max_frames=dm.max_frames,
+            image_format=dm.image_format,
+            image_quality=dm.image_quality,
+            frame_width=dm.frame_width,
+        )
+
+
+class MediaInfoPM(BaseModel):
+    """The persistence model of the properties of the source file of a video."""
+
+    duration: float | None = None
+    frame_rate: float | None = None
+    width: int
+    height: int
+    codec: str
+    keyframes: List[float] = []
+
+    def to_domain(self) -> MediaInfo:
+        """Converts the persistence model to the domain model."""
+        return MediaInfo(
+            duration=self.duration,
+            frame_rate=self.frame_rate,
+            width=self.width,
+            height=self.height,
+            codec=self.codec,
+            keyframes=tuple(self.keyframes),
+        )
+
+    @classmethod
+    def from_domain(cls, dm: MediaInfo) -> Self:
+        """Converts the domain model to the persistence model."""
+        return cls(
+            duration=dm.duration,
+            frame_rate=dm.frame_rate,
+            width=dm.width,
+            height=dm.height,
+            codec=dm.codec,
+            keyframes=list(dm.keyframes),
+        )
+
+
 class VideoPM(EntityPM):
     """The video persistence model."""
 
     filename: str
-    status: str
+    status: VideoStatus
     processed_file: str | None
     user: Link[UserPM]
+    upload_id: str | None = None
+    size: int | None = None
+    upload_part_size: int | None = None
+    upload_offset: int = 0
+    options: ProcessingOptionsPM
+    processing_key: str
+    """The fingerprint of `options`, used to find videos processed the same way."""
+    content_hash: str | None = None
+    priority: VideoPriority = VideoPriority.NORMAL
+    priority_rank: int = VideoPriority.NORMAL.rank
+    """The rank of `priority`, so the queue can be sorted by it."""
+    queue_tag: float | None = None
+    """The virtual start time given to the video by the fair scheduler when queued."""
+    worker_id: str | None = None
+    lease_expires_at: datetime | None = None
+    attempts: int = 0
+    """How many times the video was claimed by a worker."""
+    media: MediaInfoPM | None = None
 
     class Settings:  # noqa: D106
         name = "videos"
         indexes: ClassVar[list] = [
+            pymongo.IndexModel("external_id", unique=True),
             pymongo.IndexModel("filename", unique=True),
-            pymongo.IndexModel("processed_file", unique=True),
+            pymongo.IndexModel("processed_file"),
+            pymongo.IndexModel([("status", pymongo.ASCENDING), ("created_at", pymongo.ASCENDING)]),
+            pymongo.IndexModel([
+                ("status", pymongo.ASCENDING),
+                ("priority_rank", pymongo.DESCENDING),
+                ("queue_tag", pymongo.ASCENDING),
+                ("created_at", pymongo.ASCENDING),
+            ]),
+            pymongo.IndexModel([("user", pymongo.ASCENDING), ("queue_tag", pymongo.DESCENDING)]),
+            pymongo.IndexModel([("queue_tag", pymongo.DESCENDING)]),
+            pymongo.IndexModel([
+                ("status", pymongo.ASCENDING),
+                ("lease_expires_at", pymongo.ASCENDING),
+            ]),
+            pymongo.IndexModel([("status", pymongo.ASCENDING), ("updated_at", pymongo.ASCENDING)]),
+            pymongo.IndexModel([
+                ("status", pymongo.ASCENDING),
+                ("media.duration", pymongo.ASCENDING),
+            ]),
+            pymongo.IndexModel([
+                ("media.codec", pymongo.ASCENDING),
+                ("media.height", pymongo.ASCENDING),
+            ]),
         ]
 
     def to_domain(self) -> Video:
         """Converts the persistence model to the domain model."""
         return Video(
             _id=self.id,
-            external_id=ExternalEntityId(id=self.external_),
+            external_id=ExternalEntityId(id=self.external_id),
             created_at=self.created_at,
             updated_at=self.updated_at,
             user=self.user.to_domain(),  # type: ignore
             filename=self.filename,
             status=self.status,
             processed_file=self.processed_file,
+            upload_id=self.upload_id,
+            size=self.size,
+            upload_part_size=self.upload_part_size,
+            upload_offset=self.upload_offset,
+            options=self.options.to_domain(),
+            content_hash=self.content_hash,
+            priority=self.priority,
+            worker_id=self.worker_id,
+            lease_expires_at=self.lease_expires_at,
+            media=self.media.to_domain() if self.media else None,
         )
 
     @classmethod
@@ -49,7 +181,32 @@ class VideoPM(EntityPM):
             filename=dm.filename,
             status=dm.status,
             processed_file=dm.processed_file,
+            upload_id=dm.upload_id,
+            size=dm.size,
+            upload_part_size=dm.upload_part_size,
+            upload_offset=dm.upload_offset,
+            options=ProcessingOptionsPM.from_domain(dm.options),
+            processing_key=dm.options.processing_key(),
+            content_hash=dm.content_hash,
+            priority=dm.priority,
+            priority_rank=dm.priority.rank,
+            worker_id=dm.worker_id,
+            lease_expires_at=dm.lease_expires_at,
+            media=MediaInfoPM.from_domain(dm.media) if dm.media else None,
         )
 
+    @staticmethod
+    def mutable_fields(dm: Video) -> Dict[Any, Any]:
+        """The fields of a video that may change after it is inserted, except its status."""
+        return {
+            VideoPM.processed_file: dm.processed_file,
+            VideoPM.upload_id: dm.upload_id,
+            VideoPM.size: dm.size,
+            VideoPM.upload_offset: dm.upload_offset,
+            VideoPM.content_hash: dm.content_hash,
+            VideoPM.media: MediaInfoPM.from_domain(dm.media) if dm.media else None,
+            VideoPM.updated_at: dm.updated_at,
+        }
+
 
-__all__ = ["VideoPM"]
+__all__ = ["MediaInfoPM", "ProcessingOptionsPM", "VideoPM"]
@@ -0,0 +1,46 @@
+from typing import Self
+
+from beanie import Document
+
+from src.application.interfaces import ProcessingStage, VideoProgress
+
+
+class VideoProgressPM(Document):
+    """The persistence model of a processing update.
+
+    Updates live in a capped collection: it keeps only the most recent ones and can
+    be followed with a tailable cursor, like a log.
+    """
+
+    user_id: str
+    video_id: str
+    stage: ProcessingStage
+    frames: int = 0
+    total_frames: int | None = None
+
+    class Settings:  # noqa: D106
+        name = "video_progress"
+
+    def to_progress(self) -> VideoProgress:
+        """Converts the persistence model to the update it stores."""
+        return VideoProgress(
+            user_id=self.user_id,
+            video_id=self.video_id,
+            stage=self.stage,
+            frames=self.frames,
+            total_frames=self.total_frames,
+        )
+
+    @classmethod
+    def from_progress(cls, progress: VideoProgress) -> Self:
+        """Converts an update to the persistence model."""
+        return cls(
+            user_id=progress.user_id,
+            video_id=progress.video_id,
+            stage=progress.stage,
+            frames=progress.frames,
+            total_frames=progress.total_frames,
+        )
+
+
+__all__ = ["VideoProgressPM"]
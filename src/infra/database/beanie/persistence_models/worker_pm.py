@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import ClassVar
+
+import pymongo
+from beanie import Document
+
+WORKER_REPORT_TTL = 24 * 3600
+"""For how many seconds the last report of a worker that stopped reporting is kept."""
+
+
+class WorkerPM(Document):
+    """The persistence model of the last report of a worker process."""
+
+    worker_id: str
+    slots: int
+    """The number of videos the process can process at once."""
+    busy_slots: int
+    """The number of videos the process was processing."""
+    reported_at: datetime
+
+    class Settings:  # noqa: D106
+        name = "workers"
+        indexes: ClassVar[list] = [
+            pymongo.IndexModel("worker_id", unique=True),
+            # Workers that died without removing their report are eventually dropped.
+            pymongo.IndexModel("reported_at", expireAfterSeconds=WORKER_REPORT_TTL),
+        ]
+
+
+__all__ = ["WORKER_REPORT_TTL", "WorkerPM"]
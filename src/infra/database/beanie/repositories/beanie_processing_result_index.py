@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from src.application.interfaces import IProcessingResultIndex
+from src.infra.database.beanie.persistence_models import ProcessingResultPM
+
+
+class BeanieProcessingResultIndex(IProcessingResultIndex):
+    """Implementation of IProcessingResultIndex on the processing_results collection.
+
+    Entries are unique by content hash and processing key, so a lookup is a single
+    indexed `find_one_and_update` that also counts the new reference.
+    """
+
+    async def acquire(self, content_hash: str, processing_key: str) -> str | None:
+        """Increments the references of the entry and returns its archive."""
+        document = await ProcessingResultPM.get_motor_collection().find_one_and_update(
+            {"content_hash": content_hash, "processing_key": processing_key},
+            {"$inc": {"references": 1}},
+            projection={"_id": False, "processed_file": True},
+        )
+        return document["processed_file"] if document else None
+
+    async def register(self, content_hash: str, processing_key: str, processed_file: str) -> bool:
+        """Inserts the entry unless one already exists for the content and options."""
+        try:
+            result = await ProcessingResultPM.get_motor_collection().update_one(
+                {"content_hash": content_hash, "processing_key": processing_key},
+                {
+                    "$setOnInsert": {
+                        "processed_file": processed_file,
+                        "references": 1,
+                        "created_at": datetime.now(),
+                    }
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # Another worker inserted the same entry between the lookup and the insert.
+            return False
+
+        return result.upserted_id is not None
+
+    async def release(self, content_hash: str, processing_key: str) -> int:
+        """Decrements the references of the entry, never below zero."""
+        document = await ProcessingResultPM.get_motor_collection().find_one_and_update(
+            {
+                "content_hash": content_hash,
+                "processing_key": processing_key,
+                "references": {"$gt": 0},
+            },
+            {"$inc": {"references": -1}},
+            projection={"_id": False, "references": True},
+            return_document=ReturnDocument.AFTER,
+        )
+        return document["references"] if document else 0
+
+
+__all__ = ["BeanieProcessingResultIndex"]
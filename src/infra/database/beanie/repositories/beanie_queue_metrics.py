@@ -0,0 +1,107 @@
+import asyncio
+import os
+import socket
+from datetime import datetime, timedelta
+
+import pymongo
+
+from src.application.interfaces import IQueueMetrics, QueueMetrics
+from src.domain.video import VideoStatus
+from src.infra.database.beanie.persistence_models import (
+    QUEUE_COUNTERS_KEY,
+    QueueCountersPM,
+    VideoPM,
+    WorkerPM,
+)
+
+
+class BeanieQueueMetrics(IQueueMetrics):
+    """Implementation of IQueueMetrics with MongoDB.
+
+    Reading the metrics costs three small queries: the document of the queue counters,
+    the first queued video in the `(status, updated_at)` index, and the reports of the
+    workers, one document per worker process.
+
+    A counter is updated right after the status change it follows, so a process that
+    dies between the two writes leaves it off by one. `recount` rebuilds the counters
+    from the videos; status changes made while it runs may be miscounted until the
+    next one.
+
+    Args:
+        report_timeout: For how many seconds the report of a worker is counted.
+    """
+
+    def __init__(self, report_timeout: float = 60.0) -> None:
+        self.report_timeout = timedelta(seconds=report_timeout)
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    async def get_metrics(self) -> QueueMetrics:
+        """Reads the counters, the oldest queued video and the recent worker reports."""
+        counters, oldest_queued, workers = await asyncio.gather(
+            QueueCountersPM.find_one(QueueCountersPM.key == QUEUE_COUNTERS_KEY),
+            VideoPM.get_motor_collection().find_one(
+                {"status": VideoStatus.QUEUED},
+                {"_id": False, "updated_at": True},
+                sort=[("updated_at", pymongo.ASCENDING)],
+            ),
+            WorkerPM.find(WorkerPM.reported_at >= datetime.now() - self.report_timeout).to_list(),
+        )
+
+        counts = counters.counts if counters else {}
+        return QueueMetrics(
+            counts={status: counts.get(status, 0) for status in VideoStatus},
+            oldest_queued_at=oldest_queued["updated_at"] if oldest_queued else None,
+            workers=len(workers),
+            slots=sum(worker.slots for worker in workers),
+            busy_slots=sum(worker.busy_slots for worker in workers),
+        )
+
+    async def report_worker(self, slots: int, busy_slots: int) -> None:
+        """Replaces the report of this process, identified by its host and pid."""
+        await WorkerPM.get_motor_collection().update_one(
+            {"worker_id": self._worker_id},
+            {
+                "$set": {
+                    "slots": slots,
+                    "busy_slots": busy_slots,
+                    "reported_at": datetime.now(),
+                }
+            },
+            upsert=True,
+        )
+
+    async def remove_worker(self) -> None:
+        """Deletes the report of this process."""
+        await WorkerPM.find_one(WorkerPM.worker_id == self._worker_id).delete()
+
+    async def recount(self, min_interval: float) -> bool:
+        """Claims the recount with a conditional update, then counts with one aggregation."""
+        now = datetime.now()
+        collection = QueueCountersPM.get_motor_collection()
+        await collection.update_one(
+            {"key": QUEUE_COUNTERS_KEY},
+            {"$setOnInsert": {"counts": {}, "recounted_at": None}},
+            upsert=True,
+        )
+        claimed = await collection.find_one_and_update(
+            {
+                "key": QUEUE_COUNTERS_KEY,
+                "recounted_at": {"$not": {"$gte": now - timedelta(seconds=min_interval)}},
+            },
+            {"$set": {"recounted_at": now}},
+        )
+        if not claimed:
+            return False
+
+        cursor = VideoPM.get_motor_collection().aggregate([
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+        ])
+        counts = {document["_id"]: document["count"] async for document in cursor}
+        await collection.update_one(
+            {"key": QUEUE_COUNTERS_KEY},
+            {"$set": {"counts": {status: counts.get(status, 0) for status in VideoStatus}}},
+        )
+        return True
+
+
+__all__ = ["BeanieQueueMetrics"]
@@ -1,6 +1,7 @@
 from bson import ObjectId
 
 from src.domain.__shared.value_objects import EmailAddress, UniqueEntityId
+from src.domain.__shared.value_objects.external_entity_id import ExternalEntityId
 from src.domain.user import User
 from src.domain.user.repository import IUserRepository
 from src.infra.database.beanie.persistence_models import UserPM
@@ -26,5 +27,11 @@ class BeanieUserRepository(IUserRepository):
 
         return user.to_domain() if user else None
 
+    async def find_by_external_id(self, external_id: str | ExternalEntityId) -> User | None:
+        """Find a user by their external ID."""
+        user: UserPM | None = await UserPM.find_one(UserPM.external_id == str(external_id))
+
+        return user.to_domain() if user else None
+
 
 __all__ = ["BeanieUserRepository"]
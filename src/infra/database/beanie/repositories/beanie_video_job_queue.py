@@ -0,0 +1,364 @@
+import asyncio
+import os
+import socket
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Sequence
+
+import pymongo
+from beanie import BulkWriter
+from beanie.operators import In, Set
+from bson import DBRef, ObjectId
+from pymongo import ReturnDocument
+
+from src.application.interfaces import IVideoJobQueue, QueueLoad
+from src.domain.user import User
+from src.domain.video import Video, VideoStatus
+from src.infra.database.beanie.persistence_models import QueueCountersPM, UserPM, VideoPM
+
+_CLAIM_ORDER = [
+    ("priority_rank", pymongo.DESCENDING),
+    ("queue_tag", pymongo.ASCENDING),
+    ("created_at", pymongo.ASCENDING),
+]
+"""The order in which queued videos are claimed: by priority class, then fairly."""
+
+
+class BeanieVideoJobQueue(IVideoJobQueue):
+    """Implementation of IVideoJobQueue on the videos collection.
+
+    The collection itself is the queue: queued videos are claimed with a single
+    `find_one_and_update`, which MongoDB applies atomically, so concurrent workers
+    never receive the same video. Jobs survive restarts of the API and the workers.
+
+    The queue is ordered by priority class and then by start-time fair queuing: each
+    queued video gets a virtual start time, the later of the current virtual time of
+    the queue and the start time of the previous video of the same user plus the cost
+    of a video for that user, `1 / weight`. A user who queues hundreds of videos at
+    once spreads them far into the virtual future, while a video queued later by
+    someone else starts at the current virtual time and is claimed within a round,
+    so the wait of small users does not grow with the backlog of large ones.
+
+    Every claim stores a new `worker_id`, made of the host and process of the worker
+    and a random suffix, and a lease expiry. Renewing the lease and finishing the
+    video are conditional on that `worker_id`, so a worker whose lease was reclaimed
+    cannot overwrite the outcome of the worker that took the video over.
+
+    Every status change also moves the video between the queue counters.
+
+    Args:
+        user_weights: The share of the workers given to each user, by external id,
+            relative to the default weight of 1.
+        max_processing_per_user: The most videos of a single user processed at the
+            same time, or None for no limit. Workers claiming at the same moment can
+            each take one more, so it may be briefly exceeded by that many videos.
+        lease_seconds: For how long a claim or a renewal holds a video.
+        max_attempts: How many times a video is claimed before an expired lease fails
+            it instead of putting it back in the queue.
+    """
+
+    def __init__(
+        self,
+        user_weights: Dict[str, float] | None = None,
+        max_processing_per_user: int | None = None,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 3,
+    ) -> None:
+        self.user_weights = user_weights or {}
+        self.max_processing_per_user = max_processing_per_user
+        self.lease = timedelta(seconds=lease_seconds)
+        self.max_attempts = max_attempts
+        self._worker_name = f"{socket.gethostname()}:{os.getpid()}"
+
+    async def enqueue(self, video: Video) -> bool:
+        """Gives a video its virtual start time and moves it to the queue."""
+        video.check_transition(VideoStatus.QUEUED)
+        [queue_tag] = await self._start_tags([video])
+
+        video.updated_at = datetime.now()
+        result = await VideoPM.find_one(
+            VideoPM.id == ObjectId(str(video.id)),
+            VideoPM.status == video.status,
+        ).update(
+            Set({
+                VideoPM.status: VideoStatus.QUEUED,
+                VideoPM.queue_tag: queue_tag,
+                **VideoPM.mutable_fields(video),
+            })
+        )
+
+        if not result.modified_count:
+            return False
+
+        await QueueCountersPM.move(video.status, VideoStatus.QUEUED)
+        video.status = VideoStatus.QUEUED
+        return True
+
+    async def enqueue_many(self, videos: Sequence[Video]) -> List[bool]:
+        """Gives the videos consecutive virtual start times and queues them in one write."""
+        for video in videos:
+            video.check_transition(VideoStatus.QUEUED)
+        queue_tags = await self._start_tags(videos)
+
+        now = datetime.now()
+        bulk_writer = BulkWriter(ordered=False, object_class=VideoPM)
+        for video, queue_tag in zip(videos, queue_tags, strict=True):
+            video.updated_at = now
+            await VideoPM.find_one(
+                VideoPM.id == ObjectId(str(video.id)),
+                VideoPM.status == video.status,
+            ).update(
+                Set({
+                    VideoPM.status: VideoStatus.QUEUED,
+                    VideoPM.queue_tag: queue_tag,
+                    **VideoPM.mutable_fields(video),
+                }),
+                bulk_writer=bulk_writer,
+            )
+        result = await bulk_writer.commit()
+
+        if result and result.modified_count == len(videos):
+            queued = {
+                str(video.id): queue_tag
+                for video, queue_tag in zip(videos, queue_tags, strict=True)
+            }
+        else:
+            queued = await self._queue_tags_of(videos)
+
+        moved: Counter[VideoStatus] = Counter()
+        for video, queue_tag in zip(videos, queue_tags, strict=True):
+            if queued.get(str(video.id)) == queue_tag:
+                moved[video.status] -= 1
+                moved[VideoStatus.QUEUED] += 1
+                video.status = VideoStatus.QUEUED
+        await QueueCountersPM.add(moved)
+        return [video.status == VideoStatus.QUEUED for video in videos]
+
+    @staticmethod
+    async def _queue_tags_of(videos: Sequence[Video]) -> Dict[str, float | None]:
+        """The tags of the videos found in the queue, by id.
+
+        Used when some videos changed status meanwhile: only those holding the tag they
+        were just given were queued by this call.
+        """
+        return {
+            str(document.id): document.queue_tag
+            for document in await VideoPM.find(
+                In(VideoPM.id, [ObjectId(str(video.id)) for video in videos]),
+                VideoPM.status == VideoStatus.QUEUED,
+            ).to_list()
+        }
+
+    async def claim(self) -> Video | None:
+        """Leases the first queued video of a user below the concurrency cap."""
+        query: Dict[str, object] = {"status": VideoStatus.QUEUED}
+        if self.max_processing_per_user:
+            busy_users = await self._busy_users(self.max_processing_per_user)
+            if busy_users:
+                query["user"] = {"$nin": busy_users}
+
+        now = datetime.now()
+        document = await VideoPM.get_motor_collection().find_one_and_update(
+            query,
+            {
+                "$set": {
+                    "status": VideoStatus.PROCESSING,
+                    "worker_id": f"{self._worker_name}:{uuid.uuid4().hex[:8]}",
+                    "lease_expires_at": now + self.lease,
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=_CLAIM_ORDER,
+            return_document=ReturnDocument.AFTER,
+        )
+        if not document:
+            return None
+
+        await QueueCountersPM.move(VideoStatus.QUEUED, VideoStatus.PROCESSING)
+        video = VideoPM.model_validate(document)
+        await video.fetch_link(VideoPM.user)
+        return video.to_domain()
+
+    async def renew(self, video: Video) -> bool:
+        """Extends the lease, if the video is still processing under the same worker id."""
+        lease_expires_at = datetime.now() + self.lease
+        result = await VideoPM.find_one(
+            VideoPM.id == ObjectId(str(video.id)),
+            VideoPM.status == VideoStatus.PROCESSING,
+            VideoPM.worker_id == video.worker_id,
+        ).update(Set({VideoPM.lease_expires_at: lease_expires_at}))
+
+        if not result.modified_count:
+            return False
+
+        video.lease_expires_at = lease_expires_at
+        return True
+
+    async def reclaim_expired(self) -> int:
+        """Fails the expired videos out of attempts, then queues the others again."""
+        now = datetime.now()
+        # Videos claimed before leases existed have none, and are reclaimed as well.
+        expired = {
+            "status": VideoStatus.PROCESSING,
+            "$or": [{"lease_expires_at": {"$lt": now}}, {"lease_expires_at": None}],
+        }
+        released = {"worker_id": None, "lease_expires_at": None, "updated_at": now}
+
+        collection = VideoPM.get_motor_collection()
+        failed = await collection.update_many(
+            {**expired, "attempts": {"$gte": self.max_attempts}},
+            {"$set": {"status": VideoStatus.FAILED, **released}},
+        )
+        # A lease may expire between the two updates, so the attempts are checked again;
+        # `$not` also matches the videos claimed before attempts were counted.
+        requeued = await collection.update_many(
+            {**expired, "attempts": {"$not": {"$gte": self.max_attempts}}},
+            {"$set": {"status": VideoStatus.QUEUED, **released}},
+        )
+        await QueueCountersPM.add({
+            VideoStatus.PROCESSING: -failed.modified_count - requeued.modified_count,
+            VideoStatus.FAILED: failed.modified_count,
+            VideoStatus.QUEUED: requeued.modified_count,
+        })
+        return requeued.modified_count
+
+    async def get_load(self, since: datetime) -> QueueLoad:
+        """Counts the queued videos, and the claimed ones finished since `since`."""
+        collection = VideoPM.get_motor_collection()
+        queued, finished = await asyncio.gather(
+            collection.count_documents({"status": VideoStatus.QUEUED}),
+            # Duplicates are done without ever being claimed, so they say nothing about
+            # the speed of the workers.
+            collection.count_documents({
+                "status": {"$in": [VideoStatus.DONE, VideoStatus.FAILED]},
+                "updated_at": {"$gte": since},
+                "attempts": {"$gte": 1},
+            }),
+        )
+        return QueueLoad(queued=queued, finished=finished)
+
+    async def count_queued(self, user: User) -> int:
+        """Counts the queued videos that reference the user."""
+        return await VideoPM.get_motor_collection().count_documents({
+            "user": self._user_ref(user),
+            "status": VideoStatus.QUEUED,
+        })
+
+    async def complete(self, video: Video, processed_file: str) -> bool:
+        """Marks a video that is still processing as done."""
+        video.processed_file = processed_file
+        return await self._finish(video, VideoStatus.DONE)
+
+    async def fail(self, video: Video) -> bool:
+        """Marks a video that is still processing as failed."""
+        return await self._finish(video, VideoStatus.FAILED)
+
+    async def _start_tags(self, videos: Sequence[Video]) -> List[float]:
+        """The virtual start times of videos being queued, in order.
+
+        The virtual time of the queue is the start time of the first queued video or,
+        when the queue is empty, of the last video ever queued. Videos of the same user
+        follow each other, `1 / weight` apart.
+        """
+        collection = VideoPM.get_motor_collection()
+        projection = {"_id": False, "queue_tag": True}
+        has_tag = {"queue_tag": {"$type": "number"}}
+        users = {str(video.user.id): video.user for video in videos}
+        first_queued, last_queued, *last_of_users = await asyncio.gather(
+            collection.find_one(
+                {"status": VideoStatus.QUEUED, **has_tag},
+                projection,
+                sort=[("queue_tag", pymongo.ASCENDING)],
+            ),
+            collection.find_one(has_tag, projection, sort=[("queue_tag", pymongo.DESCENDING)]),
+            *(
+                collection.find_one(
+                    {"user": self._user_ref(user), **has_tag},
+                    projection,
+                    sort=[("queue_tag", pymongo.DESCENDING)],
+                )
+                for user in users.values()
+            ),
+        )
+
+        virtual_time = (first_queued or last_queued or {"queue_tag": 0.0})["queue_tag"]
+        last_tags = {
+            user_id: last_of_user["queue_tag"] if last_of_user else None
+            for user_id, last_of_user in zip(users, last_of_users, strict=True)
+        }
+        return self._next_tags(videos, virtual_time, last_tags)
+
+    def _next_tags(
+        self,
+        videos: Sequence[Video],
+        virtual_time: float,
+        last_tags: Dict[str, float | None],
+    ) -> List[float]:
+        """The virtual start times of videos, given the state of the queue.
+
+        Args:
+            videos: The videos being queued, in order.
+            virtual_time: The current virtual time of the queue.
+            last_tags: The start time of the last video queued by each user of the
+                videos, by user id, or None for users who never queued one. It is
+                updated with the start times given.
+        """
+        queue_tags = []
+        for video in videos:
+            user_id = str(video.user.id)
+            last_tag = last_tags[user_id]
+            if last_tag is None:
+                queue_tag = virtual_time
+            else:
+                weight = self.user_weights.get(str(video.user.external_id), 1.0)
+                queue_tag = max(virtual_time, last_tag + 1 / weight)
+            last_tags[user_id] = queue_tag
+            queue_tags.append(queue_tag)
+        return queue_tags
+
+    @staticmethod
+    async def _busy_users(limit: int) -> List[DBRef]:
+        """The users with at least `limit` videos being processed."""
+        cursor = VideoPM.get_motor_collection().find(
+            {"status": VideoStatus.PROCESSING}, {"_id": False, "user": True}
+        )
+        processing = Counter([document["user"] async for document in cursor])
+        return [user for user, count in processing.items() if count >= limit]
+
+    @staticmethod
+    def _user_ref(user: User) -> DBRef:
+        """The reference to a user, as stored in `VideoPM.user`."""
+        return DBRef(UserPM.get_collection_name(), ObjectId(str(user.id)))
+
+    @staticmethod
+    async def _finish(video: Video, status: VideoStatus) -> bool:
+        video.check_transition(status)
+        video.updated_at = datetime.now()
+        result = await VideoPM.find_one(
+            VideoPM.id == ObjectId(str(video.id)),
+            VideoPM.status == video.status,
+            VideoPM.worker_id == video.worker_id,
+        ).update(
+            Set({
+                VideoPM.status: status,
+                VideoPM.processed_file: video.processed_file,
+                VideoPM.content_hash: video.content_hash,
+                VideoPM.worker_id: None,
+                VideoPM.lease_expires_at: None,
+                VideoPM.updated_at: video.updated_at,
+            })
+        )
+
+        if not result.modified_count:
+            return False
+
+        await QueueCountersPM.move(video.status, status)
+        video.status = status
+        video.worker_id = None
+        video.lease_expires_at = None
+        return True
+
+
+__all__ = ["BeanieVideoJobQueue"]
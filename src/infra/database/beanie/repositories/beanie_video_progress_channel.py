@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import suppress
+from typing import Any, AsyncIterator, Dict, Mapping, Set
+
+import pymongo
+from pymongo import CursorType
+from pymongo.errors import PyMongoError
+
+from src.application.interfaces import IVideoProgressChannel, VideoProgress
+from src.infra.database.beanie.persistence_models import VideoProgressPM
+
+logger = logging.getLogger(__name__)
+
+
+class BeanieVideoProgressChannel(IVideoProgressChannel):
+    """Implementation of IVideoProgressChannel on a capped MongoDB collection.
+
+    Workers insert updates into the collection. While anyone in this process is
+    subscribed, a single tailable cursor follows the collection and hands each update
+    to the queues of the subscribers of its user, so the database serves one cursor per
+    API process however many clients are watching.
+
+    Args:
+        subscriber_buffer: How many updates a subscriber may have pending before its
+            oldest ones are dropped.
+        retry_interval: For how many seconds to wait before reopening the cursor when
+            it ends, which happens while the collection is empty.
+    """
+
+    def __init__(self, subscriber_buffer: int = 64, retry_interval: float = 1.0) -> None:
+        self.subscriber_buffer = subscriber_buffer
+        self.retry_interval = retry_interval
+        self._subscribers: Dict[str, Set[asyncio.Queue[VideoProgress]]] = defaultdict(set)
+        self._tail_task: asyncio.Task[None] | None = None
+
+    async def publish(self, progress: VideoProgress) -> None:
+        """Inserts an update into the collection, logging instead of raising on failure."""
+        try:
+            await VideoProgressPM.from_progress(progress).insert()
+        except PyMongoError:
+            logger.warning("Failed to publish the progress of video %s", progress.video_id)
+
+    async def subscribe(self, user_id: str) -> AsyncIterator[VideoProgress]:
+        """Registers a queue for the user and yields the updates delivered to it."""
+        queue: asyncio.Queue[VideoProgress] = asyncio.Queue(self.subscriber_buffer)
+        self._subscribers[user_id].add(queue)
+        if self._tail_task is None or self._tail_task.done():
+            self._tail_task = asyncio.create_task(self._tail())
+
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._unsubscribe(user_id, queue)
+
+    def _unsubscribe(self, user_id: str, queue: asyncio.Queue[VideoProgress]) -> None:
+        queues = self._subscribers[user_id]
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+        if not self._subscribers and self._tail_task:
+            self._tail_task.cancel()
+            self._tail_task = None
+
+    async def _tail(self) -> None:
+        """Follows the collection from its newest update, until cancelled."""
+        collection = VideoProgressPM.get_motor_collection()
+        last_id = None
+        with suppress(PyMongoError):
+            newest = await collection.find_one(
+                {}, {"_id": True}, sort=[("_id", pymongo.DESCENDING)]
+            )
+            last_id = newest["_id"] if newest else None
+
+        while True:
+            query = {"_id": {"$gt": last_id}} if last_id else {}
+            cursor = collection.find(query, cursor_type=CursorType.TAILABLE_AWAIT)
+            try:
+                # An empty batch ends the iteration, but the cursor stays open for more.
+                while cursor.alive:
+                    async for document in cursor:
+                        last_id = document["_id"]
+                        self._dispatch(document)
+            except PyMongoError:
+                logger.warning("The progress cursor failed, reopening it")
+
+            await asyncio.sleep(self.retry_interval)
+
+    def _dispatch(self, document: Mapping[str, Any]) -> None:
+        queues = self._subscribers.get(document["user_id"])
+        if not queues:
+            return
+
+        progress = VideoProgressPM.model_validate(document).to_progress()
+        for queue in queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(progress)
+
+
+__all__ = ["BeanieVideoProgressChannel"]
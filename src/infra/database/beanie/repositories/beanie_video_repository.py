@@ -0,0 +1,111 @@
+from collections import Counter
+from datetime import datetime
+from typing import List, Sequence
+
+from beanie.operators import In, Set
+from bson import ObjectId
+
+from src.domain.__shared.value_objects import UniqueEntityId
+from src.domain.__shared.value_objects.external_entity_id import ExternalEntityId
+from src.domain.video import Video, VideoStatus
+from src.domain.video.repository import IVideoRepository
+from src.infra.database.beanie.persistence_models import QueueCountersPM, UserPM, VideoPM
+
+
+class BeanieVideoRepository(IVideoRepository):
+    """Implementation of the VideoRepository using Beanie.
+
+    Inserting videos and changing their status also update the queue counters.
+    """
+
+    async def insert(self, entity: Video) -> Video:
+        """Insert a new video."""
+        video_pm = await VideoPM.from_domain(entity).insert()
+        await QueueCountersPM.add({video_pm.status: 1})
+        return video_pm.to_domain()
+
+    async def find_by_id(self, identifier: str | UniqueEntityId) -> Video | None:
+        """Find a video by its ID."""
+        video: VideoPM | None = await VideoPM.find_one(VideoPM.id == ObjectId(str(identifier)))
+
+        return await self._to_domain(video)
+
+    async def find_by_external_id(self, external_id: str | ExternalEntityId) -> Video | None:
+        """Find a video by its external ID."""
+        video: VideoPM | None = await VideoPM.find_one(VideoPM.external_id == str(external_id))
+
+        return await self._to_domain(video)
+
+    async def find_many_by_external_ids(
+        self, external_ids: Sequence[str | ExternalEntityId]
+    ) -> List[Video]:
+        """Find videos by their external IDs, fetching their users with a single query."""
+        videos = await VideoPM.find(
+            In(VideoPM.external_id, [str(external_id) for external_id in external_ids])
+        ).to_list()
+
+        user_ids = list({video.user.ref.id for video in videos})  # type: ignore[union-attr]
+        users = {user.id: user for user in await UserPM.find(In(UserPM.id, user_ids)).to_list()}
+        for video in videos:
+            video.user = users[video.user.ref.id]  # type: ignore[union-attr,assignment]
+
+        return [video.to_domain() for video in videos]
+
+    async def insert_many(self, entities: Sequence[Video]) -> List[Video]:
+        """Insert several videos with a single `insert_many`."""
+        videos = [VideoPM.from_domain(entity) for entity in entities]
+        result = await VideoPM.insert_many(videos)
+        for video, inserted_id in zip(videos, result.inserted_ids, strict=True):
+            video.id = inserted_id
+        await QueueCountersPM.add(Counter(video.status for video in videos))
+
+        return [video.to_domain() for video in videos]
+
+    async def advance_upload_offset(self, entity: Video, new_offset: int) -> bool:
+        """Move the upload offset forward with a conditional update on its current value."""
+        entity.updated_at = datetime.now()
+        result = await VideoPM.find_one(
+            VideoPM.id == ObjectId(str(entity.id)),
+            VideoPM.upload_offset == entity.upload_offset,
+        ).update(Set({VideoPM.upload_offset: new_offset, VideoPM.updated_at: entity.updated_at}))
+
+        if not result.modified_count:
+            return False
+
+        entity.upload_offset = new_offset
+        return True
+
+    async def transition(self, entity: Video, status: VideoStatus) -> bool:
+        """Move the status with a conditional update on its current value."""
+        entity.check_transition(status)
+        entity.updated_at = datetime.now()
+        result = await VideoPM.find_one(
+            VideoPM.id == ObjectId(str(entity.id)),
+            VideoPM.status == entity.status,
+        ).update(Set({VideoPM.status: status, **VideoPM.mutable_fields(entity)}))
+
+        if not result.modified_count:
+            return False
+
+        await QueueCountersPM.move(entity.status, status)
+        entity.status = status
+        return True
+
+    async def update(self, entity: Video) -> Video:
+        """Update the mutable fields of a video, without rewriting its user link."""
+        entity.updated_at = datetime.now()
+        await VideoPM.find_one(VideoPM.id == ObjectId(str(entity.id))).update(
+            Set(VideoPM.mutable_fields(entity))
+        )
+        return entity
+
+    @staticmethod
+    async def _to_domain(video: VideoPM | None) -> Video | None:
+        if not video:
+            return None
+
+        await video.fetch_link(VideoPM.user)
+        return video.to_domain()
+
+
+__all__ = ["BeanieVideoRepository"]
@@ -5,15 +5,26 @@ the Beanie data models that represent the MongoDB collection documents.
 Beanie models provide ORM functionality to simplify CRUD operations with the database.
 """
 
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Any, AsyncGenerator, Mapping
 
 from beanie import init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import CollectionInvalid
 
-from .persistence_models import UserPM, VideoPM
+from .persistence_models import (
+    ProcessingResultPM,
+    QueueCountersPM,
+    UserPM,
+    VideoPM,
+    VideoProgressPM,
+    WorkerPM,
+)
 
-database_models = [VideoPM, UserPM]
+database_models = [VideoPM, UserPM, VideoProgressPM, ProcessingResultPM, QueueCountersPM, WorkerPM]
+
+capped_collections = {VideoProgressPM: 16 * 1024 * 1024}
+"""The models stored in capped collections, with the size of each collection in bytes."""
 
 
 @asynccontextmanager
@@ -28,6 +39,7 @@ async def initialize_database(
     Establishes an asynchronous connection with MongoDB
      using the URI provided in the settings.
     Select the specified database from the settings.
+    Creates the capped collections that do not exist yet.
     Initializes Beanie for the specified document models.
     This step is crucial for Beanie to operate correctly with MongoDB.
 
@@ -38,6 +50,11 @@ async def initialize_database(
     client = AsyncIOMotorClient(db_uri)
     database = client[db_name]
 
+    for model, size in capped_collections.items():
+        # A collection cannot be made capped once it exists, so it must come first.
+        with suppress(CollectionInvalid):
+            await database.create_collection(model.Settings.name, capped=True, size=size)
+
     # Beanie initialization
     await init_beanie(database, document_models=database_models)
     yield client
@@ -29,4 +29,24 @@ class EmailSenderError(InfrastructureError):
     message: str = "Falha no envio do email"
 
 
-__all__ = ["EmailSenderError", "InfrastructureError", "StorageError"]
+@dataclass(kw_only=True, frozen=True, slots=True)
+class FrameExtractionError(InfrastructureError):
+    """Raised when the frames of a video cannot be extracted."""
+
+    message: str = "Falha na extracao dos quadros do video"
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class MediaProbeError(InfrastructureError):
+    """Raised when the properties of a video cannot be read."""
+
+    message: str = "Falha na leitura das propriedades do video"
+
+
+__all__ = [
+    "EmailSenderError",
+    "FrameExtractionError",
+    "InfrastructureError",
+    "MediaProbeError",
+    "StorageError",
+]
@@ -0,0 +1,28 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import List
+
+from src.application.interfaces.async_email_sender import IAsyncEmailSender
+from src.application.interfaces.email_sender import IEmailSender
+from src.domain.__shared.value_objects.email.email import Email
+
+
+class ExecutorEmailSender(IAsyncEmailSender):
+    """Runs a blocking `IEmailSender` on a bounded executor."""
+
+    def __init__(self, sender: IEmailSender, executor: Executor) -> None:
+        self.sender = sender
+        self.executor = executor
+
+    async def send_email(self, email: Email) -> None:
+        """Sends an email without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self.sender.send_email, email)
+
+    async def send_bulk_emails(self, emails: List[Email]) -> None:
+        """Sends multiple emails without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self.sender.send_bulk_emails, emails)
+
+
+__all__ = ["ExecutorEmailSender"]
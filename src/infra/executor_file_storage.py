@@ -0,0 +1,109 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import AsyncIterable, AsyncIterator, Callable, List, Sequence, TypeVar
+
+from src.application.interfaces import IAsyncFileStorage, IFileStorage, UploadedPart
+from src.infra.multipart_upload_writer import DEFAULT_PART_SIZE, MultipartUploadWriter
+
+T = TypeVar("T")
+
+
+class ExecutorFileStorage(IAsyncFileStorage):
+    """Runs a blocking `IFileStorage` on a bounded executor.
+
+    Every storage call is dispatched to the given executor, whose size bounds how many
+    transfers run at the same time. The event loop only awaits the results, so slow
+    transfers never stall unrelated requests.
+    """
+
+    def __init__(
+        self, storage: IFileStorage, executor: Executor, part_size: int = DEFAULT_PART_SIZE
+    ) -> None:
+        self.storage = storage
+        self.executor = executor
+        self.part_size = part_size
+
+    async def _run(self, func: Callable[..., T], *args: object) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    async def upload_file(self, file_name: str, file_data: bytes) -> None:
+        """Uploads a file to storage."""
+        await self._run(self.storage.upload_file, file_name, file_data)
+
+    async def upload_stream(self, file_name: str, source: AsyncIterable[bytes]) -> None:
+        """Uploads a file from an async stream, one part per executor call.
+
+        Chunks are gathered on the event loop until a full part is available, so the
+        executor is only used for the network transfers, and at most two parts are
+        buffered per upload.
+        """
+        writer = MultipartUploadWriter(self.storage, file_name, part_size=self.part_size)
+        pending = bytearray()
+
+        try:
+            async for chunk in source:
+                pending += chunk
+                if len(pending) >= self.part_size:
+                    await self._run(writer.write, pending)
+                    pending.clear()
+
+            if pending:
+                await self._run(writer.write, pending)
+        except BaseException:
+            await self._run(writer.abort)
+            raise
+
+        await self._run(writer.close)
+
+    async def download_file(self, file_name: str) -> bytes:
+        """Downloads a file from storage."""
+        return await self._run(self.storage.download_file, file_name)
+
+    async def stream_file(
+        self, file_name: str, chunk_size: int = 1024 * 1024
+    ) -> AsyncIterator[bytes]:
+        """Streams a file from storage, reading each chunk on the executor."""
+        chunks = self.storage.stream_file(file_name, chunk_size)
+
+        try:
+            while (chunk := await self._run(next, chunks, None)) is not None:
+                yield chunk
+        finally:
+            await self._run(chunks.close)  # type: ignore[attr-defined]
+
+    async def create_multipart_upload(self, file_name: str) -> str:
+        """Starts a multipart upload and returns its identifier."""
+        return await self._run(self.storage.create_multipart_upload, file_name)
+
+    async def upload_part(
+        self, file_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> UploadedPart:
+        """Uploads a single part of a multipart upload."""
+        return await self._run(self.storage.upload_part, file_name, upload_id, part_number, data)
+
+    async def presign_upload_part(
+        self, file_name: str, upload_id: str, part_number: int, expires_in: int
+    ) -> str:
+        """Creates a URL that lets a client upload a part directly to the storage."""
+        return await self._run(
+            self.storage.presign_upload_part, file_name, upload_id, part_number, expires_in
+        )
+
+    async def list_parts(self, file_name: str, upload_id: str) -> List[UploadedPart]:
+        """Lists the parts stored so far for a multipart upload."""
+        return await self._run(self.storage.list_parts, file_name, upload_id)
+
+    async def complete_multipart_upload(
+        self, file_name: str, upload_id: str, parts: Sequence[UploadedPart]
+    ) -> None:
+        """Assembles the uploaded parts into the final file."""
+        await self._run(self.storage.complete_multipart_upload, file_name, upload_id, parts)
+
+    async def abort_multipart_upload(self, file_name: str, upload_id: str) -> None:
+        """Discards a multipart upload and every part uploaded so far."""
+        await self._run(self.storage.abort_multipart_upload, file_name, upload_id)
+
+
+__all__ = ["ExecutorFileStorage"]
@@ -0,0 +1,210 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import uuid
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import BinaryIO, Generator, Iterable, Iterator, List, Sequence
+
+from src.application.interfaces import IFileStorage, StoredFileInfo, UploadedPart
+from src.infra.error import StorageError
+from src.infra.local_file import LocalFile
+from src.infra.multipart_upload_writer import iter_chunks
+
+_UPLOADS_DIR = ".uploads"
+
+
+class FileSystemFileStorage(IFileStorage):
+    """Implementation of IFileStorage on a local directory.
+
+    Files are written to a temporary file in the destination directory and renamed over
+    the final path, so readers never see a partially written file. Readers that need a
+    path get the file itself from `open_local`, without copying it.
+    """
+
+    def __init__(self, root: str | Path, chunk_size: int = 1024 * 1024) -> None:
+        self.root = Path(root).resolve()
+        self.chunk_size = chunk_size
+        (self.root / _UPLOADS_DIR).mkdir(parents=True, exist_ok=True)
+
+    def upload_file(self, file_name: str, file_data: bytes) -> None:
+        """Writes a file atomically."""
+        self.upload_stream(file_name, [file_data])
+
+    def upload_stream(self, file_name: str, source: BinaryIO | Iterable[bytes]) -> None:
+        """Writes a file atomically from a file object or an iterable of chunks."""
+        with self._atomic_writer(file_name) as target:
+            for chunk in iter_chunks(source, self.chunk_size):
+                target.write(chunk)
+
+    def download_file(self, file_name: str) -> bytes:
+        """Reads a whole file into memory."""
+        with self._open(file_name) as file:
+            return file.read()
+
+    def stream_file(self, file_name: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Reads a file in chunks of at most `chunk_size` bytes."""
+        with self._open(file_name) as file:
+            yield from iter(lambda: file.read(chunk_size), b"")
+
+    def download_to(self, file_name: str, target: BinaryIO) -> int:
+        """Copies a file into `target`."""
+        with self._open(file_name) as file:
+            shutil.copyfileobj(file, target, self.chunk_size)
+            return file.tell()
+
+    def download_to_path(self, file_name: str, destination: str | Path) -> None:
+        """Copies a file into `destination`, letting the kernel move the bytes."""
+        try:
+            shutil.copyfile(self._path(file_name), destination)
+        except OSError as e:
+            raise StorageError(message="Falha no download do arquivo") from e
+
+    def open_local(
+        self,
+        file_name: str,
+        temp_dir: str | Path | None = None,  # noqa: ARG002
+    ) -> LocalFile:
+        """Yields the path of the file itself, which is already on the local disk."""
+        path = self._path(file_name)
+        if not path.is_file():
+            raise StorageError(message="Arquivo nao encontrado")
+        return LocalFile(path)
+
+    def stat_file(self, file_name: str) -> StoredFileInfo:
+        """Retrieves the size of a file and an ETag derived from its modification time."""
+        try:
+            stat = self._path(file_name).stat()
+        except OSError as e:
+            raise StorageError(message="Falha ao consultar o arquivo") from e
+
+        return StoredFileInfo(size=stat.st_size, etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"')
+
+    def create_multipart_upload(self, file_name: str) -> str:
+        """Creates a directory that holds the parts of the upload."""
+        self._path(file_name)
+        upload_id = uuid.uuid4().hex
+        (self.root / _UPLOADS_DIR / upload_id).mkdir()
+        return upload_id
+
+    def upload_part(
+        self,
+        file_name: str,  # noqa: ARG002
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> UploadedPart:
+        """Stores a part of a multipart upload as its own file, next to its ETag.
+
+        The ETag is removed before the part is rewritten and recorded after it, so a part
+        is listed only once both files are complete.
+        """
+        part_path = self._upload_dir(upload_id) / f"{part_number}.part"
+        etag_path = part_path.with_suffix(".etag")
+        part = UploadedPart(part_number=part_number, etag=self._etag(data), size=len(data))
+        try:
+            etag_path.unlink(missing_ok=True)
+            part_path.write_bytes(data)
+            etag_path.write_text(part.etag, encoding="ascii")
+        except OSError as e:
+            raise StorageError(message="Falha no envio do arquivo") from e
+
+        return part
+
+    def presign_upload_part(
+        self,
+        file_name: str,  # noqa: ARG002
+        upload_id: str,  # noqa: ARG002
+        part_number: int,  # noqa: ARG002
+        expires_in: int,  # noqa: ARG002
+    ) -> str:
+        """Presigned URLs need an object store; the filesystem backend cannot issue them."""
+        raise StorageError(message="Envio direto não suportado por este armazenamento")
+
+    def list_parts(self, file_name: str, upload_id: str) -> List[UploadedPart]:  # noqa: ARG002
+        """Lists the parts stored for a multipart upload from their recorded ETags and sizes."""
+        etag_paths = sorted(
+            self._upload_dir(upload_id).glob("*.etag"), key=lambda path: int(path.stem)
+        )
+        parts = []
+        for etag_path in etag_paths:
+            with suppress(FileNotFoundError):
+                parts.append(self._stored_part(etag_path))
+        return parts
+
+    def complete_multipart_upload(
+        self, file_name: str, upload_id: str, parts: Sequence[UploadedPart]
+    ) -> None:
+        """Concatenates the parts into the final file after checking their ETags."""
+        upload_dir = self._upload_dir(upload_id)
+
+        with self._atomic_writer(file_name) as target:
+            for part in sorted(parts, key=lambda p: p.part_number):
+                self._append_part(upload_dir / f"{part.part_number}.part", part.etag, target)
+
+        shutil.rmtree(upload_dir, ignore_errors=True)
+
+    def abort_multipart_upload(self, file_name: str, upload_id: str) -> None:  # noqa: ARG002
+        """Removes the parts of a multipart upload."""
+        shutil.rmtree(self._upload_dir(upload_id), ignore_errors=True)
+
+    def _path(self, file_name: str) -> Path:
+        path = (self.root / file_name).resolve()
+        if self.root not in path.parents or _UPLOADS_DIR in path.relative_to(self.root).parts:
+            raise StorageError(message="Nome de arquivo inválido")
+        return path
+
+    def _upload_dir(self, upload_id: str) -> Path:
+        upload_dir = self.root / _UPLOADS_DIR / upload_id
+        if not upload_id.isalnum() or not upload_dir.is_dir():
+            raise StorageError(message="Envio de arquivo não encontrado")
+        return upload_dir
+
+    @staticmethod
+    def _stored_part(etag_path: Path) -> UploadedPart:
+        size = etag_path.with_suffix(".part").stat().st_size
+        etag = etag_path.read_text(encoding="ascii")
+        return UploadedPart(part_number=int(etag_path.stem), etag=etag, size=size)
+
+    @staticmethod
+    def _etag(data: bytes) -> str:
+        return f'"{hashlib.md5(data, usedforsecurity=False).hexdigest()}"'
+
+    def _append_part(self, part_path: Path, etag: str, target: BinaryIO) -> None:
+        try:
+            data = part_path.read_bytes()
+        except OSError as e:
+            raise StorageError(message="Parte do arquivo não encontrada") from e
+
+        if self._etag(data) != etag:
+            raise StorageError(message="Parte do arquivo inválida")
+        target.write(data)
+
+    def _open(self, file_name: str) -> BinaryIO:
+        try:
+            return open(self._path(file_name), "rb")  # noqa: SIM115
+        except OSError as e:
+            raise StorageError(message="Falha no download do arquivo") from e
+
+    @contextmanager
+    def _atomic_writer(self, file_name: str) -> Generator[BinaryIO, None, None]:
+        """Writes into a temporary file that replaces `file_name` only on success."""
+        path = self._path(file_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as target:
+                yield target
+                target.flush()
+                os.fsync(target.fileno())
+            os.replace(temp_name, path)
+        except OSError as e:
+            raise StorageError(message="Falha no envio do arquivo") from e
+        finally:
+            with suppress(FileNotFoundError):
+                os.remove(temp_name)
+
+
+__all__ = ["FileSystemFileStorage"]
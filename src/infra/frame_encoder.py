@@ -0,0 +1,125 @@
+import io
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, Iterator, Self, Tuple, TypeVar
+
+import av
+
+from src.application.interfaces import ExtractionStats
+from src.domain.video import ImageFormat, ProcessingOptions
+
+T = TypeVar("T")
+
+_EXTENSIONS: Dict[str, str] = {
+    ImageFormat.JPEG: "jpg",
+    ImageFormat.WEBP: "webp",
+    ImageFormat.PNG: "png",
+}
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class FrameEncoder:
+    """Turns decoded frames into image files.
+
+    Pillow releases the GIL while it compresses an image and FFmpeg does while it
+    scales and converts a frame, so several frames can be encoded in parallel threads.
+
+    Attributes:
+        image_format: The format of the images.
+        quality: The quality of lossy formats, from 1 to 100.
+        width: The width frames are scaled down to, or None to keep their size.
+    """
+
+    image_format: str = ImageFormat.JPEG
+    quality: int = 90
+    width: int | None = None
+
+    @classmethod
+    def from_options(cls, options: ProcessingOptions) -> Self:
+        """Creates the encoder described by the processing options of a video."""
+        return cls(
+            image_format=options.image_format,
+            quality=options.image_quality,
+            width=options.frame_width,
+        )
+
+    @property
+    def extension(self) -> str:
+        """The file name extension of the images."""
+        return _EXTENSIONS[self.image_format]
+
+    def encode(self, frame: av.VideoFrame) -> Tuple[bytes, float]:
+        """Encodes a frame, returning the image and how many seconds it took."""
+        started_at = time.perf_counter()
+
+        if self.width and frame.width > self.width:
+            # Even dimensions keep the scaler happy with subsampled pixel formats.
+            height = max(2, round(frame.height * self.width / frame.width / 2) * 2)
+            frame = frame.reformat(width=self.width, height=height)
+
+        image = io.BytesIO()
+        if self.image_format == ImageFormat.PNG:
+            frame.to_image().save(image, format="PNG")
+        else:
+            frame.to_image().save(image, format=self.image_format.upper(), quality=self.quality)
+
+        return image.getvalue(), time.perf_counter() - started_at
+
+    def encode_in_order(
+        self,
+        frames: Iterable[Tuple[T, av.VideoFrame]],
+        pool: Executor,
+        depth: int,
+        stats: ExtractionStats,
+    ) -> Iterator[Tuple[T, bytes]]:
+        """Encodes frames on a thread pool while the next ones are being decoded.
+
+        At most `depth` frames wait for their encoding at any time, which bounds
+        memory and makes decoding pause when the encoders fall behind. The images are
+        yielded in the order of the frames, each with the value that came with it.
+        The seconds spent decoding and encoding are added to `stats`.
+
+        Args:
+            frames: Pairs of a value and a frame, decoded lazily while iterating.
+            pool: The executor that runs the encoders.
+            depth: The maximum number of frames being encoded at once.
+            stats: The counters that receive the time spent on each stage.
+
+        Yields:
+            Tuple[T, bytes]: The value that came with each frame, and its image.
+        """
+        pending: Deque[Tuple[T, Future[Tuple[bytes, float]]]] = deque()
+        remaining = iter(frames)
+
+        try:
+            while True:
+                started_at = time.perf_counter()
+                item = next(remaining, None)
+                stats.decode_seconds += time.perf_counter() - started_at
+                if item is None:
+                    break
+
+                value, frame = item
+                pending.append((value, pool.submit(self.encode, frame)))
+                if len(pending) >= depth:
+                    yield self._take(pending.popleft(), stats)
+
+            while pending:
+                yield self._take(pending.popleft(), stats)
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _take(
+        item: Tuple[T, Future[Tuple[bytes, float]]], stats: ExtractionStats
+    ) -> Tuple[T, bytes]:
+        value, future = item
+        image, seconds = future.result()
+        stats.encode_seconds += seconds
+        return value, image
+
+
+__all__ = ["FrameEncoder"]
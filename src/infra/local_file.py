@@ -0,0 +1,35 @@
+from pathlib import Path
+from types import TracebackType
+from typing import Callable
+
+
+class LocalFile:
+    """A context manager yielding the local path of a stored file.
+
+    `cleanup` runs when the context exits, to release or remove the local copy.
+    Exceptions raised inside the context pass through untouched, which generator-based
+    context managers cannot do for the frozen exception types of this project.
+
+    Args:
+        path: The local path of the file.
+        cleanup: Called once the path is no longer used.
+    """
+
+    def __init__(self, path: Path, cleanup: Callable[[], object] | None = None) -> None:
+        self.path = path
+        self.cleanup = cleanup
+
+    def __enter__(self) -> Path:
+        return self.path
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.cleanup:
+            self.cleanup()
+
+
+__all__ = ["LocalFile"]
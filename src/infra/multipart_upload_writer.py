@@ -0,0 +1,137 @@
+import io
+from contextlib import suppress
+from types import TracebackType
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Self, Type
+
+from src.application.interfaces import IFileStorage, UploadedPart
+from src.infra.error import StorageError
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+"""The default size of each multipart upload part (S3 requires at least 5 MiB)."""
+
+
+def iter_chunks(source: BinaryIO | Iterable[bytes], chunk_size: int) -> Iterator[bytes]:
+    """Iterates over a file object or an iterable of chunks.
+
+    Args:
+        source: A readable binary file object or an iterable of byte chunks.
+        chunk_size: The size of each read when the source is a file object.
+
+    Yields:
+        bytes: The next non-empty chunk of the source.
+    """
+    if hasattr(source, "read"):
+        yield from iter(lambda: source.read(chunk_size), b"")  # type: ignore[union-attr]
+        return
+
+    for chunk in source:
+        if chunk:
+            yield chunk
+
+
+class MultipartUploadWriter(io.RawIOBase):
+    """A write-only file object that streams its content as a multipart upload.
+
+    Written bytes are accumulated until a full part is available, which is then sent
+    to the storage, so at most one part (plus the chunk being written) is held in
+    memory at any time. Content smaller than a single part is sent with a plain upload.
+
+    Closing the writer completes the upload. Leaving the context manager with an
+    exception aborts it instead, so no orphan parts are left in the storage.
+    """
+
+    def __init__(
+        self, storage: IFileStorage, file_name: str, part_size: int = DEFAULT_PART_SIZE
+    ) -> None:
+        super().__init__()
+        self._storage = storage
+        self._file_name = file_name
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: List[UploadedPart] = []
+        self._aborted = False
+        self.bytes_written = 0
+
+    def writable(self) -> bool:  # noqa: D102
+        return True
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        """Buffers the data and uploads every full part."""
+        if self.closed:
+            raise ValueError("I/O operation on closed writer.")  # noqa: TRY003
+
+        size = memoryview(data).nbytes
+        self._buffer += data
+        self.bytes_written += size
+
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._upload_part(part)
+
+        return size
+
+    def close(self) -> None:
+        """Uploads the remaining bytes and completes the upload."""
+        if self.closed:
+            return
+
+        try:
+            if not self._aborted:
+                self._finish()
+        except StorageError:
+            self.abort()
+            raise
+        finally:
+            super().close()
+
+    def abort(self) -> None:
+        """Discards everything written so far."""
+        self._aborted = True
+        self._buffer.clear()
+
+        if self._upload_id is not None:
+            with suppress(StorageError):
+                self._storage.abort_multipart_upload(self._file_name, self._upload_id)
+
+        super().close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def _upload_part(self, data: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self._storage.create_multipart_upload(self._file_name)
+
+        part = self._storage.upload_part(
+            self._file_name, self._upload_id, len(self._parts) + 1, data
+        )
+        self._parts.append(part)
+
+    def _finish(self) -> None:
+        if self._upload_id is None:
+            self._storage.upload_file(self._file_name, bytes(self._buffer))
+            self._buffer.clear()
+            return
+
+        if self._buffer:
+            part = bytes(self._buffer)
+            self._buffer.clear()
+            self._upload_part(part)
+
+        self._storage.complete_multipart_upload(self._file_name, self._upload_id, self._parts)
+
+
+__all__ = ["DEFAULT_PART_SIZE", "MultipartUploadWriter", "iter_chunks"]
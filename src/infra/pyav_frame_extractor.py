@@ -0,0 +1,401 @@
+import bisect
+import io
+import math
+import multiprocessing
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, List, Sequence, Tuple
+
+import av
+import numpy as np
+
+from src.application.interfaces import ExtractionStats, IFrameExtractor
+from src.domain.video import ProcessingOptions, SamplingMode
+from src.infra.error import FrameExtractionError
+from src.infra.frame_encoder import FrameEncoder
+from src.infra.pyav_media_prober import video_duration
+
+_MAX_SEGMENT_FRAMES = 64
+"""The maximum number of frames sampled by a single segment, which bounds its memory."""
+
+_BUCKET_TOLERANCE = 1e-6
+
+_THUMBNAIL_SIZE = (64, 36)
+"""The size frames are scaled down to before comparing them for scene changes."""
+
+_segment_encoders: Executor | None = None
+"""The encoding threads of a pool process, created by its first segment."""
+
+
+class _ZipSink(io.RawIOBase):
+    """A write-only, unseekable target that hands the archive over chunk by chunk.
+
+    `zipfile` writes to unseekable targets by placing the sizes of each entry after
+    its data, so the archive never has to be rewound.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:  # noqa: D102
+        return True
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        """Keeps the written bytes until they are drained."""
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Returns and forgets everything written since the last call."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _sample(
+    container: av.container.InputContainer,
+    interval: float,
+    first_bucket: int = 0,
+    end_bucket: int | None = None,
+) -> Iterator[av.VideoFrame]:
+    """Yields the first frame of every `interval` seconds bucket in a range of buckets.
+
+    Bucket `n` holds the frames shown from `n * interval` seconds on. The buckets are
+    anchored at zero, so any split of the video at bucket boundaries samples exactly
+    the frames a single pass over the video would.
+    """
+    stream = container.streams.video[0]
+    stream.thread_type = "AUTO"
+    if first_bucket:
+        container.seek(
+            int(first_bucket * interval / stream.time_base), stream=stream, backward=True
+        )
+
+    last_bucket = first_bucket - 1
+    for frame in container.decode(stream):
+        if frame.time is None:
+            continue
+
+        # The tolerance keeps frames exactly on a boundary from being lost to rounding.
+        bucket = math.floor(frame.time / interval + _BUCKET_TOLERANCE)
+        if end_bucket is not None and bucket >= end_bucket:
+            break
+        if bucket <= last_bucket:
+            continue
+
+        last_bucket = bucket
+        yield frame
+
+
+def _keyframe_buckets(keyframes: Iterable[float], interval: float) -> List[int]:
+    """The first bucket starting at or after each keyframe, in ascending order.
+
+    A segment starting at one of these buckets seeks back to its keyframe, or to a
+    later one, and decodes less than one interval before its first bucket.
+    """
+    return sorted({math.ceil(time / interval - _BUCKET_TOLERANCE) for time in keyframes})
+
+
+def _next_cut(cuts: Sequence[int], start: int, target: int) -> int:
+    """The end of the segment starting at bucket `start`, ideally `target` buckets long.
+
+    The segment ends at the keyframe bucket closest to its target length, and at most
+    `_MAX_SEGMENT_FRAMES` buckets after its start. Without a keyframe in that reach it
+    ends on a plain bucket, whose segment seeks to the last keyframe before it.
+    """
+    target = min(target, _MAX_SEGMENT_FRAMES)
+    limit = start + _MAX_SEGMENT_FRAMES
+    index = bisect.bisect_left(cuts, start + target)
+    candidates = [cut for cut in cuts[max(0, index - 1) : index + 1] if start < cut <= limit]
+    if not candidates:
+        return start + target
+    return min(candidates, key=lambda cut: abs(cut - start - target))
+
+
+def _thumbnail(frame: av.VideoFrame) -> np.ndarray:
+    """Scales a frame down to a small grayscale image, as signed integers."""
+    width, height = _THUMBNAIL_SIZE
+    return frame.reformat(width=width, height=height, format="gray").to_ndarray().astype(np.int16)
+
+
+def _difference(thumbnail: np.ndarray, previous: np.ndarray) -> float:
+    """The mean absolute difference of brightness of two thumbnails, from 0 to 1."""
+    return float(np.abs(thumbnail - previous).mean()) / 255
+
+
+class _SceneChangeFilter:
+    """Tells which sampled frames differ enough from the previous sampled frame."""
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self.first: np.ndarray | None = None
+        self.last: np.ndarray | None = None
+
+    def score(self, frame: av.VideoFrame) -> float | None:
+        """The difference to the previous frame, or None for the first one."""
+        thumbnail = _thumbnail(frame)
+        score = None if self.last is None else _difference(thumbnail, self.last)
+        if self.first is None:
+            self.first = thumbnail
+        self.last = thumbnail
+        return score
+
+
+@dataclass(kw_only=True, slots=True)
+class _Segment:
+    """The images of a segment, with what is needed to stitch it to the previous one.
+
+    Attributes:
+        images: The images kept, each with its scene change score. The first sampled
+            frame has no score, as it can only be compared with the previous segment.
+        first: The thumbnail of the first sampled frame, in scene change mode.
+        last: The thumbnail of the last sampled frame, in scene change mode.
+        stats: The time the segment spent decoding and encoding.
+    """
+
+    images: List[Tuple[float | None, bytes]]
+    first: np.ndarray | None = None
+    last: np.ndarray | None = None
+    stats: ExtractionStats
+
+
+def _select(
+    frames: Iterable[av.VideoFrame], scenes: _SceneChangeFilter | None
+) -> Iterator[Tuple[float | None, av.VideoFrame]]:
+    """Yields the frames to keep, with their scene change score."""
+    for frame in frames:
+        score = scenes.score(frame) if scenes else None
+        if score is None or score >= scenes.threshold:  # type: ignore[union-attr]
+            yield score, frame
+
+
+def _stitch(
+    segment: _Segment, previous: np.ndarray | None, scene_threshold: float | None
+) -> Iterator[bytes]:
+    """Yields the images of a segment that are kept once it follows the previous one.
+
+    The first sampled frame of a segment is scored against `previous`, the thumbnail of
+    the last sampled frame of the previous segment, which its process could not see.
+    """
+    for score, image in segment.images:
+        if score is None and previous is not None and segment.first is not None:
+            score = _difference(segment.first, previous)
+        if score is None or score >= scene_threshold:  # type: ignore[operator]
+            yield image
+
+
+def _extract_segment(
+    source: str,
+    interval: float,
+    first_bucket: int,
+    end_bucket: int | None,
+    scene_threshold: float | None,
+    encoder: FrameEncoder,
+    encode_threads: int,
+) -> _Segment:
+    """Decodes a range of buckets of a video in a pool process and returns its images."""
+    global _segment_encoders  # noqa: PLW0603
+    if _segment_encoders is None:
+        _segment_encoders = ThreadPoolExecutor(encode_threads, thread_name_prefix="encoder")
+
+    scenes = _SceneChangeFilter(scene_threshold) if scene_threshold else None
+    stats = ExtractionStats()
+    try:
+        with av.open(source) as container:
+            frames = _select(_sample(container, interval, first_bucket, end_bucket), scenes)
+            images = list(
+                encoder.encode_in_order(frames, _segment_encoders, 2 * encode_threads, stats)
+            )
+    except (av.error.FFmpegError, IndexError) as e:
+        raise FrameExtractionError() from e
+
+    if not scenes:
+        return _Segment(images=images, stats=stats)
+    return _Segment(images=images, first=scenes.first, last=scenes.last, stats=stats)
+
+
+class PyAVFrameExtractor(IFrameExtractor):
+    """Implementation of IFrameExtractor that decodes videos with PyAV (FFmpeg).
+
+    A frame is sampled every `frame_interval` seconds of the video and saved as an
+    image in the archive, in the format, quality and width chosen for the video. The
+    images are already compressed, so they are stored in the archive without
+    compressing them again. In scene change mode, a sampled frame is only kept if its
+    downscaled brightness differs from the previous sampled frame by at least
+    `scene_threshold`, so frames of a still scene are skipped before they are even
+    encoded.
+
+    Videos longer than one segment are split into time ranges of about
+    `segment_seconds`, decoded by a pool of `processes` processes. The ranges start
+    at the keyframes found by the probe, so each process seeks right to its range
+    instead of decoding part of the previous one; past the known keyframes, a process
+    decodes from the keyframe before its range. Separately, a range never samples more
+    than 64 frames, which bounds the memory of a segment, and the images are added to
+    the archive in video order as the segments finish. At most two segments per
+    process are kept in memory at any time.
+
+    Within each process, frames are encoded by `encode_threads` threads while the
+    following frames are being decoded, with at most two frames per thread waiting to
+    be encoded. The time spent on each stage is added to the extraction statistics.
+    """
+
+    def __init__(
+        self, processes: int = 1, segment_seconds: float = 30.0, encode_threads: int = 4
+    ) -> None:
+        self.processes = processes
+        self.segment_seconds = segment_seconds
+        self.encode_threads = encode_threads
+        self._pool: Executor | None = None
+        self._pool_lock = threading.Lock()
+        self._encoders = ThreadPoolExecutor(encode_threads, thread_name_prefix="encoder")
+
+    def extract(
+        self,
+        source: Path,
+        options: ProcessingOptions,
+        stats: ExtractionStats,
+        keyframes: Sequence[float] = (),
+    ) -> Iterator[bytes]:
+        """Streams a zip archive with the frames selected by `options`."""
+        sink = _ZipSink()
+        scene_threshold = (
+            options.scene_threshold if options.sampling_mode == SamplingMode.SCENE_CHANGE else None
+        )
+        encoder = FrameEncoder.from_options(options)
+        images = self._images(
+            source,
+            options.frame_interval,
+            options.max_frames,
+            scene_threshold,
+            encoder,
+            stats,
+            keyframes,
+        )
+
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+            for image in islice(images, options.max_frames):
+                archive.writestr(f"frame_{stats.frames:06d}.{encoder.extension}", image)
+                stats.frames += 1
+                yield sink.drain()
+
+        images.close()
+        yield sink.drain()
+
+    def _images(
+        self,
+        source: Path,
+        interval: float,
+        max_frames: int | None,
+        scene_threshold: float | None,
+        encoder: FrameEncoder,
+        stats: ExtractionStats,
+        keyframes: Sequence[float],
+    ) -> Iterator[bytes]:
+        try:
+            with av.open(str(source)) as container:
+                duration = video_duration(container)
+                if duration is not None:
+                    expected = max(1, math.ceil(duration / interval))
+                    stats.expected_frames = min(expected, max_frames or expected)
+
+                segments = self._segments(duration, interval, keyframes)
+                if len(segments) < 2 or self.processes < 2:  # noqa: PLR2004
+                    scenes = _SceneChangeFilter(scene_threshold) if scene_threshold else None
+                    frames = _select(_sample(container, interval), scenes)
+                    depth = 2 * self.encode_threads
+                    for _, image in encoder.encode_in_order(frames, self._encoders, depth, stats):
+                        yield image
+                    return
+        except (av.error.FFmpegError, IndexError) as e:
+            raise FrameExtractionError() from e
+
+        yield from self._images_in_parallel(
+            source, interval, scene_threshold, encoder, stats, segments
+        )
+
+    def _segments(
+        self, duration: float | None, interval: float, keyframes: Sequence[float]
+    ) -> List[Tuple[int, int | None]]:
+        """Splits a video into ranges of sampling buckets of about `segment_seconds`.
+
+        The ranges are cut at keyframes, so the buckets are only a planning unit: any
+        split at bucket boundaries samples the frames of a single pass over the video.
+        The last range is left open, in case the declared duration is short.
+        """
+        if duration is None:
+            return [(0, None)]
+
+        total = max(1, math.ceil(duration / interval))
+        target = max(1, round(self.segment_seconds / interval))
+        cuts = _keyframe_buckets(keyframes, interval)
+        segments: List[Tuple[int, int | None]] = []
+        start = 0
+        while start < total:
+            end = _next_cut(cuts, start, target)
+            segments.append((start, end if end < total else None))
+            start = end
+        return segments
+
+    def _images_in_parallel(
+        self,
+        source: Path,
+        interval: float,
+        scene_threshold: float | None,
+        encoder: FrameEncoder,
+        stats: ExtractionStats,
+        segments: Iterable[Tuple[int, int | None]],
+    ) -> Iterator[bytes]:
+        pool = self._get_pool()
+        remaining = iter(segments)
+        pending: Deque[Future[_Segment]] = deque()
+        previous: np.ndarray | None = None
+
+        def submit(count: int) -> None:
+            for first_bucket, end_bucket in islice(remaining, count):
+                pending.append(
+                    pool.submit(
+                        _extract_segment,
+                        str(source),
+                        interval,
+                        first_bucket,
+                        end_bucket,
+                        scene_threshold,
+                        encoder,
+                        self.encode_threads,
+                    )
+                )
+
+        try:
+            submit(2 * self.processes)
+            while pending:
+                segment = pending.popleft().result()
+                submit(1)
+                stats.decode_seconds += segment.stats.decode_seconds
+                stats.encode_seconds += segment.stats.encode_seconds
+                yield from _stitch(segment, previous, scene_threshold)
+                if segment.last is not None:
+                    previous = segment.last
+        except BrokenProcessPool as e:
+            self._pool = None
+            raise FrameExtractionError() from e
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _get_pool(self) -> Executor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+
+__all__ = ["PyAVFrameExtractor"]
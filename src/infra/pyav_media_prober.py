@@ -0,0 +1,97 @@
+from pathlib import Path
+from typing import List, Sequence
+
+import av
+
+from src.application.interfaces import IMediaProber
+from src.domain.video import MediaInfo
+from src.infra.error import MediaProbeError
+
+MAX_KEYFRAMES = 10_000
+"""The default maximum number of keyframe times kept for a video."""
+
+MAX_DEMUXED_BYTES = 256 * 1024 * 1024
+"""The default maximum size of the video packets read from a container without an index."""
+
+
+def video_duration(container: av.container.InputContainer) -> float | None:
+    """The duration of the video stream in seconds, if the container declares it."""
+    stream = container.streams.video[0]
+    if stream.duration and stream.time_base:
+        return float(stream.duration * stream.time_base)
+    if container.duration:
+        return container.duration / av.time_base
+    return None
+
+
+class PyAVMediaProber(IMediaProber):
+    """Implementation of IMediaProber with PyAV (FFmpeg).
+
+    Opening a file only reads its headers, which declare the duration, frame rate,
+    size and codec. The keyframes are taken from the index the demuxer loads along with
+    the headers, such as the sample tables of MP4 files or the cues of Matroska files.
+    Containers without an index, such as MPEG-TS, are demuxed instead: the packets are
+    read but not decoded, and the scan stops after `max_demuxed_bytes` of video packets.
+    The keyframes of such a file then only cover its start.
+
+    At most `max_keyframes` keyframes are kept, evenly spread over the video, so the
+    document of a long video with frequent keyframes stays small.
+    """
+
+    def __init__(
+        self, max_keyframes: int = MAX_KEYFRAMES, max_demuxed_bytes: int = MAX_DEMUXED_BYTES
+    ) -> None:
+        self.max_keyframes = max_keyframes
+        self.max_demuxed_bytes = max_demuxed_bytes
+
+    def probe(self, source: Path) -> MediaInfo:
+        """Reads the properties of the first video stream of a file."""
+        try:
+            with av.open(str(source)) as container:
+                stream = container.streams.video[0]
+                keyframes = self._indexed_keyframes(stream) or self._demuxed_keyframes(
+                    container, stream
+                )
+                return MediaInfo(
+                    duration=video_duration(container),
+                    frame_rate=float(stream.average_rate) if stream.average_rate else None,
+                    width=stream.codec_context.width,
+                    height=stream.codec_context.height,
+                    codec=stream.codec_context.name,
+                    keyframes=tuple(self._spread(keyframes)),
+                )
+        except (av.error.FFmpegError, IndexError) as e:
+            raise MediaProbeError() from e
+
+    @staticmethod
+    def _indexed_keyframes(stream: av.VideoStream) -> List[float]:
+        return [
+            float(entry.timestamp * stream.time_base)
+            for entry in stream.index_entries
+            if entry.is_keyframe and entry.timestamp is not None
+        ]
+
+    def _demuxed_keyframes(
+        self, container: av.container.InputContainer, stream: av.VideoStream
+    ) -> List[float]:
+        keyframes = []
+        demuxed_bytes = 0
+        for packet in container.demux(stream):
+            demuxed_bytes += packet.size
+            if demuxed_bytes > self.max_demuxed_bytes:
+                break
+            if packet.is_keyframe and packet.pts is not None:
+                keyframes.append(float(packet.pts * stream.time_base))
+        return keyframes
+
+    def _spread(self, keyframes: Sequence[float]) -> Sequence[float]:
+        """Keeps at most `max_keyframes` of the keyframes, evenly picked."""
+        keyframes = sorted(keyframes)
+        if len(keyframes) <= self.max_keyframes:
+            return keyframes
+
+        step = len(keyframes) / self.max_keyframes
+        return [keyframes[int(index * step)] for index in range(self.max_keyframes)]
+
+
+__all__ = ["MAX_DEMUXED_BYTES", "MAX_KEYFRAMES", "PyAVMediaProber", "video_duration"]
@@ -1,42 +1,297 @@
-import io
+import os
+import tempfile
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Sequence, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
-from src.application.interfaces import IFileStorage
+from src.application.interfaces import IFileStorage, StoredFileInfo, UploadedPart
 from src.infra.error import StorageError
+from src.infra.local_file import LocalFile
+from src.infra.multipart_upload_writer import DEFAULT_PART_SIZE, MultipartUploadWriter, iter_chunks
 
 
 class S3FileStorage(IFileStorage):
     def __init__(
         self,
         bucket_name: str,
-        aws_access_key_id: str,
-        aws_secret_access_key: str,
-        region_name: str = 'us-east-1'
+        aws_access_key_id: str | None = None,
+        aws_secret_access_key: str | None = None,
+        region_name: str = 'us-east-1',
+        part_size: int = DEFAULT_PART_SIZE,
+        download_part_size: int = 16 * 1024 * 1024,
+        download_concurrency: int = 8,
+        multipart_threshold: int = DEFAULT_PART_SIZE,
+        session: boto3.Session | None = None,
+        client_config: Config | None = None,
     ):
         self.bucket_name = bucket_name
-        self.s3_client = boto3.client(
-            's3',
-            region_name=region_name,
+        self.part_size = part_size
+        self.download_part_size = download_part_size
+        self.download_concurrency = download_concurrency
+        # Smaller contents would fit in a single part, which is sent with a plain upload.
+        self.multipart_threshold = max(multipart_threshold, part_size)
+        session = session or boto3.Session(
             aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region_name,
         )
+        self.s3_client = session.client('s3', region_name=region_name, config=client_config)
 
     def upload_file(self, file_name: str, file_data: bytes) -> None:
+        """Uploads a file to the bucket.
+
+        Files of at least `multipart_threshold` bytes are sent as a multipart upload,
+        the rest with a single request.
+        """
+        if len(file_data) >= self.multipart_threshold:
+            self.upload_stream(file_name, [file_data])
+            return
+
         try:
-            self.s3_client.put_object(file_data, self.bucket_name, file_name)
+            self.s3_client.put_object(Bucket=self.bucket_name, Key=file_name, Body=file_data)
         except (BotoCoreError, ClientError) as e:
             raise StorageError(message='Falha no envio do arquivo') from e
 
+    def upload_stream(self, file_name: str, source: BinaryIO | Iterable[bytes]) -> None:
+        """Uploads a file to the bucket as a multipart upload of `part_size` parts."""
+        with MultipartUploadWriter(self, file_name, part_size=self.part_size) as writer:
+            for chunk in iter_chunks(source, self.part_size):
+                writer.write(chunk)
+
     def download_file(self, file_name: str) -> bytes:
+        """Downloads a whole object from the bucket into memory."""
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_name)
+            return response['Body'].read()
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message="Falha no download do arquivo") from e
+
+    def stream_file(self, file_name: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Streams an object from the bucket in chunks of at most `chunk_size` bytes."""
+        try:
+            body = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_name)['Body']
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message="Falha no download do arquivo") from e
+
         try:
-            file_obj = io.BytesIO()
-            self.s3_client.download_fileobj(self.bucket_name, file_name, file_obj)
-            file_obj.seek(0)
-            return file_obj.read()
+            yield from body.iter_chunks(chunk_size)
         except (BotoCoreError, ClientError) as e:
             raise StorageError(message="Falha no download do arquivo") from e
+        finally:
+            body.close()
+
+    def download_to(self, file_name: str, target: BinaryIO) -> int:
+        """Writes an object from the bucket into `target` as it is received."""
+        written = 0
+        for chunk in self.stream_file(file_name):
+            target.write(chunk)
+            written += len(chunk)
+
+        return written
+
+    def download_to_path(self, file_name: str, destination: str | Path) -> None:
+        """Downloads an object into a local file using concurrent ranged requests.
+
+        The object is split into `download_part_size` byte ranges which are fetched by
+        up to `download_concurrency` threads. Every range is written with positional
+        writes into a file preallocated to the object size, so the parts can land in
+        any order. All requests are pinned to the object ETag, so a concurrent
+        overwrite fails the download instead of mixing two versions. The first range
+        that fails cancels the ones not started yet and stops the others.
+        """
+        info = self.stat_file(file_name)
+        ranges = [
+            (start, min(start + self.download_part_size, info.size) - 1)
+            for start in range(0, info.size, self.download_part_size)
+        ]
+
+        fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            self._preallocate(fd, info.size)
+            self._download_ranges(file_name, info.etag, fd, ranges)
+        except BaseException:
+            os.close(fd)
+            with suppress(OSError):
+                os.remove(destination)
+            raise
+
+        os.close(fd)
+
+    def open_local(self, file_name: str, temp_dir: str | Path | None = None) -> LocalFile:
+        """Downloads an object into a temporary directory, removed when the context exits."""
+        directory = tempfile.TemporaryDirectory(dir=temp_dir, prefix='s3-')
+        path = Path(directory.name) / 'object'
+        try:
+            self.download_to_path(file_name, path)
+        except BaseException:
+            directory.cleanup()
+            raise
+
+        return LocalFile(path, directory.cleanup)
+
+    def stat_file(self, file_name: str) -> StoredFileInfo:
+        """Retrieves the size and ETag of an object with a HEAD request."""
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=file_name)
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message="Falha ao consultar o arquivo") from e
+
+        return StoredFileInfo(size=response['ContentLength'], etag=response['ETag'])
+
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> None:
+        if size and hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(fd, 0, size)
+        else:
+            os.ftruncate(fd, size)
+
+    def _download_ranges(
+        self, file_name: str, etag: str, fd: int, ranges: Sequence[Tuple[int, int]]
+    ) -> None:
+        aborted = threading.Event()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.download_concurrency, len(ranges))),
+            thread_name_prefix="s3-download",
+        ) as pool:
+            download_range = partial(self._download_range, file_name, etag, fd, aborted)
+            futures = [pool.submit(download_range, byte_range) for byte_range in ranges]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            failure = next((f.exception() for f in done if f.exception()), None)
+            if failure:
+                aborted.set()
+                for future in pending:
+                    future.cancel()
+                raise failure
+
+    def _download_range(
+        self,
+        file_name: str,
+        etag: str,
+        fd: int,
+        aborted: threading.Event,
+        byte_range: Tuple[int, int],
+    ) -> None:
+        """Writes a byte range of an object at its offset, unless the download was aborted."""
+        start, end = byte_range
+        try:
+            body = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=file_name,
+                Range=f'bytes={start}-{end}',
+                IfMatch=etag,
+            )['Body']
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message="Falha no download do arquivo") from e
+
+        try:
+            offset = start
+            for chunk in body.iter_chunks(1024 * 1024):
+                if aborted.is_set():
+                    return
+                view = memoryview(chunk)
+                while view:
+                    written = os.pwrite(fd, view, offset)
+                    view = view[written:]
+                    offset += written
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message="Falha no download do arquivo") from e
+        finally:
+            body.close()
+
+    def create_multipart_upload(self, file_name: str) -> str:
+        """Starts a multipart upload in the bucket."""
+        try:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=file_name
+            )
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message='Falha no envio do arquivo') from e
+
+        return response['UploadId']
+
+    def upload_part(
+        self, file_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> UploadedPart:
+        """Uploads a single part of a multipart upload."""
+        try:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=file_name,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message='Falha no envio do arquivo') from e
+
+        return UploadedPart(part_number=part_number, etag=response['ETag'], size=len(data))
+
+    def presign_upload_part(
+        self, file_name: str, upload_id: str, part_number: int, expires_in: int
+    ) -> str:
+        """Creates a presigned URL for a PUT of a single part."""
+        try:
+            return self.s3_client.generate_presigned_url(
+                'upload_part',
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': file_name,
+                    'UploadId': upload_id,
+                    'PartNumber': part_number,
+                },
+                ExpiresIn=expires_in,
+            )
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message='Falha ao preparar o envio do arquivo') from e
+
+    def list_parts(self, file_name: str, upload_id: str) -> List[UploadedPart]:
+        """Lists the parts stored so far, following the pagination of ListParts."""
+        try:
+            pages = self.s3_client.get_paginator('list_parts').paginate(
+                Bucket=self.bucket_name, Key=file_name, UploadId=upload_id
+            )
+            return [
+                UploadedPart(part_number=part['PartNumber'], etag=part['ETag'], size=part['Size'])
+                for page in pages
+                for part in page.get('Parts', [])
+            ]
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message='Falha ao consultar o envio do arquivo') from e
+
+    def complete_multipart_upload(
+        self, file_name: str, upload_id: str, parts: Sequence[UploadedPart]
+    ) -> None:
+        """Assembles the uploaded parts into the final object."""
+        try:
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_name,
+                UploadId=upload_id,
+                MultipartUpload={
+                    'Parts': [
+                        {'PartNumber': part.part_number, 'ETag': part.etag}
+                        for part in sorted(parts, key=lambda p: p.part_number)
+                    ],
+                },
+            )
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message='Falha no envio do arquivo') from e
+
+    def abort_multipart_upload(self, file_name: str, upload_id: str) -> None:
+        """Aborts a multipart upload, releasing the parts stored so far."""
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=file_name, UploadId=upload_id
+            )
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(message='Falha ao cancelar o envio do arquivo') from e
 
 
 __all__ = ['S3FileStorage']
@@ -1,6 +1,7 @@
 from typing import List
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 from src.application.interfaces.email_sender import IEmailSender
@@ -12,15 +13,22 @@ class SESEmailSender(IEmailSender):
     """Implements the IEmailSender interface using Amazon SES."""
 
     def __init__(
-        self, aws_access_key_id: str, aws_secret_access_key: str, region_name: str = "us-east-1"
+        self,
+        aws_access_key_id: str | None = None,
+        aws_secret_access_key: str | None = None,
+        region_name: str = "us-east-1",
+        session: boto3.Session | None = None,
+        client_config: Config | None = None,
     ) -> None:
         self.region_name = region_name
         try:
-            self.ses_client = boto3.client(
-                "ses",
-                region_name=self.region_name,
+            session = session or boto3.Session(
                 aws_access_key_id=aws_access_key_id,
                 aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name,
+            )
+            self.ses_client = session.client(
+                "ses", region_name=self.region_name, config=client_config
             )
         except (BotoCoreError, ClientError) as e:
             raise EmailSenderError(message=f"Failed to initialize SES client: {e}") from e
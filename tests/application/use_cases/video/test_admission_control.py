@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from src.application.error import ServiceOverloadedError, TooManyQueuedVideosError
+from src.application.interfaces import IQueueMetrics, QueueMetrics
+from src.application.use_cases.video.admission_control import AdmissionControl
+from src.domain.user import User
+from src.domain.video import Video, VideoStatus
+from tests.fakes import InMemoryVideoJobQueue
+
+
+class _FixedQueueMetrics(IQueueMetrics):
+    """Reports the same worker slots on every read."""
+
+    def __init__(self, slots: int, busy_slots: int) -> None:
+        self.metrics = QueueMetrics(workers=1, slots=slots, busy_slots=busy_slots)
+
+    async def get_metrics(self) -> QueueMetrics:
+        return self.metrics
+
+    async def report_worker(self, slots: int, busy_slots: int) -> None:
+        pass
+
+    async def remove_worker(self) -> None:
+        pass
+
+    async def recount(self, min_interval: float) -> bool:  # noqa: ARG002
+        return False
+
+
+def _queue_videos(job_queue: InMemoryVideoJobQueue, user: User, count: int) -> None:
+    for index in range(count):
+        video = Video(
+            user=user,
+            filename=f"videos/{index}/source/video.mp4",
+            status=VideoStatus.PENDING_UPLOAD,
+            processed_file=None,
+        )
+        asyncio.run(job_queue.enqueue(video))
+
+
+def _finish_videos(job_queue: InMemoryVideoJobQueue, count: int) -> None:
+    async def finish() -> None:
+        for _ in range(count):
+            video = await job_queue.claim()
+            assert video
+            await job_queue.complete(video, "frames.zip")
+
+    asyncio.run(finish())
+
+
+def test_admits_while_the_workers_keep_up(job_queue: InMemoryVideoJobQueue, user: User) -> None:
+    _queue_videos(job_queue, user, 4)
+    _finish_videos(job_queue, 2)
+    admission = AdmissionControl(job_queue, max_queued=10, max_queue_wait=600, rate_window=60)
+
+    asyncio.run(admission.admit_video(user))
+
+
+def test_refuses_a_queue_too_deep(job_queue: InMemoryVideoJobQueue, user: User) -> None:
+    _queue_videos(job_queue, user, 3)
+    admission = AdmissionControl(job_queue, max_queued=3)
+
+    with pytest.raises(ServiceOverloadedError):
+        asyncio.run(admission.admit_video(user))
+
+
+def test_refuses_a_queue_too_slow_to_drain(job_queue: InMemoryVideoJobQueue, user: User) -> None:
+    _queue_videos(job_queue, user, 11)
+    _finish_videos(job_queue, 1)
+    # 10 queued videos and the new one at 1 per minute take 660 seconds.
+    admission = AdmissionControl(job_queue, max_queue_wait=300, rate_window=60)
+
+    with pytest.raises(ServiceOverloadedError) as error:
+        asyncio.run(admission.admit_video(user))
+
+    assert error.value.retry_after == 360
+
+
+def test_refuses_a_batch_that_would_make_the_queue_too_slow_to_drain(
+    job_queue: InMemoryVideoJobQueue, user: User
+) -> None:
+    _queue_videos(job_queue, user, 6)
+    _finish_videos(job_queue, 1)
+    # 5 queued videos at 1 per minute take 300 seconds, and every new one 60 more.
+    admission = AdmissionControl(job_queue, max_queue_wait=600, rate_window=60)
+
+    asyncio.run(admission.admit_video(user, count=5))
+    with pytest.raises(ServiceOverloadedError):
+        asyncio.run(admission.admit_video(user, count=6))
+
+
+def test_admits_a_burst_after_an_idle_period(job_queue: InMemoryVideoJobQueue, user: User) -> None:
+    # Nothing finished lately because nothing was queued, not because the workers are stuck.
+    _queue_videos(job_queue, user, 3)
+    admission = AdmissionControl(
+        job_queue, _FixedQueueMetrics(slots=4, busy_slots=3), max_queue_wait=300, rate_window=60
+    )
+
+    asyncio.run(admission.admit_video(user))
+
+
+def test_admits_while_the_workers_are_busy_with_long_videos(
+    job_queue: InMemoryVideoJobQueue, user: User
+) -> None:
+    _queue_videos(job_queue, user, 2)
+    admission = AdmissionControl(
+        job_queue, _FixedQueueMetrics(slots=4, busy_slots=4), max_queue_wait=300, rate_window=60
+    )
+
+    asyncio.run(admission.admit_video(user))
+
+
+def test_refuses_a_saturated_queue_that_is_not_drained(
+    job_queue: InMemoryVideoJobQueue, user: User
+) -> None:
+    _queue_videos(job_queue, user, 4)
+    admission = AdmissionControl(
+        job_queue, _FixedQueueMetrics(slots=4, busy_slots=4), max_queue_wait=300, rate_window=60
+    )
+
+    with pytest.raises(ServiceOverloadedError) as error:
+        asyncio.run(admission.admit_video(user))
+
+    assert error.value.retry_after == 60
+
+
+def test_admits_into_an_empty_queue_without_throughput(
+    job_queue: InMemoryVideoJobQueue, user: User
+) -> None:
+    admission = AdmissionControl(job_queue, max_queue_wait=300)
+
+    asyncio.run(admission.admit_video(user))
+
+
+def test_refuses_a_user_with_too_many_queued_videos(
+    job_queue: InMemoryVideoJobQueue, user: User
+) -> None:
+    _queue_videos(job_queue, user, 2)
+    admission = AdmissionControl(job_queue, max_queued_per_user=3)
+
+    asyncio.run(admission.admit_video(user))
+    with pytest.raises(TooManyQueuedVideosError):
+        asyncio.run(admission.admit_video(user, count=2))
@@ -0,0 +1,21 @@
+import pytest
+
+from src.application.error import InvalidVideoUploadError
+from src.application.use_cases.video.storage_keys import processed_file_key, source_file_key
+
+
+def test_source_file_key_keeps_only_the_file_name() -> None:
+    assert source_file_key("id", "../../etc/passwd") == "videos/id/source/passwd"
+    assert source_file_key("id", "C:\\Videos\\clip.mp4") == "videos/id/source/clip.mp4"
+
+
+@pytest.mark.parametrize("filename", ["", ".", "..", "/"])
+def test_source_file_key_rejects_names_without_a_file(filename: str) -> None:
+    with pytest.raises(InvalidVideoUploadError):
+        source_file_key("id", filename)
+
+
+def test_source_file_cannot_overwrite_the_frames_archive() -> None:
+    archive_name = processed_file_key("id").rsplit("/", 1)[-1]
+
+    assert source_file_key("id", archive_name) != processed_file_key("id")
@@ -0,0 +1,194 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from src.application.interfaces import (
+    IFileStorage,
+    IFrameExtractor,
+    IMediaProber,
+    IProcessingResultIndex,
+    IVideoProgressChannel,
+    ProcessingStage,
+    VideoProgress,
+)
+from src.application.use_cases.video.deduplicate.deduplicate_video_uc import DeduplicateVideoUC
+from src.application.use_cases.video.process.dto import VideoProcessedDTO
+from src.application.use_cases.video.process.process_video_uc import ProcessVideoUC
+from src.application.worker.worker import _consume, _Slots
+from src.domain.video import Video, VideoStatus
+from src.domain.video.repository import IVideoRepository
+from src.infra.error import StorageError
+from tests.fakes import InMemoryVideoJobQueue
+
+
+class _FlakyJobQueue(InMemoryVideoJobQueue):
+    """A queue whose first claims fail, like a database that is briefly unreachable."""
+
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+        self.claims = 0
+
+    async def claim(self) -> Video | None:
+        self.claims += 1
+        if self.claims <= self.failures:
+            raise ConnectionError
+        return await super().claim()
+
+
+class _RenewalCountingJobQueue(InMemoryVideoJobQueue):
+    """A queue that counts the renewals of the leases."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.renewals = 0
+
+    async def renew(self, video: Video) -> bool:
+        self.renewals += 1
+        return await super().renew(video)
+
+
+class _SlowFileStorage:
+    """Stands in for IFileStorage, taking its time to download a source file it lacks."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def open_local(
+        self,
+        file_name: str,  # noqa: ARG002
+        temp_dir: str | Path | None = None,  # noqa: ARG002
+    ) -> Path:
+        time.sleep(self.seconds)
+        raise StorageError(message="Arquivo nao encontrado")
+
+
+class _StoppingProgressChannel:
+    """Stands in for IVideoProgressChannel, stopping the worker once a video failed."""
+
+    def __init__(self, stop: asyncio.Event) -> None:
+        self.stop = stop
+
+    async def publish(self, progress: VideoProgress) -> None:
+        if progress.stage == ProcessingStage.FAILED:
+            self.stop.set()
+
+
+class _StubProcessVideo:
+    """Stands in for ProcessVideoUC, stopping the worker once a video is processed."""
+
+    def __init__(self, job_queue: InMemoryVideoJobQueue, stop: asyncio.Event) -> None:
+        self.job_queue = job_queue
+        self.stop = stop
+
+    async def process(self, video: Video) -> VideoProcessedDTO:
+        await self.job_queue.complete(video, "frames.zip")
+        self.stop.set()
+        return VideoProcessedDTO(
+            video_id=str(video.external_id),
+            status=video.status,
+            frames=1,
+            frames_per_second=1.0,
+        )
+
+
+class _LeaseLosingProcessVideo:
+    """Stands in for ProcessVideoUC, losing the lease of the video it processes."""
+
+    def __init__(self, job_queue: InMemoryVideoJobQueue, stop: asyncio.Event) -> None:
+        self.job_queue = job_queue
+        self.stop = stop
+        self.cancelled = False
+
+    async def process(self, video: Video) -> VideoProcessedDTO:
+        # Another worker took the video over after the lease expired.
+        self.job_queue.stored(video).worker_id = "another-worker"
+        self.stop.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        pytest.fail("the processing was not cancelled")
+
+
+def _run_consumer(
+    job_queue: InMemoryVideoJobQueue, process_video: object, stop: asyncio.Event, slots: _Slots
+) -> None:
+    consumer = _consume(job_queue, cast(ProcessVideoUC, process_video), slots, 0.001, 0.01, stop)
+    asyncio.run(asyncio.wait_for(consumer, timeout=5))
+
+
+def test_consumer_survives_failed_claims(uploaded_video: Video) -> None:
+    job_queue = _FlakyJobQueue(failures=3)
+    asyncio.run(job_queue.enqueue(uploaded_video))
+    stop = asyncio.Event()
+    slots = _Slots(total=1)
+
+    _run_consumer(job_queue, _StubProcessVideo(job_queue, stop), stop, slots)
+
+    assert job_queue.claims == 4
+    assert job_queue.stored(uploaded_video).status == VideoStatus.DONE
+    assert slots.busy == 0
+
+
+def test_consumer_backs_off_after_failed_claims() -> None:
+    job_queue = _FlakyJobQueue(failures=1_000)
+    slots = _Slots(total=1)
+
+    async def run_for(seconds: float) -> None:
+        stop = asyncio.Event()
+        # Every claim fails, so no video ever reaches the processing.
+        process_video = cast(ProcessVideoUC, None)
+        consumer = asyncio.ensure_future(
+            _consume(job_queue, process_video, slots, 0.01, 0.01, stop)
+        )
+        await asyncio.sleep(seconds)
+        stop.set()
+        await asyncio.wait_for(consumer, timeout=1)
+
+    # Waits of 0.02, 0.04, 0.08 and 0.16 seconds fit in 0.35 seconds, not 0.01 each.
+    asyncio.run(run_for(0.35))
+
+    assert 3 <= job_queue.claims <= 6
+
+
+def test_consumer_drops_a_video_whose_lease_was_lost(uploaded_video: Video) -> None:
+    job_queue = InMemoryVideoJobQueue()
+    asyncio.run(job_queue.enqueue(uploaded_video))
+    stop = asyncio.Event()
+    slots = _Slots(total=1)
+    process_video = _LeaseLosingProcessVideo(job_queue, stop)
+
+    _run_consumer(job_queue, process_video, stop, slots)
+
+    assert process_video.cancelled
+    assert job_queue.stored(uploaded_video).status == VideoStatus.PROCESSING
+    assert slots.busy == 0
+
+
+def test_consumer_renews_the_lease_while_the_source_downloads(uploaded_video: Video) -> None:
+    job_queue = _RenewalCountingJobQueue()
+    asyncio.run(job_queue.enqueue(uploaded_video))
+    stop = asyncio.Event()
+    slots = _Slots(total=1)
+    process_video = ProcessVideoUC(
+        job_queue=job_queue,
+        video_repo=cast(IVideoRepository, None),
+        file_storage=cast(IFileStorage, _SlowFileStorage(seconds=0.3)),
+        frame_extractor=cast(IFrameExtractor, None),
+        media_prober=cast(IMediaProber, None),
+        deduplicate_video=cast(DeduplicateVideoUC, None),
+        result_index=cast(IProcessingResultIndex, None),
+        progress_channel=cast(IVideoProgressChannel, _StoppingProgressChannel(stop)),
+    )
+
+    consumer = _consume(job_queue, process_video, slots, 0.001, 0.02, stop)
+    asyncio.run(asyncio.wait_for(consumer, timeout=5))
+
+    # A download blocking the event loop would leave no room for any heartbeat.
+    assert job_queue.renewals >= 5
+    assert job_queue.stored(uploaded_video).status == VideoStatus.FAILED
@@ -0,0 +1,4 @@
+"""Benchmarks, run one at a time with `make benchmark name=<module>`.
+
+They are not collected by pytest: each module is a script that prints its results.
+"""
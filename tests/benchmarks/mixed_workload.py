@@ -0,0 +1,163 @@
+"""Queue waits of small users while another user uploads in bulk, FIFO against fair.
+
+A simulation in virtual time: at time zero one user queues `--bulk-videos` videos,
+while each of `--small-users` users queues a video every `--small-interval` seconds.
+`--workers` workers claim the videos, each taking `--service-seconds` to process.
+
+The same workload runs against the in-memory queue of the tests, which serves the
+videos in the order they were queued, and against `BeanieVideoJobQueue`, which shares
+the workers fairly between users. The latter uses the MongoDB of the application
+settings, in a database of its own named `<DB_NAME>_benchmark` and dropped at the end.
+
+    python -m tests.benchmarks.mixed_workload --bulk-videos 500 --workers 8
+"""
+
+import argparse
+import asyncio
+import heapq
+import itertools
+import statistics
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from src.application.interfaces import IVideoJobQueue
+from src.config.settings import settings
+from src.domain.__shared.value_objects import EmailAddress
+from src.domain.user import User
+from src.domain.video import Video, VideoStatus
+from src.infra.database.beanie.repositories.beanie_user_repository import BeanieUserRepository
+from src.infra.database.beanie.repositories.beanie_video_job_queue import BeanieVideoJobQueue
+from src.infra.database.beanie.repositories.beanie_video_repository import (
+    BeanieVideoRepository,
+)
+from src.infra.database.beanie.setup import initialize_database
+from tests.fakes import InMemoryVideoJobQueue
+
+_BULK_USER = "bulk"
+
+
+def _arrivals(args: argparse.Namespace) -> List[Tuple[float, str]]:
+    """The times at which each user queues a video, in order."""
+    arrivals = [(0.0, _BULK_USER)] * args.bulk_videos
+    for user, index in itertools.product(range(args.small_users), range(args.small_videos)):
+        offset = user * args.small_interval / args.small_users
+        arrivals.append((index * args.small_interval + offset, f"small-{user}"))
+    return sorted(arrivals)
+
+
+def _user(name: str) -> User:
+    return User(
+        username=name,
+        email=EmailAddress(address=f"{name}@example.com"),
+        hashed_password="benchmark",  # noqa: S106
+    )
+
+
+def _video(user: User, index: int) -> Video:
+    return Video(
+        user=user,
+        filename=f"videos/{index}/source/video.mp4",
+        status=VideoStatus.PENDING_UPLOAD,
+        processed_file=None,
+    )
+
+
+async def _simulate(
+    job_queue: IVideoJobQueue,
+    arrivals: List[Tuple[float, Video]],
+    workers: int,
+    service_seconds: float,
+) -> Dict[str, List[float]]:
+    """Runs the workload in virtual time and returns the queue waits by user name."""
+    queued_at: Dict[str, float] = {}
+    waits: Dict[str, List[float]] = defaultdict(list)
+    processing: List[Tuple[float, int, Video]] = []
+    order = itertools.count()
+    free_workers = workers
+    pending = iter(arrivals)
+    arrival = next(pending, None)
+
+    while arrival or processing:
+        # The clock jumps to the next video queued or the next video processed.
+        next_times = [processing[0][0]] if processing else []
+        if arrival:
+            next_times.append(arrival[0])
+        now = min(next_times)
+        while processing and processing[0][0] <= now:
+            await job_queue.complete(heapq.heappop(processing)[2], "frames.zip")
+            free_workers += 1
+        while arrival and arrival[0] <= now:
+            queued_at[str(arrival[1].external_id)] = arrival[0]
+            await job_queue.enqueue(arrival[1])
+            arrival = next(pending, None)
+        while free_workers and (video := await job_queue.claim()):
+            waits[video.user.username].append(now - queued_at[str(video.external_id)])
+            heapq.heappush(processing, (now + service_seconds, next(order), video))
+            free_workers -= 1
+
+    return waits
+
+
+async def _fifo_waits(args: argparse.Namespace) -> Dict[str, List[float]]:
+    schedule = _arrivals(args)
+    users = {name: _user(name) for name in dict.fromkeys(name for _, name in schedule)}
+    arrivals = [(time, _video(users[name], index)) for index, (time, name) in enumerate(schedule)]
+    return await _simulate(InMemoryVideoJobQueue(), arrivals, args.workers, args.service_seconds)
+
+
+async def _beanie_waits(args: argparse.Namespace) -> Dict[str, List[float]]:
+    """Runs the workload against `BeanieVideoJobQueue`, once Beanie is initialized."""
+    user_repo, video_repo = BeanieUserRepository(), BeanieVideoRepository()
+    schedule = _arrivals(args)
+    users = {
+        name: await user_repo.insert(_user(name))
+        for name in dict.fromkeys(name for _, name in schedule)
+    }
+    arrivals = [
+        (time, await video_repo.insert(_video(users[name], index)))
+        for index, (time, name) in enumerate(schedule)
+    ]
+    job_queue = BeanieVideoJobQueue(max_processing_per_user=args.max_processing_per_user)
+    return await _simulate(job_queue, arrivals, args.workers, args.service_seconds)
+
+
+async def _fair_waits(args: argparse.Namespace) -> Dict[str, List[float]]:
+    db_name = f"{settings.DB_NAME}_benchmark"
+    async with initialize_database(settings.DB_URI, db_name) as client:
+        try:
+            return await _beanie_waits(args)
+        finally:
+            await client.drop_database(db_name)
+
+
+def _report(queue: str, waits: Dict[str, List[float]]) -> None:
+    small = [
+        wait for user, user_waits in waits.items() if user != _BULK_USER for wait in user_waits
+    ]
+    for group, group_waits in (("small users", small), ("bulk user", waits[_BULK_USER])):
+        percentiles = statistics.quantiles(group_waits, n=100, method="inclusive")
+        sys.stdout.write(
+            f"{queue:>4} {group:>11}: {len(group_waits)} videos, "
+            f"p50 wait {percentiles[49]:.0f} s, p99 wait {percentiles[98]:.0f} s\n"
+        )
+
+
+def main() -> None:
+    """Prints the queue waits of the bulk and small users with both queues."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bulk-videos", type=int, default=500)
+    parser.add_argument("--small-users", type=int, default=5)
+    parser.add_argument("--small-videos", type=int, default=10, help="videos per small user")
+    parser.add_argument("--small-interval", type=float, default=60.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--service-seconds", type=float, default=30.0)
+    parser.add_argument("--max-processing-per-user", type=int, default=None)
+    args = parser.parse_args()
+
+    _report("fifo", asyncio.run(_fifo_waits(args)))
+    _report("fair", asyncio.run(_fair_waits(args)))
+
+
+if __name__ == "__main__":
+    main()
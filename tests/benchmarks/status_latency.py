@@ -0,0 +1,119 @@
+"""Latency of `/status` while uploads are running, with blocking and executor storages.
+
+The uploads go to a storage that sleeps for `--transfer-seconds` on every file, like a
+slow S3 transfer. With `blocking`, the route calls that storage from the event loop;
+with `executor`, it goes through `ExecutorFileStorage`, as the upload use cases do.
+Like the API, it reads the application settings from the environment or `.env`.
+
+    python -m tests.benchmarks.status_latency --uploads 8 --seconds 10
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+from src.application.api.routers import health_check_route
+from src.infra.executor_file_storage import ExecutorFileStorage
+from src.infra.filesystem_file_storage import FileSystemFileStorage
+
+
+class _SlowFileStorage(FileSystemFileStorage):
+    """A local storage whose uploads take as long as a slow network transfer."""
+
+    def __init__(self, root: str, transfer_seconds: float) -> None:
+        super().__init__(root)
+        self.transfer_seconds = transfer_seconds
+
+    def upload_file(self, file_name: str, file_data: bytes) -> None:
+        time.sleep(self.transfer_seconds)
+        super().upload_file(file_name, file_data)
+
+
+def _app(storage: _SlowFileStorage, workers: int) -> FastAPI:
+    app = FastAPI()
+    app.include_router(health_check_route.router)
+    async_storage = ExecutorFileStorage(storage, ThreadPoolExecutor(workers))
+
+    @app.post("/blocking/{name}")
+    async def upload_blocking(name: str, request: Request) -> None:
+        storage.upload_file(name, await request.body())
+
+    @app.post("/executor/{name}")
+    async def upload_executor(name: str, request: Request) -> None:
+        await async_storage.upload_file(name, await request.body())
+
+    return app
+
+
+def _upload_until(url: str, data: bytes, deadline: float) -> None:
+    while time.monotonic() < deadline:
+        urllib.request.urlopen(urllib.request.Request(url, data=data)).read()  # noqa: S310
+
+
+def _status_latencies(url: str, deadline: float, interval: float) -> List[float]:
+    latencies = []
+    while time.monotonic() < deadline:
+        started_at = time.perf_counter()
+        urllib.request.urlopen(url).read()  # noqa: S310
+        latencies.append(time.perf_counter() - started_at)
+        time.sleep(interval)
+    return latencies
+
+
+def _measure(base_url: str, mode: str, args: argparse.Namespace) -> List[float]:
+    data = b"\0" * args.upload_bytes
+    deadline = time.monotonic() + args.seconds
+    with ThreadPoolExecutor(args.uploads) as uploaders:
+        for index in range(args.uploads):
+            uploaders.submit(_upload_until, f"{base_url}/{mode}/{index}", data, deadline)
+        return _status_latencies(f"{base_url}/status", deadline, args.status_interval)
+
+
+def _percentile(values: List[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def main() -> None:
+    """Runs both modes against a local server and prints the `/status` percentiles."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=8, help="concurrent uploads")
+    parser.add_argument("--upload-bytes", type=int, default=1024 * 1024)
+    parser.add_argument("--transfer-seconds", type=float, default=0.2)
+    parser.add_argument("--storage-workers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10.0, help="duration of each mode")
+    parser.add_argument("--status-interval", type=float, default=0.01)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        app = _app(_SlowFileStorage(root, args.transfer_seconds), args.storage_workers)
+        server = uvicorn.Server(uvicorn.Config(app, port=args.port, log_level="warning"))
+        thread = threading.Thread(target=server.run)
+        thread.start()
+        while not server.started:
+            time.sleep(0.01)
+
+        try:
+            for mode in ("blocking", "executor"):
+                latencies = _measure(f"http://127.0.0.1:{args.port}", mode, args)
+                sys.stdout.write(
+                    f"{mode:>8}: {len(latencies)} requests, "
+                    f"p50 {_percentile(latencies, 50) * 1000:.1f} ms, "
+                    f"p99 {_percentile(latencies, 99) * 1000:.1f} ms\n"
+                )
+        finally:
+            server.should_exit = True
+            thread.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Throughput of `S3FileStorage` downloads by size of the connection pool.
+
+Many threads download a small object at once, as the storage executor and the ranged
+downloads do, through clients built like those of `ExternalServiceModule` with each
+pool size. Point it at a local S3 stand-in, such as MinIO or `moto_server`:
+
+    AWS_ENDPOINT_URL_S3=http://127.0.0.1:9000 python -m tests.benchmarks.storage_pool_throughput
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import botocore.session
+from botocore.config import Config
+
+from src.infra.s3_file_storage import S3FileStorage
+
+_KEY = "benchmarks/object"
+
+
+def _storage(bucket: str, region: str, pool_size: int) -> S3FileStorage:
+    return S3FileStorage(
+        bucket_name=bucket,
+        region_name=region,
+        session=boto3.Session(botocore_session=botocore.session.get_session()),
+        client_config=Config(max_pool_connections=pool_size, retries={"mode": "adaptive"}),
+    )
+
+
+def _requests_per_second(storage: S3FileStorage, threads: int, seconds: float) -> float:
+    counts = [0] * threads
+    deadline = time.monotonic() + seconds
+    start = threading.Barrier(threads)
+
+    def download(index: int) -> None:
+        start.wait()
+        while time.monotonic() < deadline:
+            storage.download_file(_KEY)
+            counts[index] += 1
+
+    with ThreadPoolExecutor(threads) as executor:
+        for future in [executor.submit(download, index) for index in range(threads)]:
+            future.result()
+    return sum(counts) / seconds
+
+
+def main() -> None:
+    """Prints the downloads per second reached with each pool size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bucket", default="benchmarks")
+    parser.add_argument("--region", default="us-east-1")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[4, 10, 32, 64])
+    parser.add_argument("--threads", type=int, default=64, help="concurrent downloads")
+    parser.add_argument("--object-bytes", type=int, default=64 * 1024)
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration of each size")
+    args = parser.parse_args()
+
+    # A full pool discards the extra connections with a warning on every request.
+    logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)
+
+    storage = _storage(args.bucket, args.region, pool_size=1)
+    if args.bucket not in {
+        bucket["Name"] for bucket in storage.s3_client.list_buckets()["Buckets"]
+    }:
+        storage.s3_client.create_bucket(Bucket=args.bucket)
+    storage.upload_file(_KEY, b"\0" * args.object_bytes)
+
+    for pool_size in args.pool_sizes:
+        storage = _storage(args.bucket, args.region, pool_size)
+        throughput = _requests_per_second(storage, args.threads, args.seconds)
+        sys.stdout.write(f"pool {pool_size:>4}: {throughput:.0f} downloads/s\n")
+
+
+if __name__ == "__main__":
+    main()
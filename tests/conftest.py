@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from src.domain.__shared.value_objects import EmailAddress
+from src.domain.user import User
+from src.domain.video import Video, VideoStatus
+from tests.fakes import InMemoryVideoJobQueue
+
+# The settings are read when the application modules are first imported.
+for name, value in {
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+    "AWS_REGION": "us-east-1",
+    "S3_BUCKET_NAME": "test",
+    "DB_URI": "mongodb://localhost:27017",
+    "DB_NAME": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture
+def user() -> User:
+    return User(
+        username="tester",
+        email=EmailAddress(address="tester@example.com"),
+        hashed_password="hashed",  # noqa: S106
+    )
+
+
+@pytest.fixture
+def uploaded_video(user: User) -> Video:
+    return Video(
+        user=user,
+        filename="videos/test/source/video.mp4",
+        status=VideoStatus.PENDING_UPLOAD,
+        processed_file=None,
+    )
+
+
+@pytest.fixture
+def job_queue() -> InMemoryVideoJobQueue:
+    return InMemoryVideoJobQueue()
@@ -0,0 +1,3 @@
+from .in_memory_video_job_queue import InMemoryVideoJobQueue
+
+__all__ = ["InMemoryVideoJobQueue"]
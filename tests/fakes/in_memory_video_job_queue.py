@@ -0,0 +1,151 @@
+import copy
+import itertools
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Sequence
+
+from src.application.interfaces import IVideoJobQueue, QueueLoad
+from src.domain.user import User
+from src.domain.video import Video, VideoStatus
+
+
+class InMemoryVideoJobQueue(IVideoJobQueue):
+    """Implementation of IVideoJobQueue in memory, for tests.
+
+    It keeps its own copy of every video it was given, like the database does, so a
+    worker holding a stale copy fails to renew or finish it the same way. Queued videos
+    are claimed by priority class, then in the order they were queued.
+
+    Args:
+        lease_seconds: For how long a claim or a renewal holds a video.
+        max_attempts: How many times a video is claimed before an expired lease fails
+            it instead of putting it back in the queue.
+    """
+
+    def __init__(self, lease_seconds: float = 60.0, max_attempts: int = 3) -> None:
+        self.lease = timedelta(seconds=lease_seconds)
+        self.max_attempts = max_attempts
+        self.videos: Dict[str, Video] = {}
+        self.attempts: Counter[str] = Counter()
+        self._queue_tags: Dict[str, int] = {}
+        self._finished_at: Dict[str, datetime] = {}
+        self._tags = itertools.count()
+
+    def stored(self, video: Video) -> Video:
+        """Returns the copy of a video kept by the queue."""
+        return self.videos[str(video.external_id)]
+
+    async def enqueue(self, video: Video) -> bool:
+        """Queues a video, unless its stored copy changed status meanwhile."""
+        video.check_transition(VideoStatus.QUEUED)
+        stored = self.videos.get(str(video.external_id))
+        if stored and stored.status != video.status:
+            return False
+
+        video.status = VideoStatus.QUEUED
+        video.updated_at = datetime.now()
+        self._store(video)
+        self._queue_tags[str(video.external_id)] = next(self._tags)
+        return True
+
+    async def enqueue_many(self, videos: Sequence[Video]) -> List[bool]:
+        """Queues the videos one after the other."""
+        for video in videos:
+            video.check_transition(VideoStatus.QUEUED)
+        return [await self.enqueue(video) for video in videos]
+
+    async def claim(self) -> Video | None:
+        """Leases the queued video with the highest priority that was queued first."""
+        queued = [video for video in self.videos.values() if video.status == VideoStatus.QUEUED]
+        if not queued:
+            return None
+
+        video = min(
+            queued,
+            key=lambda v: (-v.priority.rank, self._queue_tags[str(v.external_id)]),
+        )
+        video.status = VideoStatus.PROCESSING
+        video.worker_id = uuid.uuid4().hex
+        video.lease_expires_at = datetime.now() + self.lease
+        self.attempts[str(video.external_id)] += 1
+        return copy.copy(video)
+
+    async def renew(self, video: Video) -> bool:
+        """Extends the lease, if the video is still processing under the same worker id."""
+        stored = self._leased(video)
+        if not stored:
+            return False
+
+        stored.lease_expires_at = video.lease_expires_at = datetime.now() + self.lease
+        return True
+
+    async def reclaim_expired(self) -> int:
+        """Fails the expired videos out of attempts and queues the others again."""
+        now = datetime.now()
+        requeued = 0
+        for key, video in self.videos.items():
+            if video.status != VideoStatus.PROCESSING or (
+                video.lease_expires_at and video.lease_expires_at >= now
+            ):
+                continue
+
+            video.worker_id = video.lease_expires_at = None
+            if self.attempts[key] >= self.max_attempts:
+                video.status = VideoStatus.FAILED
+                self._finished_at[key] = now
+            else:
+                video.status = VideoStatus.QUEUED
+                requeued += 1
+        return requeued
+
+    async def get_load(self, since: datetime) -> QueueLoad:
+        """Counts the queued videos and those finished after `since`."""
+        return QueueLoad(
+            queued=sum(video.status == VideoStatus.QUEUED for video in self.videos.values()),
+            finished=sum(finished_at >= since for finished_at in self._finished_at.values()),
+        )
+
+    async def count_queued(self, user: User) -> int:
+        """Counts the queued videos of a user."""
+        return sum(
+            video.status == VideoStatus.QUEUED and video.user.external_id == user.external_id
+            for video in self.videos.values()
+        )
+
+    async def complete(self, video: Video, processed_file: str) -> bool:
+        """Marks a video that is still processing under its lease as done."""
+        video.processed_file = processed_file
+        return self._finish(video, VideoStatus.DONE)
+
+    async def fail(self, video: Video) -> bool:
+        """Marks a video that is still processing under its lease as failed."""
+        return self._finish(video, VideoStatus.FAILED)
+
+    def _store(self, video: Video) -> None:
+        self.videos[str(video.external_id)] = copy.copy(video)
+
+    def _leased(self, video: Video) -> Video | None:
+        stored = self.videos.get(str(video.external_id))
+        if (
+            not stored
+            or stored.status != VideoStatus.PROCESSING
+            or stored.worker_id != video.worker_id
+        ):
+            return None
+        return stored
+
+    def _finish(self, video: Video, status: VideoStatus) -> bool:
+        video.check_transition(status)
+        if not self._leased(video):
+            return False
+
+        video.status = status
+        video.worker_id = video.lease_expires_at = None
+        video.updated_at = datetime.now()
+        self._store(video)
+        self._finished_at[str(video.external_id)] = video.updated_at
+        return True
+
+
+__all__ = ["InMemoryVideoJobQueue"]
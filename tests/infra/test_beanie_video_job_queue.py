@@ -0,0 +1,117 @@
+import itertools
+from typing import Dict, List
+
+import pymongo
+from bson import ObjectId
+
+from src.domain.__shared.value_objects import EmailAddress, UniqueEntityId
+from src.domain.user import User
+from src.domain.video import Video, VideoPriority, VideoStatus
+from src.infra.database.beanie.repositories.beanie_video_job_queue import (
+    _CLAIM_ORDER,
+    BeanieVideoJobQueue,
+)
+
+
+class _SimulatedQueue:
+    """Queued videos claimed in the order of the collection, with the tags of the queue.
+
+    It stands in for the queries of `_start_tags`: the virtual time is the tag of the
+    first queued video, or of the last video ever queued, and each user keeps the tag
+    of their last video.
+    """
+
+    def __init__(self, job_queue: BeanieVideoJobQueue) -> None:
+        self.job_queue = job_queue
+        self.queued: List[Dict[str, object]] = []
+        self.last_tags: Dict[str, float] = {}
+        self._created_at = itertools.count()
+
+    def enqueue(self, videos: List[Video]) -> None:
+        if self.queued:
+            virtual_time = min(float(document["queue_tag"]) for document in self.queued)
+        else:
+            virtual_time = max(self.last_tags.values(), default=0.0)
+        last_tags = {str(video.user.id): self.last_tags.get(str(video.user.id)) for video in videos}
+
+        for video, queue_tag in zip(
+            videos, self.job_queue._next_tags(videos, virtual_time, last_tags), strict=True
+        ):
+            self.last_tags[str(video.user.id)] = queue_tag
+            self.queued.append({
+                "priority_rank": video.priority.rank,
+                "queue_tag": queue_tag,
+                "created_at": next(self._created_at),
+                "user": video.user.username,
+            })
+
+    def claim(self) -> str:
+        """Removes the first video in the claim order and returns the name of its user."""
+        self.queued.sort(
+            key=lambda document: tuple(
+                value if direction == pymongo.ASCENDING else -value
+                for field, direction in _CLAIM_ORDER
+                for value in [document[field]]
+            )
+        )
+        return str(self.queued.pop(0)["user"])
+
+
+def _user(name: str) -> User:
+    return User(
+        _id=UniqueEntityId(id=str(ObjectId())),
+        username=name,
+        email=EmailAddress(address=f"{name}@example.com"),
+        hashed_password="hashed",  # noqa: S106
+    )
+
+
+def _videos(user: User, count: int, priority: VideoPriority = VideoPriority.NORMAL) -> List[Video]:
+    return [
+        Video(
+            user=user,
+            filename=f"videos/{index}/source/video.mp4",
+            status=VideoStatus.PENDING_UPLOAD,
+            processed_file=None,
+            priority=priority,
+        )
+        for index in range(count)
+    ]
+
+
+def test_a_heavy_user_cannot_starve_a_light_one() -> None:
+    queue = _SimulatedQueue(BeanieVideoJobQueue())
+    heavy, light = _user("heavy"), _user("light")
+    queue.enqueue(_videos(heavy, 500))
+
+    for _ in range(20):
+        for _ in range(5):
+            assert queue.claim() == "heavy"
+        queue.enqueue(_videos(light, 1))
+
+        # The light video is next to the heavy one starting at the same virtual time.
+        assert "light" in {queue.claim(), queue.claim()}
+
+
+def test_users_share_the_workers_by_weight() -> None:
+    heavy, light = _user("heavy"), _user("light")
+    queue = _SimulatedQueue(BeanieVideoJobQueue(user_weights={str(heavy.external_id): 3.0}))
+    queue.enqueue(_videos(heavy, 100))
+    queue.enqueue(_videos(light, 100))
+
+    claimed = [queue.claim() for _ in range(40)]
+
+    assert claimed.count("heavy") == 30
+    assert claimed.count("light") == 10
+
+
+def test_a_higher_priority_class_is_claimed_first() -> None:
+    queue = _SimulatedQueue(BeanieVideoJobQueue())
+    queue.enqueue(_videos(_user("heavy"), 10))
+    queue.enqueue(_videos(_user("background"), 1, VideoPriority.LOW))
+    queue.enqueue(_videos(_user("urgent"), 1, VideoPriority.HIGH))
+
+    claimed = [queue.claim() for _ in range(12)]
+
+    assert claimed[0] == "urgent"
+    assert claimed[-1] == "background"
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from src.infra.filesystem_file_storage import FileSystemFileStorage
+
+
+def test_list_parts_reads_the_recorded_etags_without_hashing_the_parts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = FileSystemFileStorage(tmp_path)
+    upload_id = storage.create_multipart_upload("video.mp4")
+    uploaded = [
+        storage.upload_part("video.mp4", upload_id, number, bytes([number]) * (number * 100))
+        for number in (2, 10, 1)
+    ]
+
+    def hash_part(_data: bytes) -> str:
+        pytest.fail("list_parts must not hash the stored parts")
+
+    monkeypatch.setattr(FileSystemFileStorage, "_etag", staticmethod(hash_part))
+
+    parts = storage.list_parts("video.mp4", upload_id)
+
+    assert parts == sorted(uploaded, key=lambda part: part.part_number)
+
+
+def test_list_parts_skips_a_part_whose_etag_was_not_recorded(tmp_path: Path) -> None:
+    storage = FileSystemFileStorage(tmp_path)
+    upload_id = storage.create_multipart_upload("video.mp4")
+    first = storage.upload_part("video.mp4", upload_id, 1, b"first")
+    (tmp_path / ".uploads" / upload_id / "2.part").write_bytes(b"interrupted")
+
+    assert storage.list_parts("video.mp4", upload_id) == [first]
+
+
+def test_complete_multipart_upload_joins_the_listed_parts(tmp_path: Path) -> None:
+    storage = FileSystemFileStorage(tmp_path)
+    upload_id = storage.create_multipart_upload("video.mp4")
+    storage.upload_part("video.mp4", upload_id, 2, b"world")
+    storage.upload_part("video.mp4", upload_id, 1, b"hello ")
+
+    storage.complete_multipart_upload(
+        "video.mp4", upload_id, storage.list_parts("video.mp4", upload_id)
+    )
+
+    assert (tmp_path / "video.mp4").read_bytes() == b"hello world"
@@ -0,0 +1,30 @@
+from src.infra.pyav_frame_extractor import PyAVFrameExtractor
+
+
+def test_segments_start_at_the_first_bucket_after_a_keyframe() -> None:
+    extractor = PyAVFrameExtractor(segment_seconds=10)
+    keyframes = [0.0, 4.2, 9.1, 12.0, 21.5, 30.0]
+
+    segments = extractor._segments(35.0, 1.0, keyframes)
+
+    assert segments == [(0, 10), (10, 22), (22, 30), (30, None)]
+
+
+def test_segments_without_keyframes_are_cut_every_segment_seconds() -> None:
+    extractor = PyAVFrameExtractor(segment_seconds=10)
+
+    assert extractor._segments(25.0, 1.0, ()) == [(0, 10), (10, 20), (20, None)]
+
+
+def test_segments_never_sample_more_than_64_frames() -> None:
+    extractor = PyAVFrameExtractor(segment_seconds=600)
+
+    segments = extractor._segments(200.0, 1.0, [0.0, 50.0, 150.0])
+
+    assert segments == [(0, 50), (50, 114), (114, 150), (150, None)]
+
+
+def test_a_video_without_duration_is_a_single_segment() -> None:
+    extractor = PyAVFrameExtractor()
+
+    assert extractor._segments(None, 1.0, [0.0, 10.0]) == [(0, None)]
@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple, cast
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from src.infra.error import StorageError
+from src.infra.s3_file_storage import S3FileStorage
+
+_ETAG = '"etag"'
+
+
+class _StubBody:
+    """A response body that yields its bytes in small chunks, optionally slowly."""
+
+    def __init__(self, data: bytes, delay: float) -> None:
+        self.data = data
+        self.delay = delay
+        self.closed = False
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:  # noqa: ARG002
+        for start in range(0, len(self.data), 4):
+            time.sleep(self.delay)
+            yield self.data[start : start + 4]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _StubS3Client:
+    """Serves a single object, failing the ranges that start at `failing_starts`."""
+
+    def __init__(
+        self, data: bytes, failing_starts: Tuple[int, ...] = (), delay: float = 0.0
+    ) -> None:
+        self.data = data
+        self.failing_starts = failing_starts
+        self.delay = delay
+        self.ranges: List[str] = []
+        self.lock = threading.Lock()
+
+    def head_object(self, **kwargs: str) -> Dict[str, object]:  # noqa: ARG002
+        return {"ContentLength": len(self.data), "ETag": _ETAG}
+
+    def get_object(
+        self,
+        *,
+        Range: str,  # noqa: N803
+        IfMatch: str,  # noqa: N803
+        **kwargs: str,  # noqa: ARG002
+    ) -> Dict[str, object]:
+        assert IfMatch == _ETAG
+        with self.lock:
+            self.ranges.append(Range)
+
+        start, end = (int(bound) for bound in Range.removeprefix("bytes=").split("-"))
+        if start in self.failing_starts:
+            raise ClientError({"Error": {"Code": "500", "Message": "Erro"}}, "GetObject")
+        return {"Body": _StubBody(self.data[start : end + 1], self.delay)}
+
+
+class _StubSession:
+    def __init__(self, client: _StubS3Client) -> None:
+        self._client = client
+
+    def client(self, *args: object, **kwargs: object) -> _StubS3Client:  # noqa: ARG002
+        return self._client
+
+
+def _storage(client: _StubS3Client, concurrency: int) -> S3FileStorage:
+    return S3FileStorage(
+        bucket_name="bucket",
+        download_part_size=10,
+        download_concurrency=concurrency,
+        session=cast(boto3.Session, _StubSession(client)),
+    )
+
+
+def test_download_to_path_reassembles_an_object_split_into_uneven_ranges(tmp_path: Path) -> None:
+    data = os.urandom(73)
+    client = _StubS3Client(data)
+    destination = tmp_path / "video.mp4"
+
+    _storage(client, concurrency=3).download_to_path("video.mp4", destination)
+
+    assert destination.read_bytes() == data
+    assert sorted(client.ranges) == sorted(
+        f"bytes={start}-{min(start + 10, 73) - 1}" for start in range(0, 73, 10)
+    )
+
+
+def test_a_failing_range_aborts_the_download_and_removes_the_file(tmp_path: Path) -> None:
+    client = _StubS3Client(os.urandom(200), failing_starts=(10,), delay=0.01)
+    destination = tmp_path / "video.mp4"
+
+    with pytest.raises(StorageError):
+        _storage(client, concurrency=2).download_to_path("video.mp4", destination)
+
+    assert not destination.exists()
+    assert len(client.ranges) < 20